@@ -0,0 +1,83 @@
+"""
+Compare ASCII and binary DXF as the intermediate format of a translation.
+
+    python bench_dxf.py <folder with DWG files> [--repeat 3]
+
+For every DWG it measures both legs of the round trip: ODA DWG → DXF/DXB,
+file size, ``ezdxf.readfile`` parse time, ``doc.saveas`` time and ODA
+DXF → DWG. Nothing is translated; work files go to a temp folder.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import ezdxf
+
+from functions.dxf_format import save_dxf
+from functions.oda_runner import convert_file
+
+
+def _timed(func, repeat=1):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times)
+
+
+def bench_drawing(dwg_path, work_dir, repeat):
+    row = {"file": dwg_path.name, "dwg_mb": dwg_path.stat().st_size / 2**20}
+    for label, fmt, binary in (("ascii", "DXF", False), ("binary", "DXB", True)):
+        folder = work_dir / label
+        folder.mkdir()
+        dxf, row[f"{label}_oda_in"] = _timed(lambda: convert_file(dwg_path, folder, fmt))
+        row[f"{label}_mb"] = dxf.stat().st_size / 2**20
+        doc, row[f"{label}_read"] = _timed(lambda: ezdxf.readfile(str(dxf)), repeat)
+
+        saved = folder / f"{dwg_path.stem}_saved.dxf"
+        _, row[f"{label}_save"] = _timed(lambda: save_dxf(doc, saved, binary), repeat)
+        _, row[f"{label}_oda_out"] = _timed(lambda: convert_file(saved, folder / "dwg", "DWG"))
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("folder", type=Path)
+    parser.add_argument("--repeat", type=int, default=3, help="runs of the parse/save steps (median is shown)")
+    args = parser.parse_args()
+
+    drawings = sorted(args.folder.glob("*.dwg"), key=lambda p: p.stat().st_size, reverse=True)
+    if not drawings:
+        print(f"❌ No DWG files in {args.folder}")
+        return
+
+    header = f"{'file':<32}{'DWG MB':>8}  {'':6}{'DXF MB':>8}{'ODA in':>9}{'read':>9}{'save':>9}{'ODA out':>9}"
+    print(header)
+    print("─" * len(header))
+    totals = {}
+    for dwg in drawings:
+        with tempfile.TemporaryDirectory() as tmp:
+            row = bench_drawing(dwg, Path(tmp), args.repeat)
+        for label in ("ascii", "binary"):
+            name = row["file"][:30] if label == "ascii" else ""
+            size = f"{row['dwg_mb']:.1f}" if label == "ascii" else ""
+            print(f"{name:<32}{size:>8}  {label:<6}{row[f'{label}_mb']:>8.1f}"
+                  + "".join(f"{row[f'{label}_{step}']:>8.2f}s" for step in ("oda_in", "read", "save", "oda_out")))
+        for key, value in row.items():
+            if key != "file":
+                totals[key] = totals.get(key, 0) + value
+
+    print("─" * len(header))
+    for step, title in (("mb", "size"), ("oda_in", "ODA DWG→DXF"), ("read", "parse"),
+                        ("save", "save"), ("oda_out", "ODA DXF→DWG")):
+        ascii_, binary = totals[f"ascii_{step}"], totals[f"binary_{step}"]
+        saved = (1 - binary / ascii_) * 100 if ascii_ else 0
+        print(f"{title:<14} ascii {ascii_:>9.2f}  binary {binary:>9.2f}  ({saved:.0f}% saved)")
+
+
+if __name__ == "__main__":
+    main()
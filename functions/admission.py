@@ -0,0 +1,158 @@
+import os
+import re
+import threading
+
+from functions.settings import load_settings
+
+# Peak memory of a translation relative to its input: ODA's DXF is several
+# times the DWG, and the parsed ezdxf document several times the DXF.
+BYTES_PER_DWG_BYTE = 24
+BYTES_PER_DXF_BYTE = 5
+# Parsed ezdxf object incl. tags and handle maps, for the $HANDSEED estimate
+BYTES_PER_OBJECT = 2 * 1024
+# Interpreter, Qt and DeepL client overhead of any job
+BASE_JOB_BYTES = 64 * 1024 * 1024
+# Without psutil, and when the budget is 0 ("auto"), use this
+FALLBACK_BUDGET = 4096 * 1024 * 1024
+# How many later jobs may overtake a waiting one before it gets priority
+MAX_OVERTAKES = 10
+# How far the header pre-scan reads into a DXF
+HEADER_SCAN_BYTES = 256 * 1024
+
+_HANDSEED = re.compile(rb"\$HANDSEED\s*\r?\n\s*5\s*\r?\n\s*([0-9A-Fa-f]+)")
+
+
+def header_object_count(path):
+    """
+    Objects in an ASCII DXF from its $HANDSEED (the next free handle), read
+    from the header only. None for DWG / binary DXF or when it is missing.
+    """
+    try:
+        with open(path, "rb") as fh:
+            head = fh.read(HEADER_SCAN_BYTES)
+    except OSError:
+        return None
+    match = _HANDSEED.search(head)
+    return int(match.group(1), 16) if match else None
+
+
+def estimate_job_bytes(path):
+    """Rough peak memory of translating *path*."""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return BASE_JOB_BYTES
+    if str(path).lower().endswith(".dxf"):
+        estimate = size * BYTES_PER_DXF_BYTE
+        objects = header_object_count(path)
+        if objects:
+            estimate = max(estimate, objects * BYTES_PER_OBJECT)
+    else:
+        estimate = size * BYTES_PER_DWG_BYTE
+    return BASE_JOB_BYTES + estimate
+
+
+def process_rss():
+    """Resident memory of this process, or None without psutil."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return None
+
+
+def memory_budget():
+    """``memory_budget_mb`` from settings; 0 means half of the physical memory."""
+    budget_mb = load_settings()["memory_budget_mb"]
+    if budget_mb:
+        return budget_mb * 1024 * 1024
+    try:
+        import psutil
+        return psutil.virtual_memory().total // 2
+    except ImportError:
+        return FALLBACK_BUDGET
+
+
+class AdmissionQueue:
+    """
+    Start jobs only while their estimated peak memory fits the budget.
+
+    ``submit()`` queues a job with its estimate and a start callback;
+    ``release()`` frees its reservation when it ends. Jobs are admitted in
+    order, but a job that does not fit yet is overtaken by smaller ones
+    (at most MAX_OVERTAKES times, then it goes first). The memory in use is
+    the larger of the reservations and the live RSS growth since the queue
+    was last idle, so estimates that were too low still hold jobs back. One
+    job always runs, however large. *start* may be called from any thread
+    that submits, releases or pumps.
+    """
+
+    def __init__(self, budget=None):
+        self.budget = budget or memory_budget()
+        self._baseline = process_rss() or 0
+        self._pending = []      # [key, estimate, start, overtaken]
+        self._running = {}      # key -> estimate
+        self._lock = threading.Lock()
+
+    def in_use(self):
+        reserved = sum(self._running.values())
+        rss = process_rss()
+        return max(reserved, rss - self._baseline) if rss is not None else reserved
+
+    def waiting(self):
+        return len(self._pending)
+
+    def submit(self, key, estimate, start):
+        """Queue a job; returns True if it was started right away."""
+        with self._lock:
+            self._pending.append([key, estimate, start, 0])
+        self.pump()
+        return key in self._running
+
+    def release(self, key):
+        with self._lock:
+            self._running.pop(key, None)
+            if not self._running:
+                # CPython keeps freed memory, so growth counts from what is resident now
+                self._baseline = process_rss() or 0
+        self.pump()
+
+    def cancel(self, key):
+        with self._lock:
+            self._pending = [p for p in self._pending if p[0] is not key]
+
+    def pump(self):
+        """Start every waiting job that fits now (also call it periodically: RSS changes)."""
+        admitted = []
+        with self._lock:
+            free = self.budget - self.in_use()
+            passed_over = []
+            for job in list(self._pending):
+                key, estimate, start, overtaken = job
+                if estimate <= free or not self._running:
+                    self._pending.remove(job)
+                    self._running[key] = estimate
+                    free -= estimate
+                    admitted.append(job)
+                    for waiting in passed_over:
+                        waiting[3] += 1
+                elif overtaken >= MAX_OVERTAKES:
+                    break               # its turn: nothing behind it may start first
+                else:
+                    passed_over.append(job)
+        for _, _, start, _ in admitted:
+            start()
+        return len(admitted)
+
+
+_default_queue = None
+_default_lock = threading.Lock()
+
+
+def default_admission():
+    """The process-wide queue: GUI translations and the hot folder share one budget."""
+    global _default_queue
+    with _default_lock:
+        if _default_queue is None:
+            _default_queue = AdmissionQueue()
+        return _default_queue
@@ -1,34 +1,25 @@
-import subprocess
-import os
-import sys
+from functions.oda_runner import convert_file, ODAConversionError, ODATimeoutError
 
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for PyInstaller and dev """
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return os.path.join(os.path.abspath("."), relative_path)
 
-def convert_dwg_to_dxf(input_file, output_folder):
-    oda_converter = resource_path(os.path.join("ODA", "ODAFileConverter.exe"))
+def convert_dwg_to_dxf(input_file, output_folder, log=None, binary=False):
+    """
+    Convert to ``<stem>.dxf`` in *output_folder*. With *binary* ODA writes
+    binary DXF (smaller, much faster to parse); if ODA rejects it, it falls
+    back to ASCII. A timeout is not retried in another format.
+    """
+    output = None
+    if binary:
+        try:
+            output = convert_file(input_file, output_folder, "DXB", log=log)
+        except ODATimeoutError:
+            raise
+        except ODAConversionError as err:
+            if log:
+                log(f"⚠️ Binary DXF not produced, falling back to ASCII: {err}")
+    if output is None:
+        output = convert_file(input_file, output_folder, "DXF", log=log)
+    elif output.suffix.lower() != ".dxf":
+        output = output.replace(output.with_suffix(".dxf"))   # ezdxf detects binary by content
+    print(f"✅ DWG converted to DXF and saved in: {output_folder}")
+    return output
 
-    if not os.path.exists(input_file):
-        raise FileNotFoundError(f"Input file not found: {input_file}")
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
-
-    input_folder = os.path.dirname(input_file)
-    file_filter = os.path.basename(input_file)
-
-    command = [
-        oda_converter,
-        input_folder,
-        output_folder,
-        "ACAD2018",  # Output version
-        "DXF",       # Format
-        "0",         # No recursion
-        "1",         # Audit
-        file_filter  # Filter (filename)
-    ]
-
-    subprocess.run(command, check=True)
-    print(f"✅ DWG converted to DXF and saved in: {output_folder}")
\ No newline at end of file
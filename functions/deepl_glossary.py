@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+
+from functions.glossary_utils import read_glossary_pairs
+from functions.paths import app_data_dir
+from functions.translate_text import DEEPL_API_KEY
+
+DEEPL_GLOSSARY_URL = "https://api.deepl.com/v2/glossaries"
+
+# One upload at a time – several TranslationWorkers may ask for the same pair
+_sync_lock = threading.Lock()
+# Superseded glossaries stay on DeepL this long (jobs of other processes may still use them)
+RETIRE_GRACE = 3600
+
+_in_use = {}    # glossary id -> jobs of this process using it
+
+
+def _cache_path():
+    return app_data_dir() / "deepl_glossaries.json"
+
+
+def _load_cache():
+    """{"glossaries": {"<pair>|<path>": {hash, glossary_id}}, "retired": [{glossary_id, since}]}"""
+    try:
+        with open(_cache_path(), encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError):
+        cache = {}
+    if "glossaries" not in cache:     # one entry per pair (older format): retire them all
+        cache = {"glossaries": {}, "retired": [
+            {"glossary_id": v["glossary_id"], "since": time.time()} for v in cache.values()
+            if isinstance(v, dict) and "glossary_id" in v
+        ]}
+    return cache
+
+
+def _save_cache(cache):
+    tmp = _cache_path().with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh, indent=2)
+    tmp.replace(_cache_path())
+
+
+def glossary_entries_tsv(pairs):
+    """
+    Build the DeepL TSV payload: one "source<TAB>target" line per term.
+    DeepL rejects duplicate sources and control characters, so the first
+    occurrence wins and tabs / newlines are flattened to spaces.
+    """
+    seen = set()
+    lines = []
+    for source, target in pairs:
+        source = " ".join(source.split())
+        target = " ".join(target.split())
+        if not source or not target or source in seen:
+            continue
+        seen.add(source)
+        lines.append(f"{source}\t{target}")
+    return "\n".join(lines)
+
+
+def glossary_content_hash(entries_tsv, source_lang, target_lang):
+    digest = hashlib.sha256()
+    digest.update(f"{source_lang.upper()}>{target_lang.upper()}\n".encode("utf-8"))
+    digest.update(entries_tsv.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def upload_glossary(entries_tsv, source_lang, target_lang, name, session=None):
+    """Create a glossary on DeepL and return its id."""
+    session = session or requests
+    response = session.post(
+        DEEPL_GLOSSARY_URL,
+        headers={"Authorization": f"DeepL-Auth-Key {DEEPL_API_KEY}"},
+        data={
+            "name": name,
+            "source_lang": source_lang.lower(),
+            "target_lang": target_lang.lower(),
+            "entries": entries_tsv,
+            "entries_format": "tsv",
+        },
+    )
+    if not response.ok:
+        raise RuntimeError(f"DeepL glossary upload failed: {response.text}")
+    return response.json()["glossary_id"]
+
+
+def delete_glossary(glossary_id, session=None):
+    session = session or requests
+    session.delete(
+        f"{DEEPL_GLOSSARY_URL}/{glossary_id}",
+        headers={"Authorization": f"DeepL-Auth-Key {DEEPL_API_KEY}"},
+    )
+
+
+def ensure_deepl_glossary(glossary_path, source_lang, target_lang, session=None, log=print):
+    """
+    Return the DeepL glossary id for the *source_lang* → *target_lang* pair
+    of *glossary_path*, uploading it only when its content hash is not cached
+    yet. Returns None when the glossary is empty or DeepL refuses it, so the
+    caller can translate without terminology enforcement.
+
+    Glossaries are cached per file and pair, so two glossary files for the
+    same pair do not replace each other. A returned id counts as in use until
+    ``release_deepl_glossary``; superseded ids are deleted on DeepL only when
+    no job uses them any more.
+    """
+    try:
+        pairs = read_glossary_pairs(glossary_path, source_lang, target_lang)
+    except (OSError, ValueError) as err:
+        log(f"⚠️ DeepL glossary not available: {err}")
+        return None
+
+    entries = glossary_entries_tsv(pairs)
+    if not entries:
+        return None
+
+    content_hash = glossary_content_hash(entries, source_lang, target_lang)
+    pair_key = f"{source_lang.upper()}>{target_lang.upper()}"
+    cache_key = f"{pair_key}|{os.path.normcase(os.path.abspath(str(glossary_path)))}"
+
+    with _sync_lock:
+        cache = _load_cache()
+        glossaries = cache["glossaries"]
+        cached = glossaries.get(cache_key)
+        same = next((g for g in glossaries.values() if g["hash"] == content_hash), None)
+
+        if same:
+            glossary_id = same["glossary_id"]        # this content is already on DeepL
+        else:
+            try:
+                glossary_id = upload_glossary(
+                    entries, source_lang, target_lang,
+                    name=f"ams-{pair_key}-{content_hash[:12]}",
+                    session=session,
+                )
+            except Exception as err:
+                log(f"⚠️ DeepL glossary upload failed: {err}")
+                return None
+            log(f"📕 DeepL glossary synced ({pair_key}, {len(entries.splitlines())} terms)")
+
+        glossaries[cache_key] = {"hash": content_hash, "glossary_id": glossary_id}
+        # The old content of this file is superseded – retire it unless another file still maps to it
+        if cached and cached["glossary_id"] != glossary_id and \
+                all(g["glossary_id"] != cached["glossary_id"] for g in glossaries.values()):
+            cache["retired"].append({"glossary_id": cached["glossary_id"], "since": time.time()})
+        _delete_retired(cache, session)
+
+        _in_use[glossary_id] = _in_use.get(glossary_id, 0) + 1
+        try:
+            _save_cache(cache)
+        except OSError as err:
+            log(f"⚠️ Could not cache DeepL glossary id: {err}")
+        return glossary_id
+
+
+def release_deepl_glossary(glossary_id):
+    """A job is done with *glossary_id* (pairs every non-None ensure_deepl_glossary)."""
+    if glossary_id is None:
+        return
+    with _sync_lock:
+        count = _in_use.get(glossary_id, 0) - 1
+        if count > 0:
+            _in_use[glossary_id] = count
+        else:
+            _in_use.pop(glossary_id, None)
+
+
+def _delete_retired(cache, session=None):
+    """Free superseded glossaries on DeepL once no job can still be using them (best effort)."""
+    keep = []
+    for retired in cache["retired"]:
+        if retired["glossary_id"] in _in_use or time.time() - retired["since"] < RETIRE_GRACE:
+            keep.append(retired)
+            continue
+        try:
+            delete_glossary(retired["glossary_id"], session=session)
+        except Exception:
+            keep.append(retired)
+    cache["retired"] = keep
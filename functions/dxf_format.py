@@ -0,0 +1,25 @@
+import os
+
+# First bytes of every binary DXF file
+BINARY_DXF_SENTINEL = b"AutoCAD Binary DXF\r\n\x1a\x00"
+
+
+def is_binary_dxf(path):
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(len(BINARY_DXF_SENTINEL)) == BINARY_DXF_SENTINEL
+    except OSError:
+        return False
+
+
+def save_dxf(doc, path, binary=False, log=print):
+    """``doc.saveas`` as binary DXF when asked, ASCII if ezdxf cannot write it."""
+    if binary:
+        try:
+            doc.saveas(str(path), fmt="bin")
+            return
+        except Exception as err:
+            if os.path.exists(path):
+                os.remove(path)
+            log(f"⚠️ Binary DXF save failed, saving ASCII: {err}")
+    doc.saveas(str(path))
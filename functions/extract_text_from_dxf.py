@@ -1,5 +1,6 @@
 import ezdxf
 import re
+from functions.mtext_format import parse_mtext
 
 def clean_autocad_formatting(text):
     # Remove inline underline codes like \L, \l
@@ -8,6 +9,35 @@ def clean_autocad_formatting(text):
     text = re.sub(r"\{\\L(.*?)\\l\}", r"\1", text)
     return text
 
+def _text_item(e, source):
+    """
+    Build the text item for a TEXT / MTEXT / ATTRIB-like entity, or None when
+    it carries no text. MTEXT-formatted content (MTEXT, dimension overrides)
+    is split into formatting and text runs so only the text runs are translated.
+    """
+    if e.dxftype() in {"MTEXT", "DIMENSION"}:
+        raw = e.text if e.dxftype() == "MTEXT" else getattr(e.dxf, "text", None)
+        if not raw:
+            return None
+        content = parse_mtext(raw)
+        return {
+            "text": content.plain_text(),
+            "mtext": content,
+            "entity": e,
+            "source": source,
+            "position": getattr(e.dxf, "insert", None)
+        }
+
+    text = getattr(e.dxf, "text", None)
+    if not text:
+        return None
+    return {
+        "text": clean_autocad_formatting(text),
+        "entity": e,
+        "source": source,
+        "position": getattr(e.dxf, "insert", None)
+    }
+
 def extract_text_entities(dxf_file_path):
     doc = ezdxf.readfile(dxf_file_path)
     msp = doc.modelspace()
@@ -17,14 +47,9 @@ def extract_text_entities(dxf_file_path):
     # ────────────────────────────────────────────────────────────
     # Modelspace text entities
     for e in msp.query("TEXT MTEXT ATTRIB DIMENSION"):
-        text = getattr(e.dxf, "text", None)
-        if text:
-            text_items.append({
-                "text": clean_autocad_formatting(text),
-                "entity": e,
-                "source": "modelspace",
-                "position": getattr(e.dxf, "insert", None)
-            })
+        item = _text_item(e, "modelspace")
+        if item:
+            text_items.append(item)
 
     # ────────────────────────────────────────────────────────────
     # Tables (cells)
@@ -48,10 +73,12 @@ def extract_text_entities(dxf_file_path):
     # Multileaders
     for e in msp.query("MULTILEADER"):
         try:
-            mtext = e.get_mtext()
-            if mtext:
+            mtext = e.context.mtext
+            if mtext and mtext.default_content:
+                content = parse_mtext(mtext.default_content)
                 text_items.append({
-                    "text": clean_autocad_formatting(mtext.plain_text()),
+                    "text": content.plain_text(),
+                    "mtext": content,
                     "entity": e,
                     "source": "multileader",
                     "position": getattr(e.dxf, "insert", None)
@@ -66,14 +93,9 @@ def extract_text_entities(dxf_file_path):
         for e in block:
             if e.dxftype() in {"TEXT", "MTEXT", "ATTRIB"}:
                 try:
-                    txt = e.dxf.text
-                    if txt:
-                        text_items.append({
-                            "text": clean_autocad_formatting(txt),
-                            "entity": e,
-                            "source": f"block:{block_name}",
-                            "position": getattr(e.dxf, "insert", None)
-                        })
+                    item = _text_item(e, f"block:{block_name}")
+                    if item:
+                        text_items.append(item)
                 except AttributeError:
                     pass
 
@@ -0,0 +1,300 @@
+import json
+import os
+import shutil
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+from functions.paths import queue_dir
+from functions.fingerprint import partial_fingerprint, full_fingerprint
+from functions.file_utils import claim_unique_path, release_path
+
+MANIFEST_NAME = "queue.json"
+_COPY_BLOCK = 4 << 20
+
+
+def is_network_path(path) -> bool:
+    """True for UNC paths and mapped network drives."""
+    path = os.path.abspath(str(path))
+    if path.startswith(("\\\\", "//")):
+        return True
+    if sys.platform == "win32" and len(path) > 1 and path[1] == ":":
+        import ctypes
+        DRIVE_REMOTE = 4
+        return ctypes.windll.kernel32.GetDriveTypeW(path[:3]) == DRIVE_REMOTE
+    return False
+
+
+def file_stamp(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+class FileQueue:
+    """
+    The DWG queue as a manifest (``queue.json``) of entries instead of a
+    folder of copies. Each entry is a dict::
+
+        id, name, source, path, size, mtime_ns, mode
+        fingerprint, full_hash, duplicate_of      (filled in later)
+
+    ``path`` is what gets processed. ``mode`` says who owns it:
+    ``hardlink`` (same volume, instant, no extra space), ``reference`` (the
+    dropped file itself), ``copying`` (network source, still processed from
+    ``source`` until the background copy lands) or ``copy`` (a local copy
+    the queue owns). Only owned files are deleted when an entry is removed.
+
+    Entries are deduplicated by content, not by name: a quick fingerprint is
+    computed in the background, confirmed with a full hash on collision, and
+    an identical drawing gets ``duplicate_of`` = the id of the entry that
+    will actually be processed.
+    """
+
+    def __init__(self, folder=None):
+        self.folder = Path(folder) if folder else queue_dir()
+        self.manifest = self.folder / MANIFEST_NAME
+        self.entries: list[dict] = []
+        self._lock = threading.RLock()
+
+    # ──────────────────────────────────────────────────────────
+    # manifest
+    # ──────────────────────────────────────────────────────────
+    def load(self):
+        """Read the manifest, drop vanished entries and adopt stray DWGs left in the folder."""
+        with self._lock:
+            try:
+                with open(self.manifest, encoding="utf-8") as fh:
+                    entries = json.load(fh)
+            except (OSError, ValueError):
+                entries = []
+
+            self.entries = []
+            for entry in entries:
+                if entry.get("mode") == "copying":      # interrupted copy – start over from the source
+                    self._discard_partial(entry)
+                    entry["path"] = entry["source"]
+                if os.path.exists(entry["path"]):
+                    self.entries.append(entry)
+
+            known = {os.path.normcase(os.path.abspath(e["path"])) for e in self.entries}
+            for fp in sorted(self.folder.glob("*.dwg")):
+                if os.path.normcase(os.path.abspath(fp)) not in known:
+                    self.entries.append(self._entry(fp, fp, "copy"))
+            self.save()
+            return list(self.entries)
+
+    def save(self):
+        with self._lock:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            tmp = self.manifest.with_name(MANIFEST_NAME + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(self.entries, fh, indent=1)
+            os.replace(tmp, self.manifest)
+
+    @staticmethod
+    def _entry(source, path, mode, entry_id=None):
+        size, mtime_ns = file_stamp(path)
+        return {
+            "id": entry_id or uuid.uuid4().hex,
+            "name": os.path.basename(source),
+            "source": str(source),
+            "path": str(path),
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "mode": mode,
+        }
+
+    # ──────────────────────────────────────────────────────────
+    # add / remove
+    # ──────────────────────────────────────────────────────────
+    def get(self, entry_id):
+        return next((e for e in self.entries if e["id"] == entry_id), None)
+
+    def find_source(self, source):
+        key = os.path.normcase(os.path.abspath(str(source)))
+        return next((e for e in self.entries if os.path.normcase(e["source"]) == key), None)
+
+    def _free_path(self, name, entry_id):
+        """``<queue>/<name>``, or ``<queue>/<id>/<name>`` when another drawing already has that name."""
+        path = self.folder / name
+        if path.exists() or any(e["name"] == name for e in self.entries):
+            path = self.folder / entry_id[:8] / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def add(self, source):
+        """
+        Register *source* without copying it. Returns ``(entry, is_new)``;
+        an entry in ``copying`` mode still needs ``copy_entry`` run on it.
+        """
+        source = os.path.abspath(str(source))
+        with self._lock:
+            existing = self.find_source(source)
+            if existing:
+                return existing, False
+
+            entry_id = uuid.uuid4().hex
+            link = self._free_path(os.path.basename(source), entry_id)
+            try:
+                os.link(source, link)
+                entry = self._entry(source, link, "hardlink", entry_id)
+            except OSError:
+                mode = "copying" if is_network_path(source) else "reference"
+                entry = self._entry(source, source, mode, entry_id)
+
+            self.entries.append(entry)
+            self.save()
+            return entry, True
+
+    def remove(self, entry_id):
+        with self._lock:
+            entry = self.get(entry_id)
+            if entry is None:
+                return None
+            self.entries.remove(entry)
+
+            # the first duplicate takes over as the processed copy
+            duplicates = [e for e in self.entries if e.get("duplicate_of") == entry_id]
+            for dup in duplicates:
+                dup["duplicate_of"] = duplicates[0]["id"] if dup is not duplicates[0] else None
+
+            if entry["mode"] in ("hardlink", "copy"):
+                try:
+                    os.remove(entry["path"])
+                    if Path(entry["path"]).parent != self.folder:
+                        os.rmdir(Path(entry["path"]).parent)
+                except OSError:
+                    pass
+            elif entry["mode"] == "copying":
+                self._discard_partial(entry)
+            self.save()
+            return entry
+
+    def clear(self):
+        for entry in list(self.entries):
+            self.remove(entry["id"])
+
+    def is_stale(self, entry):
+        """The referenced file changed (or vanished) since it was queued."""
+        try:
+            return file_stamp(entry["path"]) != (entry["size"], entry["mtime_ns"])
+        except OSError:
+            return True
+
+    # ──────────────────────────────────────────────────────────
+    # content deduplication
+    # ──────────────────────────────────────────────────────────
+    def fingerprint(self, entry):
+        """
+        Fingerprint *entry* and link it to an identical queued drawing.
+        Returns the id of the entry it duplicates, or None. Runs off the UI
+        thread: the full hash is read only when two quick fingerprints collide.
+        """
+        fp = partial_fingerprint(entry["path"])
+        with self._lock:
+            entry["fingerprint"] = fp
+            candidates = [e for e in self.entries
+                          if e is not entry and e.get("fingerprint") == fp and not e.get("duplicate_of")]
+
+        for other in candidates:
+            hashes = []
+            for e in (entry, other):
+                with self._lock:
+                    known = e.get("full_hash")
+                hashes.append(known or full_fingerprint(e["path"]))
+            with self._lock:
+                entry["full_hash"], other["full_hash"] = hashes
+                # another fingerprint may have linked either of them meanwhile
+                if hashes[0] != hashes[1] or other not in self.entries \
+                        or other.get("duplicate_of") or entry.get("duplicate_of"):
+                    continue
+                for dup in self.entries:        # entry's own duplicates follow it
+                    if dup.get("duplicate_of") == entry["id"]:
+                        dup["duplicate_of"] = other["id"]
+                entry["duplicate_of"] = other["id"]
+                self.save()
+                return other["id"]
+
+        with self._lock:
+            self.save()
+        return None
+
+    def jobs(self, entry_ids):
+        """
+        Group the selected entries into jobs: ``[(entry, [duplicates…])]``.
+        Identical drawings share one job; its result is fanned out to the others.
+        """
+        groups = {}
+        for entry_id in entry_ids:
+            entry = self.get(entry_id)
+            if entry is not None:
+                groups.setdefault(entry.get("duplicate_of") or entry["id"], []).append(entry)
+        return [(group[0], group[1:]) for group in groups.values()]
+
+    # ──────────────────────────────────────────────────────────
+    # lazy copy of network sources
+    # ──────────────────────────────────────────────────────────
+    def _copy_target(self, entry):
+        return self.folder / f".{entry['id']}_{entry['name']}.part"
+
+    def _discard_partial(self, entry):
+        try:
+            os.remove(self._copy_target(entry))
+        except OSError:
+            pass
+
+    def copy_entry(self, entry, progress=None, cancelled=lambda: False):
+        """
+        Copy a network source next to the queue, reporting ``progress(done,
+        total)``. The entry switches to the local copy only once it is complete.
+        """
+        part = self._copy_target(entry)
+        total = max(entry["size"], 1)
+        done = 0
+        with open(entry["source"], "rb") as fin, open(part, "wb") as fout:
+            for block in iter(lambda: fin.read(_COPY_BLOCK), b""):
+                if cancelled():
+                    break
+                fout.write(block)
+                done += len(block)
+                if progress:
+                    progress(done, total)
+
+        with self._lock:
+            if cancelled() or entry not in self.entries:
+                self._discard_partial(entry)
+                return False
+            dest = self.folder / entry["name"]
+            if dest.exists():
+                dest = self.folder / entry["id"][:8] / entry["name"]
+                dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copystat(entry["source"], part)
+            os.replace(part, dest)
+            entry.update(path=str(dest), mode="copy")
+            self.save()
+            return True
+
+
+def fan_out_result(result_path, source_name, alias_names):
+    """
+    Give every duplicate its own output: ``Tavola1_EN.dwg`` → ``Copia_EN.dwg``
+    (``Copia_EN (2).dwg`` if that is taken). Hardlinked when possible.
+    Returns the created paths.
+    """
+    result = Path(result_path)
+    suffix = result.name[len(Path(source_name).stem):]      # e.g. "_EN.dwg"
+    created = []
+    for name in alias_names:
+        wanted = result.with_name(Path(name).stem + suffix)
+        if wanted == result:
+            continue
+        dest = claim_unique_path(wanted)    # never replace another drawing's result
+        try:
+            os.link(result, dest)
+        except OSError:
+            shutil.copy2(result, dest)
+        finally:
+            release_path(dest)
+        created.append(str(dest))
+    return created
@@ -1,4 +1,30 @@
 import os
+import threading
+from pathlib import Path
+
+_claimed = set()        # output paths running jobs are about to write
+_claimed_lock = threading.Lock()
+
+
+def claim_unique_path(path):
+    """
+    *path*, or ``name (2).ext``, ``name (3).ext``… if it exists or a running
+    job has already claimed it. Call ``release_path()`` once it is written.
+    """
+    path = Path(path)
+    with _claimed_lock:
+        candidate, n = path, 1
+        while candidate.exists() or os.path.normcase(str(candidate)) in _claimed:
+            n += 1
+            candidate = path.with_name(f"{path.stem} ({n}){path.suffix}")
+        _claimed.add(os.path.normcase(str(candidate)))
+    return candidate
+
+
+def release_path(path):
+    with _claimed_lock:
+        _claimed.discard(os.path.normcase(str(path)))
+
 
 def ensure_translated_folder(target_lang=None):
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -15,3 +41,55 @@ def ensure_translated_folder(target_lang=None):
 
     return translated_base
 
+
+
+class DirectoryIndex:
+    """
+    Names + mtimes of the files in one folder matching *suffix*.
+
+    ``refresh()`` is one ``scandir``; the mtimes come from the directory
+    entries (free on Windows, where the listing carries them), so
+    re-checking a large folder after a change costs a directory read.
+    """
+
+    def __init__(self, folder, suffix=".dwg"):
+        self.folder = os.path.abspath(str(folder))
+        self.suffix = suffix.lower()
+        self.files = {}     # path -> mtime
+
+    def _entries(self):
+        entries = {}
+        try:
+            with os.scandir(self.folder) as it:
+                for e in it:
+                    if e.name.lower().endswith(self.suffix):
+                        try:
+                            if e.is_file():
+                                entries[e.path] = e.stat().st_mtime
+                        except OSError:
+                            continue
+        except OSError:
+            pass
+        return entries
+
+    def refresh(self):
+        """Re-read the folder; returns (added or changed {path: mtime}, removed [path])."""
+        current = self._entries()
+        removed = [p for p in self.files if p not in current]
+        changed = {p: m for p, m in current.items() if self.files.get(p) != m}
+        for path in removed:
+            del self.files[path]
+        self.files.update(changed)
+        return changed, removed
+
+    def update(self, path):
+        """Record one known file (e.g. a job's output) without listing the folder."""
+        path = os.path.abspath(path)
+        if os.path.dirname(path) != os.path.abspath(self.folder):
+            return None
+        try:
+            self.files[path] = os.stat(path).st_mtime
+        except OSError:
+            self.files.pop(path, None)
+            return None
+        return self.files[path]
@@ -0,0 +1,30 @@
+import hashlib
+import os
+
+# Bytes read from each end of the file for the quick fingerprint
+SAMPLE_BYTES = 64 * 1024
+_BLOCK = 1 << 20
+
+
+def partial_fingerprint(path) -> str:
+    """
+    Quick content fingerprint: BLAKE2b over the size, the first and the last
+    SAMPLE_BYTES. Different files almost always differ here; equal values are
+    confirmed with ``full_fingerprint``.
+    """
+    size = os.path.getsize(path)
+    h = hashlib.blake2b(str(size).encode("ascii"), digest_size=16)
+    with open(path, "rb") as fh:
+        h.update(fh.read(SAMPLE_BYTES))
+        if size > SAMPLE_BYTES:
+            fh.seek(max(size - SAMPLE_BYTES, SAMPLE_BYTES))
+            h.update(fh.read(SAMPLE_BYTES))
+    return h.hexdigest()
+
+
+def full_fingerprint(path) -> str:
+    h = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
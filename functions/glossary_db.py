@@ -0,0 +1,229 @@
+import csv
+import hashlib
+import io
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from functions.paths import app_data_dir
+
+
+def term_key(text):
+    """Normalized lookup key: lowercase, single spaces."""
+    return " ".join(text.lower().split())
+
+
+class GlossaryDB:
+    """
+    Indexed SQLite copy of a semicolon glossary CSV.
+
+    One row per concept, one value column (``c<n>``) and one indexed key
+    column (``k<n>``, see ``term_key``) per language. The CSV stays the
+    shared, editable format; ``sync()`` re-imports it only when its size,
+    mtime or content hash changed, so consumers query the index instead of
+    re-parsing the file. A re-import fills a staging table and swaps it in
+    with one transaction; readers hold ``_lock`` so they never see it half done.
+    """
+
+    def __init__(self, csv_path, db_path=None):
+        self.csv_path = str(csv_path)
+        if db_path is None:
+            name = hashlib.sha1(os.path.abspath(self.csv_path).encode("utf-8")).hexdigest()[:12]
+            db_path = app_data_dir() / f"glossary_{name}.db"
+        self.db_path = str(db_path)
+        self._lock = threading.RLock()
+        with self._connect() as con:
+            con.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            con.execute("CREATE TABLE IF NOT EXISTS languages (pos INTEGER PRIMARY KEY, code TEXT UNIQUE)")
+
+    @contextmanager
+    def _connect(self):
+        con = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    # ──────────────────────────────────────────────────────────
+    # CSV import / export
+    # ──────────────────────────────────────────────────────────
+    def _meta(self, con, key):
+        row = con.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def sync(self):
+        """Re-import the CSV if it changed since the last import. Returns True if it did."""
+        with self._lock:
+            st = os.stat(self.csv_path)
+            stamp = f"{st.st_size}:{st.st_mtime_ns}"
+            with self._connect() as con:
+                if self._meta(con, "stamp") == stamp:
+                    return False
+
+            with open(self.csv_path, "rb") as fh:
+                data = fh.read()
+            content_hash = hashlib.sha256(data).hexdigest()
+
+            with self._connect() as con:
+                con.execute("BEGIN IMMEDIATE")
+                if self._meta(con, "hash") != content_hash:
+                    text = io.StringIO(data.decode("utf-8"), newline="")
+                    self._import_rows(con, csv.reader(text, delimiter=";"))
+                con.execute("INSERT OR REPLACE INTO meta VALUES ('hash', ?)", (content_hash,))
+                con.execute("INSERT OR REPLACE INTO meta VALUES ('stamp', ?)", (stamp,))
+            return True
+
+    def _import_rows(self, con, rows):
+        rows = iter(rows)
+        headers = [h.strip().lstrip('\ufeff') for h in next(rows, [])]
+        if not headers:
+            raise ValueError("No headers found in glossary.")
+
+        con.execute("DROP TABLE IF EXISTS concepts_new")
+        cols = ", ".join(f"c{i} TEXT, k{i} TEXT" for i in range(len(headers)))
+        con.execute(f"CREATE TABLE concepts_new (id INTEGER PRIMARY KEY, {cols})")
+
+        width = len(headers)
+        placeholders = ", ".join("?" for _ in range(width * 2))
+
+        def records():
+            for row in rows:
+                if not row:
+                    continue
+                row = (row + [""] * width)[:width]
+                values = []
+                for value in row:
+                    values += [value, term_key(value)]
+                yield values
+
+        con.executemany(f"INSERT INTO concepts_new ({self._columns(width)}) VALUES ({placeholders})", records())
+
+        # swap in; the caller's transaction makes it one step for every reader
+        con.execute("DROP TABLE IF EXISTS concepts")
+        con.execute("ALTER TABLE concepts_new RENAME TO concepts")
+        for i in range(width):
+            con.execute(f"CREATE INDEX idx_k{i} ON concepts (k{i})")
+        con.execute("DELETE FROM languages")
+        con.executemany("INSERT INTO languages VALUES (?, ?)", list(enumerate(headers)))
+
+    @staticmethod
+    def _columns(width):
+        return ", ".join(f"c{i}, k{i}" for i in range(width))
+
+    def export_csv(self, path):
+        self.sync()
+        headers = self.languages()
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh, delimiter=";")
+            writer.writerow(headers)
+            for chunk in self.iter_rows():
+                writer.writerows(chunk)
+
+    # ──────────────────────────────────────────────────────────
+    # queries
+    # ──────────────────────────────────────────────────────────
+    def languages(self):
+        with self._lock, self._connect() as con:
+            return [code for _, code in con.execute("SELECT pos, code FROM languages ORDER BY pos")]
+
+    def _pos(self, lang):
+        langs = self.languages()
+        if lang not in langs:
+            raise ValueError(f"Glossary does not contain '{lang}' column.")
+        return langs.index(lang)
+
+    def pairs(self, source_lang, target_lang):
+        """(source, target) pairs as written, both sides non-empty."""
+        with self._lock:
+            s, t = self._pos(source_lang), self._pos(target_lang)
+            with self._connect() as con:
+                return con.execute(
+                    f"SELECT c{s}, c{t} FROM concepts WHERE k{s} != '' AND k{t} != '' ORDER BY id"
+                ).fetchall()
+
+    def pair_map(self, source_lang, target_lang):
+        """{normalized source: target} for one language pair (last row wins, like the CSV map)."""
+        with self._lock:
+            s, t = self._pos(source_lang), self._pos(target_lang)
+            with self._connect() as con:
+                rows = con.execute(
+                    f"SELECT k{s}, trim(c{t}) FROM concepts WHERE k{s} != '' AND k{t} != '' ORDER BY id"
+                )
+                return dict(rows)
+
+    def lookup(self, source_lang, target_lang, term):
+        with self._lock:
+            s, t = self._pos(source_lang), self._pos(target_lang)
+            with self._connect() as con:
+                row = con.execute(
+                    f"SELECT trim(c{t}) FROM concepts WHERE k{s} = ? AND k{t} != '' ORDER BY id DESC LIMIT 1",
+                    (term_key(term),),
+                ).fetchone()
+        return row[0] if row else None
+
+    def prefix_search(self, lang, prefix, limit=50):
+        """Rows whose *lang* term starts with *prefix* – an index range scan."""
+        key = term_key(prefix)
+        with self._lock:
+            p = self._pos(lang)
+            with self._connect() as con:
+                return con.execute(
+                    f"SELECT {', '.join(f'c{i}' for i in range(len(self.languages())))} FROM concepts "
+                    f"WHERE k{p} >= ? AND k{p} < ? ORDER BY k{p} LIMIT ?",
+                    (key, key + "\U0010ffff", limit),
+                ).fetchall()
+
+    def row_count(self):
+        with self._lock, self._connect() as con:
+            return con.execute("SELECT count(*) FROM concepts").fetchone()[0]
+
+    def rows(self, offset, limit):
+        """Partial load: *limit* rows starting at *offset*, in CSV order."""
+        with self._lock:
+            width = len(self.languages())
+            with self._connect() as con:
+                return [list(r) for r in con.execute(
+                    f"SELECT {', '.join(f'c{i}' for i in range(width))} FROM concepts ORDER BY id LIMIT ? OFFSET ?",
+                    (limit, offset),
+                )]
+
+    def iter_rows(self, chunk_size=2000):
+        """
+        Yield all rows in chunks, walking the primary key instead of OFFSET.
+        The lock is taken per chunk; a re-import in between raises RuntimeError
+        rather than mixing rows of two versions.
+        """
+        with self._lock, self._connect() as con:
+            width = len(self.languages())
+            version = self._meta(con, "hash")
+        last = 0
+        while True:
+            with self._lock, self._connect() as con:
+                if self._meta(con, "hash") != version:
+                    raise RuntimeError("The glossary was re-imported while it was being read.")
+                chunk = con.execute(
+                    f"SELECT id, {', '.join(f'c{i}' for i in range(width))} FROM concepts "
+                    f"WHERE id > ? ORDER BY id LIMIT ?",
+                    (last, chunk_size),
+                ).fetchall()
+            if not chunk:
+                return
+            last = chunk[-1][0]
+            yield [list(r[1:]) for r in chunk]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def glossary_index(csv_path):
+    """Shared, synced GlossaryDB for *csv_path*."""
+    key = os.path.abspath(str(csv_path))
+    with _indexes_lock:
+        db = _indexes.get(key)
+        if db is None:
+            db = _indexes[key] = GlossaryDB(csv_path)
+    db.sync()
+    return db
@@ -0,0 +1,131 @@
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+# Confidence at or above which a hit replaces machine translation
+FUZZY_THRESHOLD = 0.9
+# Stems and trigrams cannot tell "porto" from "porta" or a plural from its
+# singular, so such hits never reach FUZZY_THRESHOLD: an equal stem goes to
+# DeepL with the glossary entry (see resolve_translations), the rest as context
+STEM_CONFIDENCE = 0.85
+# Trigram hits stay below equal stems
+TRIGRAM_CAP = 0.8
+# Below this a fuzzy hit is not even worth passing as context
+CONTEXT_THRESHOLD = 0.6
+
+_WORD = re.compile(r"\w+")
+# Light, language-agnostic inflection stripping (IT / EN / DE plurals and endings)
+_SUFFIXES = ("zioni", "zione", "ies", "es", "en", "er", "s", "i", "e", "o", "a", "n")
+_MIN_STEM = 3
+
+
+def normalize(text):
+    """Lowercase, strip accents and punctuation, single spaces."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(_WORD.findall(text))
+
+
+def stem(token):
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= _MIN_STEM:
+            return token[: -len(suffix)]
+    return token
+
+
+def stem_key(text):
+    return " ".join(stem(t) for t in normalize(text).split())
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class GlossaryMatcher:
+    """
+    Approximate lookup of strings against one glossary language pair.
+
+    Terms are normalized and stemmed ("viti" and "vite" both become "vit"),
+    then indexed by character trigram, so a lookup only scores the terms that
+    share trigrams with the query instead of the whole glossary.
+    """
+
+    def __init__(self, glossary_map):
+        self.sources = list(glossary_map)
+        self.targets = [glossary_map[s] for s in self.sources]
+        self.keys = [stem_key(s) for s in self.sources]
+        self.normalized = {}
+        self.exact = {}
+        self.grams = {}
+        self.by_first_token = {}
+        for i, key in enumerate(self.keys):
+            if not key:
+                continue
+            self.normalized.setdefault(normalize(self.sources[i]), i)
+            self.exact.setdefault(key, i)
+            for gram in _trigrams(key):
+                self.grams.setdefault(gram, []).append(i)
+            self.by_first_token.setdefault(key.split()[0], []).append(i)
+
+    def match(self, text):
+        """
+        Best whole-string match as ``(source, target, confidence)``, or None.
+        Confidence is 1.0 only when the normalized text equals a term (case,
+        accents, punctuation); identical stems score STEM_CONFIDENCE and
+        other hits their trigram Dice score, capped at TRIGRAM_CAP.
+        """
+        i = self.normalized.get(normalize(text))
+        if i is not None:
+            return self.sources[i], self.targets[i], 1.0
+
+        key = stem_key(text)
+        if not key:
+            return None
+
+        i = self.exact.get(key)
+        if i is not None:
+            return self.sources[i], self.targets[i], STEM_CONFIDENCE
+
+        query = _trigrams(key)
+        shared = Counter()
+        for gram in query:
+            for i in self.grams.get(gram, ()):
+                shared[i] += 1
+        if not shared:
+            return None
+
+        best, score = None, 0.0
+        for i, count in shared.most_common(20):
+            dice = 2 * count / (len(query) + len(_trigrams(self.keys[i])))
+            if dice > score:
+                best, score = i, dice
+        return self.sources[best], self.targets[best], round(min(score, TRIGRAM_CAP), 3)
+
+    def find_partial(self, text):
+        """
+        Longest glossary term whose stemmed words appear, in order and
+        adjacent, inside *text* – so "viti zincate M6" contains "vite".
+        """
+        tokens = stem_key(text).split()
+        best = None
+        for pos, token in enumerate(tokens):
+            for i in self.by_first_token.get(token, ()):
+                words = self.keys[i].split()
+                if tokens[pos:pos + len(words)] == words and (best is None or len(words) > len(self.keys[best].split())):
+                    best = i
+        return self.sources[best] if best is not None else None
+
+
+_cached = (None, None)
+_cache_lock = threading.Lock()
+
+
+def matcher_for(glossary_map):
+    """Shared matcher for *glossary_map* – built once per map, reused by every worker."""
+    global _cached
+    with _cache_lock:
+        if _cached[0] is not glossary_map:
+            _cached = (glossary_map, GlossaryMatcher(glossary_map))
+        return _cached[1]
@@ -0,0 +1,315 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from functions.paths import app_data_dir, get_glossary_dir, _network_glossary_dir
+
+# A mirror younger than this is served as is; older ones refresh in the background
+MIRROR_SYNC_INTERVAL = 30.0
+_STATE_FILE = ".mirror.json"
+_DIRTY_FILE = ".mirror-dirty.json"     # local edits not pushed yet: {rel: base checksum}
+_IGNORED_SUFFIXES = (".tmp",)
+_IGNORED_NAMES = {".write_test", _STATE_FILE, _DIRTY_FILE}
+_LAST_SYNCED = object()     # push(): compare against the state of the last sync
+
+
+class GlossaryConflictError(Exception):
+    """The remote file changed since the mirror last saw it."""
+
+    saved_copy = None   # where push_changes() set the local edits aside
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _copy_atomic(src: Path, dest: Path):
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(dest.name + ".tmp")
+    with open(src, "rb") as fin, open(tmp, "wb") as fout:
+        for block in iter(lambda: fin.read(1 << 20), b""):
+            fout.write(block)
+    os.replace(tmp, dest)
+
+
+def _immutable(rel):
+    # version objects / manifests are named by their content hash
+    return rel.startswith(("versions/objects/", "versions/manifests/"))
+
+
+class GlossaryMirror:
+    """
+    Local read-through copy of the shared glossary folder.
+
+    ``sync()`` pulls only the files whose size/mtime changed on the share
+    (and whose checksum really differs), so every read is served from local
+    disk. ``.mirror.json`` remembers the remote size, mtime and SHA-256 of
+    each file as last seen; ``push()`` uses that checksum as the base and
+    refuses to overwrite a remote file somebody else changed in the meantime.
+
+    Local edits stay marked dirty in ``.mirror-dirty.json`` until they reach
+    the share: ``sync()`` never overwrites them and pushes them once the share
+    is back. Edits that conflict are set aside in ``glossary_conflicts``.
+    """
+
+    def __init__(self, remote_dir, local_dir=None):
+        self.remote = Path(remote_dir)
+        self.local = Path(local_dir) if local_dir else app_data_dir() / "glossary_mirror"
+        self.state_path = self.local / _STATE_FILE
+        self.dirty_path = self.local / _DIRTY_FILE
+        self.last_sync = 0.0
+        self._lock = threading.RLock()
+        self._thread = None
+        self.state = self._load_json(self.state_path)
+        self.dirty = self._load_json(self.dirty_path)
+
+    # ──────────────────────────────────────────────────────────
+    # state
+    # ──────────────────────────────────────────────────────────
+    @staticmethod
+    def _load_json(path):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_json(self, path, data):
+        self.local.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, path)
+
+    def _save_state(self):
+        self._save_json(self.state_path, self.state)
+
+    def _save_dirty(self):
+        self._save_json(self.dirty_path, self.dirty)
+
+    def has_copy(self):
+        return bool(self.state)
+
+    @staticmethod
+    def _files(root: Path):
+        def fail(err):
+            raise err   # an unreadable share must not look like an empty one
+
+        for dirpath, _, filenames in os.walk(root, onerror=fail):
+            for name in filenames:
+                if name in _IGNORED_NAMES or name.endswith(_IGNORED_SUFFIXES):
+                    continue
+                path = Path(dirpath) / name
+                yield path.relative_to(root).as_posix(), path
+
+    # ──────────────────────────────────────────────────────────
+    # pull
+    # ──────────────────────────────────────────────────────────
+    def sync(self, log=None):
+        """Pull the remote changes since the last sync. Returns the number of files copied."""
+        with self._lock:
+            if not self.remote.is_dir():
+                raise FileNotFoundError(f"Glossary share not reachable: {self.remote}")
+            pulled = 0
+            seen = set()
+            for rel, path in self._files(self.remote):
+                seen.add(rel)
+                if rel in self.dirty:
+                    continue        # unpushed local edit: pushed (or set aside) below
+                st = path.stat()
+                known = self.state.get(rel)
+                local = self.local / rel
+                if known and local.exists() and (
+                        _immutable(rel) or (known["size"], known["mtime_ns"]) == (st.st_size, st.st_mtime_ns)):
+                    continue
+
+                digest = _sha256(path)
+                if not (known and known["sha256"] == digest and local.exists()):
+                    _copy_atomic(path, local)
+                    pulled += 1
+                self.state[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+
+            for rel in set(self.state) - seen - set(self.dirty):
+                (self.local / rel).unlink(missing_ok=True)
+                del self.state[rel]
+
+            self._save_state()
+            self.last_sync = time.monotonic()
+            if log and pulled:
+                log(f"🔹 Glossary mirror: {pulled} file(s) updated from the share")
+            if self.dirty:
+                try:
+                    pushed = self.push_changes()
+                    if log and pushed:
+                        log(f"🔹 Glossary mirror: {len(pushed)} file(s) saved offline pushed to the share")
+                except GlossaryConflictError as err:
+                    if log:
+                        log(f"⚠️ Glossary edits saved offline conflict with the share, kept in {err.saved_copy}")
+                except OSError:
+                    pass    # share went away again; retried on the next sync
+            return pulled
+
+    def sync_in_background(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._background_sync, name="glossary-mirror", daemon=True)
+            self._thread.start()
+
+    def _background_sync(self):
+        try:
+            self.sync()
+        except OSError:
+            pass    # share went away; keep serving the local copy
+
+    def ensure_fresh(self):
+        """
+        Local folder to read from, refreshed in the background when stale.
+        Never blocks on the share: before the first sync has landed the
+        folder is simply empty (the glossary reads as missing).
+        """
+        if not self.has_copy() or time.monotonic() - self.last_sync > MIRROR_SYNC_INTERVAL:
+            self.sync_in_background()
+        self.local.mkdir(parents=True, exist_ok=True)
+        return self.local
+
+    def base_of(self, rel):
+        """Remote checksum of *rel* as last synced (None: not on the share)."""
+        with self._lock:
+            return self.state.get(rel, {}).get("sha256")
+
+    # ──────────────────────────────────────────────────────────
+    # push
+    # ──────────────────────────────────────────────────────────
+    def push(self, rel, base=_LAST_SYNCED):
+        """
+        Copy one local file to the share, unless the share changed under us.
+        *base* is the remote checksum the edit started from (None: the file
+        was not on the share); by default the one of the last sync.
+        """
+        with self._lock:
+            if not self.remote.is_dir():
+                raise FileNotFoundError(f"Glossary share not reachable: {self.remote}")
+            src, dest = self.local / rel, self.remote / rel
+            if base is _LAST_SYNCED:
+                base = self.state.get(rel, {}).get("sha256")
+            current = _sha256(dest) if dest.exists() else None
+            if current != base and not (_immutable(rel) and current is not None):
+                raise GlossaryConflictError(
+                    f"'{rel}' was changed on the share by someone else since it was last synced."
+                )
+            if current is None or not _immutable(rel):
+                _copy_atomic(src, dest)
+            st = dest.stat()
+            self.state[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": _sha256(src)}
+            self._save_state()
+
+    def push_changes(self, bases=None):
+        """
+        Push every local file that differs from the last synced remote state.
+        Version objects go first and the index / current CSV last, so the
+        share never references data it does not have yet. *bases* maps files
+        edited by the user to the checksum they were loaded at; a background
+        sync since then must not hide another user's change.
+
+        Files are marked dirty before pushing, so an unreachable share leaves
+        them for the next ``sync()``. On a conflict the local edit is moved to
+        ``glossary_conflicts`` (``saved_copy`` of the error) and the share's
+        version is pulled again on the next sync.
+        """
+        bases = bases or {}
+        with self._lock:
+            changed = [
+                rel for rel, path in self._files(self.local)
+                if rel not in self.state or (not _immutable(rel) and _sha256(path) != self.state[rel]["sha256"])
+            ]
+            for rel in set(self.dirty) - set(changed):
+                del self.dirty[rel]     # marked, but the write never happened
+            for rel in changed:
+                if rel in bases or rel not in self.dirty:
+                    self.dirty[rel] = bases.get(rel, self.base_of(rel))
+            self._save_dirty()
+            for rel in sorted(changed, key=lambda r: (not _immutable(r), r)):
+                try:
+                    self.push(rel, self.dirty[rel])
+                except GlossaryConflictError as err:
+                    err.saved_copy = self._set_aside(rel)
+                    raise
+                del self.dirty[rel]
+                self._save_dirty()
+            return changed
+
+    def mark_dirty(self, rel, base=_LAST_SYNCED):
+        """Call before writing *rel* locally, so no sync replaces it until it is pushed."""
+        with self._lock:
+            self.dirty[rel] = self.base_of(rel) if base is _LAST_SYNCED else base
+            self._save_dirty()
+
+    def _set_aside(self, rel):
+        """Move a conflicting local edit out of the mirror; returns the copy."""
+        folder = app_data_dir() / "glossary_conflicts"
+        folder.mkdir(parents=True, exist_ok=True)
+        name = Path(rel)
+        copy = folder / f"{name.stem}-{time.strftime('%Y%m%d-%H%M%S')}{name.suffix}"
+        os.replace(self.local / rel, copy)
+        self.dirty.pop(rel, None)
+        self.state.pop(rel, None)
+        try:        # serve the share's version from now on
+            remote = self.remote / rel
+            st = remote.stat()
+            _copy_atomic(remote, self.local / rel)
+            self.state[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": _sha256(remote)}
+        except OSError:
+            pass    # pulled on the next sync
+        self._save_dirty()
+        self._save_state()
+        return copy
+
+
+_mirrors = {}
+_mirrors_lock = threading.Lock()
+
+
+def mirror_for(remote_dir):
+    key = os.path.abspath(str(remote_dir))
+    with _mirrors_lock:
+        mirror = _mirrors.get(key)
+        if mirror is None:
+            mirror = _mirrors[key] = GlossaryMirror(remote_dir)
+        return mirror
+
+
+def active_mirror():
+    """The share's mirror when the share is the glossary directory, else None."""
+    if get_glossary_dir() == _network_glossary_dir():
+        return mirror_for(_network_glossary_dir())
+    return None
+
+
+def working_glossary_dir() -> Path:
+    """
+    Folder to read and write the glossary in: ``get_glossary_dir()``, or its
+    local mirror when that is the network share. Call ``publish_glossary()``
+    after writing.
+    """
+    mirror = active_mirror()
+    return mirror.ensure_fresh() if mirror else get_glossary_dir()
+
+
+def glossary_base(name="glossario_tecnico.csv"):
+    """Checksum the share had for *name* at the last sync – record it when loading for edit."""
+    mirror = active_mirror()
+    return mirror.base_of(name) if mirror else None
+
+
+def publish_glossary():
+    """Push local glossary edits to the share (no-op without a mirror)."""
+    mirror = active_mirror()
+    return mirror.push_changes() if mirror else []
@@ -0,0 +1,128 @@
+import re
+from bisect import bisect_left, insort
+
+_TOKEN = re.compile(r"\w+")
+# Prefixes this short match a large share of all tokens; they get their own postings
+_SHORT_PREFIX = 2
+# Narrow the previous result by scanning it only while it is this small
+_NARROW_LIMIT = 2000
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+class GlossarySearchIndex:
+    """
+    Token prefix index over every language column of a GlossaryTable.
+
+    ``postings`` maps each distinct token to the stable row ids containing
+    it, and ``tokens`` keeps the distinct tokens sorted so a prefix query is
+    a bisect plus a short scan. One- and two-letter prefixes, which would
+    scan a large part of ``tokens``, have precomputed postings in ``short``.
+    Rows are added, updated and removed incrementally as the table is edited.
+    """
+
+    def __init__(self):
+        self.postings: dict[str, set[int]] = {}
+        self.short: dict[str, set[int]] = {}
+        self.tokens: list[str] = []
+        self.row_tokens: dict[int, set[str]] = {}
+        self._last_query = None
+        self._last_result = None
+
+    def build(self, table):
+        self.__init__()
+        self.add_rows(table.ids, table.iter_rows())
+
+    # ──────────────────────────────────────────────────────────
+    # incremental updates
+    # ──────────────────────────────────────────────────────────
+    def add_rows(self, row_ids, rows):
+        new_tokens = []
+        for row_id, row in zip(row_ids, rows):
+            toks = set()
+            for value in row:
+                if value:
+                    toks.update(tokenize(value))
+            self.row_tokens[row_id] = toks
+            for prefix in self._short_prefixes(toks):
+                self.short.setdefault(prefix, set()).add(row_id)
+            for tok in toks:
+                ids = self.postings.get(tok)
+                if ids is None:
+                    self.postings[tok] = {row_id}
+                    new_tokens.append(tok)
+                else:
+                    ids.add(row_id)
+
+        # bulk loads re-sort once, single edits insert in place
+        if len(new_tokens) > 64:
+            self.tokens = sorted(self.postings)
+        else:
+            for tok in new_tokens:
+                insort(self.tokens, tok)
+        self._last_query = None
+
+    def remove_rows(self, row_ids):
+        for row_id in row_ids:
+            toks = self.row_tokens.pop(row_id, ())
+            for prefix in self._short_prefixes(toks):
+                self.short[prefix].discard(row_id)
+            for tok in toks:
+                ids = self.postings[tok]
+                ids.discard(row_id)
+                if not ids:
+                    del self.postings[tok]
+                    i = bisect_left(self.tokens, tok)
+                    if i < len(self.tokens) and self.tokens[i] == tok:
+                        del self.tokens[i]
+        self._last_query = None
+
+    def update_row(self, row_id, row):
+        self.remove_rows([row_id])
+        self.add_rows([row_id], [row])
+
+    # ──────────────────────────────────────────────────────────
+    # query
+    # ──────────────────────────────────────────────────────────
+    @staticmethod
+    def _short_prefixes(toks):
+        return {tok[:n] for tok in toks for n in range(1, _SHORT_PREFIX + 1)}
+
+    def _prefix_ids(self, prefix):
+        if len(prefix) <= _SHORT_PREFIX:
+            return self.short.get(prefix, set())
+        result = set()
+        i = bisect_left(self.tokens, prefix)
+        while i < len(self.tokens) and self.tokens[i].startswith(prefix):
+            result |= self.postings[self.tokens[i]]
+            i += 1
+        return result
+
+    def search(self, query):
+        """
+        Row ids where every query token prefixes some token of the row, or
+        None for an empty query. Typing more characters narrows the previous
+        result instead of scanning the index again.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return None
+
+        last = self._last_query
+        if (last and len(last) == len(terms) and terms[:-1] == last[:-1]
+                and terms[-1].startswith(last[-1]) and len(self._last_result) <= _NARROW_LIMIT):
+            prefix = terms[-1]
+            result = {row_id for row_id in self._last_result
+                      if any(tok.startswith(prefix) for tok in self.row_tokens[row_id])}
+        else:
+            result = None
+            for term in sorted(terms, key=len, reverse=True):   # most selective first
+                ids = self._prefix_ids(term)
+                result = set(ids) if result is None else result & ids
+                if not result:
+                    break
+
+        self._last_query, self._last_result = terms, result
+        return result
@@ -0,0 +1,119 @@
+import csv
+import io
+
+
+class GlossaryTable:
+    """
+    Column-oriented, in-memory glossary: one list of strings per language.
+
+    Rows are never materialized as objects; views read single cells through
+    ``cell()`` and bulk edits touch each column list once. Every row also has
+    a stable id (``ids``) that survives inserts and deletes, for indexes.
+    """
+
+    def __init__(self, headers=None, columns=None):
+        self.headers = list(headers or [])
+        self.columns = columns if columns is not None else [[] for _ in self.headers]
+        self.ids = list(range(self.row_count()))
+        self._next_id = len(self.ids)
+        self._positions = None
+
+    # ──────────────────────────────────────────────────────────
+    # CSV round trip (semicolon separated, header row = language codes)
+    # ──────────────────────────────────────────────────────────
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a table from an iterable of CSV rows, the first being the headers."""
+        rows = iter(rows)
+        headers = [h.strip().lstrip('\ufeff') for h in next(rows, [])]
+        if not headers:
+            raise ValueError("Missing headers in glossary CSV")
+
+        width = len(headers)
+        columns = [[] for _ in headers]
+        for row in rows:
+            if not row:
+                continue
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            for column, value in zip(columns, row):
+                column.append(value)
+        return cls(headers, columns)
+
+    @classmethod
+    def from_csv(cls, path):
+        with open(path, newline="", encoding="utf-8") as fh:
+            return cls.from_rows(csv.reader(fh, delimiter=";"))
+
+    def iter_rows(self):
+        return zip(*self.columns) if self.columns else iter(())
+
+    def write_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh, delimiter=";")
+            writer.writerow(self.headers)
+            writer.writerows(self.iter_rows())
+
+    def to_csv_bytes(self):
+        """The exact bytes ``write_csv`` would produce."""
+        buf = io.StringIO(newline="")
+        writer = csv.writer(buf, delimiter=";")
+        writer.writerow(self.headers)
+        writer.writerows(self.iter_rows())
+        return buf.getvalue().encode("utf-8")
+
+    # ──────────────────────────────────────────────────────────
+    # access / edits
+    # ──────────────────────────────────────────────────────────
+    def copy(self):
+        """Snapshot for background writers – copies the column lists, not the strings."""
+        table = GlossaryTable(list(self.headers), [list(column) for column in self.columns])
+        table.ids, table._next_id = list(self.ids), self._next_id
+        return table
+
+    def row_count(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def cell(self, row, col):
+        return self.columns[col][row]
+
+    def set_cell(self, row, col, value):
+        self.columns[col][row] = value
+
+    def row(self, row):
+        return [column[row] for column in self.columns]
+
+    def insert_rows(self, position, rows):
+        """Insert *rows* (lists of values, one per header) at *position*; returns their ids."""
+        width = len(self.headers)
+        rows = [list(r) + [""] * (width - len(r)) for r in rows]
+        for col, column in enumerate(self.columns):
+            column[position:position] = [r[col] for r in rows]
+        new_ids = list(range(self._next_id, self._next_id + len(rows)))
+        self._next_id += len(rows)
+        self.ids[position:position] = new_ids
+        if position != len(self.ids) - len(rows):
+            self._positions = None
+        elif self._positions is not None:
+            self._positions.update((row_id, position + i) for i, row_id in enumerate(new_ids))
+        return new_ids
+
+    def delete_rows(self, rows):
+        """Delete the row indices in *rows* with a single pass per column."""
+        drop = set(rows)
+        if not drop:
+            return
+        for col, column in enumerate(self.columns):
+            self.columns[col] = [v for i, v in enumerate(column) if i not in drop]
+        self.ids = [v for i, v in enumerate(self.ids) if i not in drop]
+        self._positions = None
+
+    def position_of(self, row_id):
+        """Current row index of a stable row id (map rebuilt lazily after deletes)."""
+        if self._positions is None:
+            self._positions = {row_id: i for i, row_id in enumerate(self.ids)}
+        return self._positions.get(row_id)
+
+    def add_column(self, header):
+        self.headers.append(header)
+        self.columns.append([""] * self.row_count())
@@ -1,26 +1,12 @@
-import csv
-import os
+from functions.glossary_db import glossary_index
 
-def parse_glossary_to_map(path, source_lang, target_lang):
-    glossary = {}
-
-    with open(path, mode='r', encoding='utf-8') as file:
-        reader = csv.DictReader(file, delimiter=';', quotechar='"')
-
-        # Normalize headers
-        if reader.fieldnames:
-            headers = [h.strip().lstrip('\ufeff') for h in reader.fieldnames]
-            reader.fieldnames = headers
-        else:
-            raise ValueError("No headers found in glossary.")
+def read_glossary_pairs(path, source_lang, target_lang):
+    """
+    Return the (source, target) term pairs of *path* as written in the CSV,
+    skipping rows where either side is empty.
+    """
+    return glossary_index(path).pairs(source_lang, target_lang)
 
-        if source_lang not in headers or target_lang not in headers:
-            raise ValueError(f"Glossary does not contain '{source_lang}' and '{target_lang}' columns.")
-
-        for row in reader:
-            source = row.get(source_lang, "").strip().lower()
-            target = row.get(target_lang, "").strip()
-            if source and target:
-                glossary[source] = target
-
-    return glossary
\ No newline at end of file
+def parse_glossary_to_map(path, source_lang, target_lang):
+    """{lowercased source term: target term} for one language pair, served from the glossary index."""
+    return glossary_index(path).pair_map(source_lang, target_lang)
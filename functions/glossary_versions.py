@@ -0,0 +1,151 @@
+import gzip
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from functions.paths import app_data_dir
+
+# Content-defined chunking: a line whose CRC ends in 8 zero bits closes a chunk
+# (≈ 256 lines on average), so inserting a row only changes the chunk around it.
+_BOUNDARY_MASK = 0xFF
+_MAX_CHUNK_LINES = 2048
+
+
+def _chunks(data: bytes):
+    lines = data.splitlines(keepends=True)
+    start = 0
+    for i, line in enumerate(lines):
+        if (zlib.crc32(line) & _BOUNDARY_MASK) == 0 or i - start + 1 >= _MAX_CHUNK_LINES:
+            yield b"".join(lines[start:i + 1])
+            start = i + 1
+    if start < len(lines):
+        yield b"".join(lines[start:])
+
+
+def _write_atomic(path: Path, data: bytes):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+class GlossaryVersionStore:
+    """
+    Deduplicated glossary history inside ``<glossary dir>/versions``::
+
+        index.json              newest-first list of versions (one small read)
+        manifests/<id>.json     ordered chunk hashes of one version
+        objects/<ab>/<hash>.gz  gzip'd content-defined chunks, shared by all versions
+
+    A version id is the SHA-256 of the full CSV, so saving identical content
+    twice is a no-op, and storage grows with the edited chunks only.
+    """
+
+    def __init__(self, versions_dir):
+        self.root = Path(versions_dir)
+        self.index_path = self.root / "index.json"
+
+    # ──────────────────────────────────────────────────────────
+    # index
+    # ──────────────────────────────────────────────────────────
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {"versions": []}
+
+    def _save_index(self, index):
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.index_path, json.dumps(index, indent=1).encode("utf-8"))
+
+    def list_versions(self):
+        """Newest-first version entries: {id, timestamp, rows, bytes, label}."""
+        index = self._load_index()
+        if not index.get("legacy_imported"):
+            index = self._import_legacy(index)
+        return index["versions"]
+
+    # ──────────────────────────────────────────────────────────
+    # write
+    # ──────────────────────────────────────────────────────────
+    def add(self, data: bytes, timestamp=None, label=None):
+        """
+        Store *data* as the newest version. Returns the version id, or None
+        when it is identical to the latest version.
+        """
+        version_id = hashlib.sha256(data).hexdigest()
+        index = self._load_index()
+        if index["versions"] and index["versions"][0]["id"] == version_id:
+            return None
+
+        hashes = []
+        for chunk in _chunks(data):
+            digest = hashlib.sha256(chunk).hexdigest()
+            obj = self.root / "objects" / digest[:2] / f"{digest}.gz"
+            if not obj.exists():
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                _write_atomic(obj, gzip.compress(chunk))
+            hashes.append(digest)
+
+        manifest = self.root / "manifests" / f"{version_id}.json"
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(manifest, json.dumps(hashes).encode("utf-8"))
+
+        timestamp = timestamp or datetime.now()
+        index["versions"].insert(0, {
+            "id": version_id,
+            "timestamp": timestamp.isoformat(timespec="seconds"),
+            "rows": max(data.count(b"\n") - 1, 0),
+            "bytes": len(data),
+            "label": label or f"glossario_tecnico_{timestamp.strftime('%Y-%m-%d_%H-%M-%S')}",
+        })
+        self._save_index(index)
+        return version_id
+
+    def _import_legacy(self, index):
+        """Fold the old full timestamped copies into the store once, oldest first."""
+        legacy = sorted(self.root.glob("glossario_tecnico_*.csv"), key=lambda p: p.stat().st_mtime)
+        known = {v["id"] for v in index["versions"]}
+        for path in legacy:
+            data = path.read_bytes()
+            if hashlib.sha256(data).hexdigest() in known:
+                continue
+            stamp = datetime.fromtimestamp(path.stat().st_mtime)
+            self.add(data, timestamp=stamp, label=path.stem)
+
+        index = self._load_index()
+        # keep the list newest first, whatever order the imports happened in
+        index["versions"].sort(key=lambda v: v["timestamp"], reverse=True)
+        index["legacy_imported"] = True
+        self._save_index(index)
+        return index
+
+    # ──────────────────────────────────────────────────────────
+    # read
+    # ──────────────────────────────────────────────────────────
+    def read(self, version_id) -> bytes:
+        with open(self.root / "manifests" / f"{version_id}.json", encoding="utf-8") as fh:
+            hashes = json.load(fh)
+        parts = []
+        for digest in hashes:
+            with open(self.root / "objects" / digest[:2] / f"{digest}.gz", "rb") as fh:
+                parts.append(gzip.decompress(fh.read()))
+        data = b"".join(parts)
+        if hashlib.sha256(data).hexdigest() != version_id:
+            raise ValueError(f"Glossary version {version_id[:12]} is corrupted")
+        return data
+
+    def restore(self, version_id, dest):
+        _write_atomic(Path(dest), self.read(version_id))
+
+    def materialize(self, version_id) -> Path:
+        """Local CSV copy of a version (cached), for viewing."""
+        path = app_data_dir() / "glossary_versions" / f"{version_id}.csv"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, self.read(version_id))
+        return path
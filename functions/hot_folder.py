@@ -0,0 +1,261 @@
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from functions.settings import load_settings
+from functions.glossary_mirror import working_glossary_dir
+from functions.glossary_utils import parse_glossary_to_map
+from functions.deepl_glossary import ensure_deepl_glossary, release_deepl_glossary
+from functions.translation_pipeline import process_file
+from functions.job_journal import JobJournal
+from functions.admission import default_admission, estimate_job_bytes
+
+PROCESSED_DIR = "processed"
+FAILED_DIR = "failed"
+# stop() waits this long for the batch in progress; its job journals cover the rest
+STOP_TIMEOUT = 2.0
+# How often a job waiting for memory re-checks the admission queue
+ADMISSION_POLL = 2.0
+
+
+def _is_released(path):
+    """False while another process still holds the file open (Windows denies the rename)."""
+    try:
+        os.rename(path, path)
+        return True
+    except OSError:
+        return False
+
+
+class _ArrivalHandler(FileSystemEventHandler):
+    def __init__(self, service, folder):
+        self.service = service
+        self.folder = folder
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.service.notice(self.folder, event.src_path)
+
+    def on_modified(self, event):
+        self.on_created(event)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.service.notice(self.folder, event.dest_path)
+
+
+class HotFolderService:
+    """
+    Watch input folders and translate every DWG that lands in them.
+
+    A file is picked up only after its size and mtime have been stable for
+    ``debounce`` seconds and no other process holds it. Ready files are
+    coalesced per folder into batches, closed after ``batch_window`` seconds
+    without new arrivals (or at ``batch_max`` files). Each batch runs once per
+    configured language pair; results go to ``<output>/<LANG>/`` and inputs
+    are moved to ``processed/`` (``failed/`` when no pair succeeded) beside
+    a ``<name>.json`` of the per-pair outcomes. Each job waits for the
+    memory budget it shares with the GUI's translations (see admission.py).
+    Works headless (``main()``) or inside the GUI.
+    """
+
+    def __init__(self, folders=None, debounce=None, batch_window=None, batch_max=None, log=print):
+        settings = load_settings()
+        self.folders = folders if folders is not None else settings["hot_folders"]
+        self.debounce = debounce if debounce is not None else settings["hot_folder_debounce"]
+        self.batch_window = batch_window if batch_window is not None else settings["hot_folder_batch_window"]
+        self.batch_max = batch_max or settings["hot_folder_batch_max"]
+        self.log = log
+        self.admission = default_admission()    # one memory budget with the GUI's translations
+
+        self._pending = {}      # path -> (folder cfg, (size, mtime), stable since)
+        self._ready = {}        # input dir -> [paths]
+        self._last_ready = {}   # input dir -> time of last addition
+        self._active = set()    # paths of the batch being processed
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._observer = None
+        self._thread = None
+
+    # ──────────────────────────────────────────────────────────
+    # lifecycle
+    # ──────────────────────────────────────────────────────────
+    def start(self):
+        self._observer = Observer()
+        for folder in self.folders:
+            src = Path(folder["input"])
+            src.mkdir(parents=True, exist_ok=True)
+            self._observer.schedule(_ArrivalHandler(self, folder), str(src), recursive=False)
+            for path in src.iterdir():          # drawings that arrived while we were not running
+                self.notice(folder, str(path))
+        self._observer.start()
+        self._thread = threading.Thread(target=self._loop, name="hot-folder", daemon=True)
+        self._thread.start()
+        self.log(f"🔹 Hot folder watching: {', '.join(f['input'] for f in self.folders)}")
+
+    def stop(self):
+        """
+        Stop watching and ask the batch loop to finish. A conversion in
+        progress is not waited for: the thread is a daemon, its files stay in
+        the input folder and their job journals resume them on the next start.
+        """
+        self._stop.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(STOP_TIMEOUT)
+        if self._thread:
+            self._thread.join(STOP_TIMEOUT)
+            if self._thread.is_alive():
+                self.log("🔹 Hot folder: batch interrupted, it resumes on the next start")
+
+    # ──────────────────────────────────────────────────────────
+    # arrivals
+    # ──────────────────────────────────────────────────────────
+    def notice(self, folder, path):
+        if not path.lower().endswith(".dwg") or not os.path.isfile(path):
+            return
+        with self._lock:
+            if path in self._active or any(path in paths for paths in self._ready.values()):
+                return
+            self._pending[path] = (folder, None, time.monotonic())
+
+    def _check_pending(self, now):
+        for path, (folder, stamp, since) in list(self._pending.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self._pending[path]     # moved away / deleted
+                continue
+            current = (st.st_size, st.st_mtime_ns)
+            if current != stamp:
+                self._pending[path] = (folder, current, now)    # still being written
+            elif now - since >= self.debounce and _is_released(path):
+                del self._pending[path]
+                self._ready.setdefault(folder["input"], []).append(path)
+                self._last_ready[folder["input"]] = now
+
+    def _due_batches(self, now):
+        due = []
+        for folder in self.folders:
+            key = folder["input"]
+            paths = self._ready.get(key)
+            if paths and (len(paths) >= self.batch_max or now - self._last_ready[key] >= self.batch_window):
+                batch, self._ready[key] = paths[:self.batch_max], paths[self.batch_max:]
+                self._active.update(batch)
+                due.append((folder, batch))
+        return due
+
+    def _loop(self):
+        while not self._stop.wait(1.0):
+            now = time.monotonic()
+            with self._lock:
+                self._check_pending(now)
+                due = self._due_batches(now)
+            for folder, batch in due:
+                try:
+                    self.run_batch(folder, batch)
+                finally:
+                    with self._lock:
+                        self._active.difference_update(batch)
+
+    # ──────────────────────────────────────────────────────────
+    # processing
+    # ──────────────────────────────────────────────────────────
+    def _admit(self, path):
+        """Wait until the shared admission queue has memory for *path*; None once stopped."""
+        job, admitted = object(), threading.Event()
+        estimate = estimate_job_bytes(path)
+        if not self.admission.submit(job, estimate, admitted.set):
+            self.log(f"⏳ Hot folder: {Path(path).name} waits for memory (~{estimate // 2**20} MB)")
+        while not admitted.wait(ADMISSION_POLL):
+            if self._stop.is_set():
+                self.admission.cancel(job)
+                if admitted.is_set():       # admitted just now
+                    self.admission.release(job)
+                return None
+            self.admission.pump()       # live RSS changes without events
+        if self._stop.is_set():
+            self.admission.release(job)
+            return None
+        return job
+
+    def run_batch(self, folder, paths):
+        self.log(f"🔹 Hot folder batch: {len(paths)} file(s) from {folder['input']}")
+        output_root = Path(folder.get("output") or Path(folder["input"]) / "translated")
+        outcomes = {path: {} for path in paths}     # path -> {"IT>EN": "ok" | error}
+
+        for source_lang, target_lang in folder["pairs"]:
+            pair = f"{source_lang.upper()}>{target_lang.upper()}"
+            glossary_path = working_glossary_dir() / "glossario_tecnico.csv"
+            glossary_map, glossary_id = {}, None
+            if glossary_path.exists():
+                try:
+                    glossary_map = parse_glossary_to_map(glossary_path, source_lang, target_lang)
+                    glossary_id = ensure_deepl_glossary(glossary_path, source_lang, target_lang, log=self.log)
+                except Exception as err:
+                    self.log(f"⚠️ Glossary not used for {pair}: {err}")
+
+            try:
+                lang_dir = output_root / target_lang.upper()
+                lang_dir.mkdir(parents=True, exist_ok=True)
+                for path in paths:
+                    job = self._admit(path)
+                    if job is None:
+                        return      # stopped: files stay in the input folder; the journals resume them
+                    journal = None
+                    try:
+                        journal = JobJournal.begin(path, source_lang, target_lang, origin="hot_folder",
+                                                   output_folder=str(lang_dir))
+                        result = process_file(path, source_lang, target_lang, glossary_map, str(lang_dir),
+                                              log=self.log, glossary_id=glossary_id, journal=journal)
+                        shutil.move(result, lang_dir / Path(result).name)
+                        outcomes[path][pair] = "ok"
+                    except Exception as err:
+                        self.log(f"❌ Hot folder: {Path(path).name} ({pair}): {err}")
+                        outcomes[path][pair] = str(err)
+                    finally:
+                        if journal:
+                            journal.close()
+                        self.admission.release(job)
+            finally:
+                release_deepl_glossary(glossary_id)
+
+        done = 0
+        for path, results in outcomes.items():
+            ok = [pair for pair, result in results.items() if result == "ok"]
+            done += len(ok) == len(results)
+            # only a file no pair could translate counts as failed; the outcome file says which pairs did
+            dest = Path(path).parent / (PROCESSED_DIR if ok else FAILED_DIR)
+            dest.mkdir(exist_ok=True)
+            try:
+                os.replace(path, dest / Path(path).name)
+                with open(dest / f"{Path(path).name}.json", "w", encoding="utf-8") as fh:
+                    json.dump(results, fh, indent=2, ensure_ascii=False)
+            except OSError as err:
+                self.log(f"⚠️ Could not move {path}: {err}")
+        self.log(f"✅ Hot folder batch done: {done} ok, {len(paths) - done} with failed pairs")
+
+
+def main():
+    """Headless mode: ``python -m functions.hot_folder``."""
+    service = HotFolderService()
+    if not service.folders:
+        print("❌ No hot folders configured (settings.json → hot_folders).")
+        return
+    service.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n🔹 Stopping hot folder...")
+        service.stop()
+
+
+if __name__ == "__main__":
+    main()
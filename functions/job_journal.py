@@ -0,0 +1,220 @@
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from functions.paths import app_data_dir
+from functions.translation_memory import default_memory
+
+# Journals of finished or abandoned jobs are kept this long
+KEEP_FINISHED = 7 * 24 * 3600
+
+_open_jobs = set()      # journal paths in use by this process
+_open_lock = threading.Lock()
+
+
+def journal_dir() -> Path:
+    path = app_data_dir() / "jobs"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _job_key(input_path, source_lang, target_lang):
+    """Same file content (path, size, mtime) and language pair → same job."""
+    path = os.path.abspath(str(input_path))
+    st = os.stat(path)
+    return [path, st.st_size, st.st_mtime_ns, source_lang or "", target_lang]
+
+
+def _read_events(path):
+    events = []
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue        # torn line of a crash
+    except OSError:
+        pass
+    return events
+
+
+class JobJournal:
+    """
+    Append-only JSONL record of one translation job in ``app_data_dir/jobs``.
+
+    Every stage completion and every batch of translated segments is written
+    and fsync'd as it happens, so after a crash or sleep the job can pick up
+    at its last stage whose files still exist, and the segments DeepL was
+    already paid for go back into the translation memory.
+    """
+
+    def __init__(self, path, events):
+        self.path = Path(path)
+        self.events = events
+        self._lock = threading.Lock()
+
+    # ──────────────────────────────────────────────────────────
+    # opening
+    # ──────────────────────────────────────────────────────────
+    @classmethod
+    def begin(cls, input_path, source_lang, target_lang, **details):
+        """Reopen the interrupted journal of the same job, or start a new one."""
+        key = _job_key(input_path, source_lang, target_lang)
+        with _open_lock:
+            for journal in interrupted_jobs():
+                if journal.key == key:
+                    _open_jobs.add(str(journal.path))
+                    journal.append({"event": "resumed"}, fresh_line=True)
+                    return journal
+            path = journal_dir() / f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}.jsonl"
+            _open_jobs.add(str(path))
+        journal = cls(path, [])
+        journal.append({"event": "started", "key": key, **details})
+        return journal
+
+    def close(self):
+        with _open_lock:
+            _open_jobs.discard(str(self.path))
+
+    # ──────────────────────────────────────────────────────────
+    # state
+    # ──────────────────────────────────────────────────────────
+    @property
+    def header(self):
+        return self.events[0] if self.events else {}
+
+    @property
+    def key(self):
+        return self.header.get("key")
+
+    @property
+    def input_path(self):
+        return self.key[0]
+
+    @property
+    def source_lang(self):
+        return self.key[3]
+
+    @property
+    def target_lang(self):
+        return self.key[4]
+
+    def is_current(self):
+        """False once the input file is gone or has changed since the job started."""
+        try:
+            return _job_key(self.input_path, self.source_lang, self.target_lang) == self.key
+        except OSError:
+            return False
+
+    def last(self, event):
+        return next((e for e in reversed(self.events) if e["event"] == event), None)
+
+    @property
+    def finished(self):
+        return any(e["event"] in ("done", "failed", "abandoned") for e in self.events)
+
+    def resume_point(self):
+        """(stage, file) of the furthest stage whose intermediate file is still intact, or None."""
+        for stage in ("dxf_saved", "converted"):
+            event = self.last(stage)
+            if event and event.get("file"):
+                try:
+                    if os.path.getsize(event["file"]) == event["size"]:
+                        return stage, Path(event["file"])
+                except OSError:
+                    continue
+        return None
+
+    def segments(self):
+        """All (sources, targets, variant) batches recorded so far."""
+        for event in self.events:
+            if event["event"] == "segments":
+                yield event["sources"], event["targets"], event.get("variant", "")
+
+    # ──────────────────────────────────────────────────────────
+    # recording
+    # ──────────────────────────────────────────────────────────
+    def append(self, event, fresh_line=False):
+        event = {"time": time.time(), **event}
+        line = json.dumps(event, ensure_ascii=False) + "\n"
+        if fresh_line:
+            line = "\n" + line     # after a crash the last line may be torn
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+                fh.flush()
+                os.fsync(fh.fileno())
+            self.events.append(event)
+
+    def stage(self, stage, file=None, **details):
+        """Record a completed stage; *file* is the intermediate it produced."""
+        if file is not None:
+            details.update(file=str(file), size=os.path.getsize(file))
+        self.append({"event": stage, **details})
+
+    def fail(self, error):
+        self.append({"event": "failed", "error": str(error)})
+
+    def abandon(self):
+        self.append({"event": "abandoned"})
+        self.close()
+
+    def memory(self, memory=None):
+        """*memory* with every store also journaled; replays earlier segments into it first."""
+        memory = memory or default_memory()
+        for sources, targets, variant in self.segments():
+            memory.store(self.source_lang, self.target_lang, sources, targets, variant)
+        return _JournaledMemory(memory, self)
+
+
+class _JournaledMemory:
+    """TranslationMemory stand-in that writes each stored batch to the journal first."""
+
+    def __init__(self, memory, journal):
+        self._memory = memory
+        self._journal = journal
+
+    def lookup(self, source_lang, target_lang, segments, variant=""):
+        return self._memory.lookup(source_lang, target_lang, segments, variant)
+
+    def store(self, source_lang, target_lang, sources, targets, variant=""):
+        self._journal.append({"event": "segments", "sources": list(sources), "targets": list(targets),
+                              "variant": variant})
+        self._memory.store(source_lang, target_lang, sources, targets, variant)
+
+
+def interrupted_jobs():
+    """
+    Journals without a final event that no job of this process is using,
+    oldest first. Old finished journals are pruned on the way.
+    """
+    jobs, cutoff = [], time.time() - KEEP_FINISHED
+    for path in sorted(journal_dir().glob("*.jsonl")):
+        if str(path) in _open_jobs:
+            continue
+        events = _read_events(path)
+        journal = JobJournal(path, events)
+        if not events or journal.finished:
+            try:
+                if path.stat().st_mtime < cutoff or not events:
+                    path.unlink()
+            except OSError:
+                pass
+            continue
+        jobs.append(journal)
+    return jobs
+
+
+def pending_files():
+    """Intermediate files recorded by every unfinished journal, this process's included."""
+    files = set()
+    for path in journal_dir().glob("*.jsonl"):
+        journal = JobJournal(path, _read_events(path))
+        if journal.events and not journal.finished:
+            files.update(e["file"] for e in journal.events if e.get("file"))
+    return files
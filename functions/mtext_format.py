@@ -0,0 +1,214 @@
+import re
+
+# Inline codes that take an argument terminated by ";"  (\fArial|b1; \H2.5x; \S1/2; …)
+_ARG_CODES = set("fFHWQTACcpS")
+# Escaped literals
+_ESCAPES = {"\\": "\\", "{": "{", "}": "}"}
+# %%-codes that AutoCAD renders as symbols
+_SPECIAL_CHARS = {"%%c": "Ø", "%%C": "Ø", "%%d": "°", "%%D": "°", "%%p": "±", "%%P": "±"}
+_SPECIAL_RE = re.compile(r"%%[cCdDpP]")
+
+
+class MTextContent:
+    """
+    MTEXT content split into formatting runs and text runs.
+
+    ``runs`` is a list of ``(kind, value)`` tuples: ``("fmt", raw_code)`` is
+    copied back verbatim, ``("text", plain)`` holds decoded text that may be
+    translated. ``units()`` gives one translation unit per paragraph, with
+    inline codes as XML tags so a sentence is never cut at a bold word;
+    ``rebuild()`` maps the translated units back onto the codes.
+    """
+
+    def __init__(self, runs):
+        self.runs = runs
+
+    def text_runs(self):
+        """Plain text of every text run, in order."""
+        return [value for kind, value in self.runs if kind == "text"]
+
+    def plain_text(self):
+        parts = []
+        for kind, value in self.runs:
+            if kind == "text":
+                parts.append(value)
+            elif value == "\\P":
+                parts.append("\n")
+            elif value == "\\~":
+                parts.append(" ")
+        return "".join(parts)
+
+    def has_formatting(self):
+        return any(kind == "fmt" for kind, _ in self.runs)
+
+    def _paragraphs(self):
+        """Runs split at \\P as ``(leading codes, middle runs, trailing codes)``."""
+        paragraphs, current = [], []
+        for run in self.runs + [("fmt", "\\P")]:
+            if run != ("fmt", "\\P"):
+                current.append(run)
+                continue
+            texts = [i for i, (kind, _) in enumerate(current) if kind == "text"]
+            if texts:
+                paragraphs.append((current[:texts[0]], current[texts[0]:texts[-1] + 1], current[texts[-1] + 1:]))
+            else:
+                paragraphs.append((current, [], []))
+            current = []
+        return paragraphs
+
+    def units(self):
+        """
+        ``(text, markup)`` per paragraph with text. A paragraph without inline
+        codes is plain text; otherwise *markup* is True and the text is XML
+        with each code as ``<m i="n"/>``, for DeepL's ``tag_handling="xml"``.
+        """
+        units = []
+        for _, middle, _ in self._paragraphs():
+            if not middle:
+                continue
+            if len(middle) == 1:
+                units.append((middle[0][1], False))
+                continue
+            parts, codes = [], 0
+            for kind, value in middle:
+                if kind == "text":
+                    parts.append(_xml_escape(value))
+                else:
+                    parts.append(f'<m i="{codes}"/>')
+                    codes += 1
+            units.append(("".join(parts), True))
+        return units
+
+    def rebuild(self, translated_units):
+        """Return raw MTEXT with *translated_units* (one per ``units()`` entry) in place of the text."""
+        translated = iter(translated_units)
+        paragraphs = []
+        for leading, middle, trailing in self._paragraphs():
+            out = [value for _, value in leading]
+            if len(middle) == 1:
+                out.append(_padded(middle[0][1], next(translated, middle[0][1])))
+            elif middle:
+                out.append(_rebuild_markup(middle, next(translated, None)))
+            out.extend(value for _, value in trailing)
+            paragraphs.append("".join(out))
+        return "\\P".join(paragraphs)
+
+
+def _padded(original, new):
+    """*new* with the padding of *original* – it is layout, not content."""
+    if not new.strip():
+        return _escape(original)
+    lead = original[: len(original) - len(original.lstrip())]
+    trail = original[len(original.rstrip()):]
+    return _escape(lead + new.strip() + trail)
+
+
+def _lowest_depth(codes):
+    """Lowest brace nesting reached while emitting *codes* in order."""
+    depth = lowest = 0
+    for code in codes:
+        for ch in code:
+            depth += {"{": 1, "}": -1}.get(ch, 0)
+            lowest = min(lowest, depth)
+    return lowest
+
+
+def _rebuild_markup(middle, translated):
+    """
+    Put the codes of *middle* back where the translated XML has their tags.
+    If a tag was lost or duplicated, or moved so that a group would close
+    before it opens, the translated words are kept and the codes follow them
+    in their original order.
+    """
+    codes = [value for kind, value in middle if kind == "fmt"]
+    original = "".join(value for kind, value in middle if kind == "text")
+    if translated is None:
+        return "".join(_escape(v) if k == "text" else v for k, v in middle)
+    pieces = _MARKUP_TAG.split(translated)
+    texts, order = [_xml_unescape(t) for t in pieces[::2]], [int(i) for i in pieces[1::2]]
+    if sorted(order) != list(range(len(codes))) \
+            or _lowest_depth(codes[i] for i in order) < _lowest_depth(codes):
+        return _padded(original, "".join(texts)) + "".join(codes)
+    out = [_escape(texts[0])]
+    for i, text in zip(order, texts[1:]):
+        out.append(codes[i])
+        out.append(_escape(text))
+    return "".join(out)
+
+
+_MARKUP_TAG = re.compile(r'<m i="(\d+)"\s*/>')
+_XML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"))
+
+
+def strip_markup(unit):
+    """Plain text of a markup unit: code tags dropped, XML entities decoded."""
+    return _xml_unescape(_MARKUP_TAG.sub("", unit))
+
+
+def _xml_escape(text):
+    for char, entity in _XML_ESCAPES:
+        text = text.replace(char, entity)
+    return text
+
+
+def _xml_unescape(text):
+    for char, entity in reversed(_XML_ESCAPES):
+        text = text.replace(entity, char)
+    return text
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("{", "\\{").replace("}", "\\}")
+
+
+def parse_mtext(raw):
+    """Tokenize raw MTEXT content into an :class:`MTextContent`."""
+    runs = []
+    buf = []
+
+    def flush_text():
+        if buf:
+            runs.append(("text", _SPECIAL_RE.sub(lambda m: _SPECIAL_CHARS[m.group()], "".join(buf))))
+            buf.clear()
+
+    def add_fmt(code):
+        flush_text()
+        # paragraph breaks and hard spaces stay runs of their own (see plain_text / units)
+        if runs and runs[-1][0] == "fmt" and "\\P" not in (code, runs[-1][1]) \
+                and "\\~" not in (code, runs[-1][1]):
+            runs[-1] = ("fmt", runs[-1][1] + code)
+        else:
+            runs.append(("fmt", code))
+
+    i, n = 0, len(raw)
+    while i < n:
+        ch = raw[i]
+        if ch in "{}":
+            add_fmt(ch)
+            i += 1
+        elif raw.startswith("<>", i):
+            # dimension measurement placeholder
+            add_fmt("<>")
+            i += 2
+        elif ch == "\\":
+            code = raw[i + 1:i + 2]
+            if code in _ESCAPES:
+                buf.append(_ESCAPES[code])
+                i += 2
+            elif code == "U" and raw[i + 2:i + 3] == "+" and re.fullmatch(r"[0-9A-Fa-f]{4}", raw[i + 3:i + 7]):
+                buf.append(chr(int(raw[i + 3:i + 7], 16)))
+                i += 7
+            elif code and code in _ARG_CODES:
+                end = raw.find(";", i + 2)
+                end = n - 1 if end == -1 else end
+                add_fmt(raw[i:end + 1])
+                i = end + 1
+            else:
+                # \P, \~, toggles and anything unknown are copied back verbatim
+                add_fmt(raw[i:i + 2])
+                i += 2
+        else:
+            buf.append(ch)
+            i += 1
+    flush_text()
+    return MTextContent(runs)
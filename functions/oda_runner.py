@@ -0,0 +1,275 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from functions.paths import app_data_dir
+
+# Timeout = base + per-MB allowance, capped
+BASE_TIMEOUT = 60
+SECONDS_PER_MB = 4
+MAX_TIMEOUT = 30 * 60
+DEFAULT_VERSION = "ACAD2018"
+# Files handed to one ODA invocation by convert_group
+GROUP_SIZE = 20
+# Rough working set of one ODAFileConverter process, for sizing the pool
+ODA_PROCESS_MB = 700
+# Extensions ODA may give each output format; DXB is binary DXF
+OUTPUT_EXTENSIONS = {"DWG": (".dwg",), "DXF": (".dxf",), "DXB": (".dxb", ".dxf")}
+
+_log_lock = threading.Lock()
+
+
+class ODAConversionError(RuntimeError):
+    pass
+
+
+class ODATimeoutError(ODAConversionError):
+    """ODA hung and was killed – retrying (with audit or another format) would hang again."""
+
+
+def oda_converter_path():
+    """ODAFileConverter.exe, from the PyInstaller bundle or the working directory."""
+    base = getattr(sys, "_MEIPASS", os.path.abspath("."))
+    return os.path.join(base, "ODA", "ODAFileConverter.exe")
+
+
+def conversion_timeout(size_bytes):
+    return min(BASE_TIMEOUT + SECONDS_PER_MB * size_bytes / (1024 * 1024), MAX_TIMEOUT)
+
+
+def _kill_tree(proc):
+    """Kill the converter and anything it spawned."""
+    if sys.platform == "win32":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(proc.pid, 9)
+        except OSError:
+            proc.kill()
+    proc.wait()
+
+
+def run_oda(input_folder, output_folder, fmt, file_filter, version=DEFAULT_VERSION, audit=False, timeout=None):
+    """
+    One ODAFileConverter invocation. Returns the exit code; raises
+    subprocess.TimeoutExpired after killing the process tree on timeout.
+    """
+    command = [
+        oda_converter_path(),
+        str(input_folder),
+        str(output_folder),
+        version,                # Output version
+        fmt,                    # Format
+        "0",                    # No recursion
+        "1" if audit else "0",  # Audit
+        file_filter,            # Filter (filename)
+    ]
+    kwargs = {"start_new_session": True} if sys.platform != "win32" else {}
+    proc = subprocess.Popen(command, **kwargs)
+    try:
+        return proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_tree(proc)
+        raise
+
+
+def _find_output(folder, stem, fmt):
+    """The output for *stem* in a private ODA output *folder*; ODA may nest it one folder down."""
+    folder = Path(folder)
+    for ext in OUTPUT_EXTENSIONS.get(fmt.upper(), ("." + fmt.lower(),)):
+        name = stem + ext
+        for path in [folder / name, *folder.glob(f"*/{name}")]:
+            if path.is_file():
+                return path
+    return None
+
+
+def _private_output(output_folder):
+    """A fresh folder next to the results for one ODA run, so nothing else can be taken for its output."""
+    path = Path(output_folder) / f".oda-{uuid.uuid4().hex[:12]}"
+    path.mkdir(parents=True)
+    return path
+
+
+def _deliver(output, output_folder, stem):
+    """Move *output* out of its private folder to ``<output_folder>/<stem><ext>``."""
+    return Path(output).replace(Path(output_folder) / (stem + Path(output).suffix))
+
+
+def record_conversion(entry):
+    """Append one conversion outcome to ``oda_conversions.jsonl`` in the app data dir."""
+    entry = {"time": datetime.now().isoformat(timespec="seconds"), **entry}
+    with _log_lock:
+        with open(app_data_dir() / "oda_conversions.jsonl", "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry) + "\n")
+
+
+def convert_file(input_file, output_folder, fmt, version=DEFAULT_VERSION, log=None, output_stem=None):
+    """
+    Convert one file with ODA: a fast attempt without audit first, then one
+    retry with audit if it failed or produced nothing. A timeout raises
+    ODATimeoutError at once, so a hung file blocks a worker only once. Returns the
+    output path, ``<output_folder>/<output_stem or input stem><ext>``; every
+    attempt is recorded with its duration.
+    """
+    input_file = os.path.abspath(str(input_file))
+    if not os.path.exists(input_file):
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    os.makedirs(output_folder, exist_ok=True)
+
+    size = os.path.getsize(input_file)
+    timeout = conversion_timeout(size)
+    stem = os.path.splitext(os.path.basename(input_file))[0]
+    errors = []
+
+    for audit in (False, True):
+        start = time.time()
+        outcome = "ok"
+        private = _private_output(output_folder)
+        try:
+            code = run_oda(os.path.dirname(input_file), private, fmt,
+                           os.path.basename(input_file), version, audit, timeout)
+            output = _find_output(private, stem, fmt)
+            if code != 0 or output is None:
+                outcome = f"exit {code}" if code != 0 else "no output"
+            else:
+                output = _deliver(output, output_folder, output_stem or stem)
+        except subprocess.TimeoutExpired:
+            output, outcome = None, f"timeout {timeout:.0f}s"
+        except OSError as err:
+            output, outcome = None, f"error {err}"
+        finally:
+            shutil.rmtree(private, ignore_errors=True)
+
+        seconds = round(time.time() - start, 2)
+        record_conversion({"file": input_file, "bytes": size, "format": fmt, "audit": audit,
+                           "seconds": seconds, "outcome": outcome})
+        if outcome == "ok":
+            return output
+        errors.append(f"{'audit' if audit else 'fast'}: {outcome}")
+        if outcome.startswith("timeout"):
+            raise ODATimeoutError(f"ODA conversion timed out for {input_file} ({'; '.join(errors)})")
+        if log:
+            log(f"⚠️ ODA {fmt} conversion of {os.path.basename(input_file)} failed ({outcome})"
+                + ("" if audit else ", retrying with audit..."))
+
+    raise ODAConversionError(f"ODA conversion failed for {input_file} ({'; '.join(errors)})")
+
+
+# ──────────────────────────────────────────────────────────────
+# bulk conversion
+# ──────────────────────────────────────────────────────────────
+def conversion_pool_size():
+    """Concurrent ODA processes: one per core, fewer if free memory cannot hold them."""
+    cores = os.cpu_count() or 2
+    try:
+        import psutil
+        by_memory = int(psutil.virtual_memory().available / (ODA_PROCESS_MB * 1024 * 1024))
+    except ImportError:
+        by_memory = cores
+    return max(1, min(cores, by_memory))
+
+
+def output_stems(files):
+    """
+    Output name (without extension) for each of *files*, unique across the
+    whole batch: same-named files from different folders get `` (2)``, `` (3)``…
+    """
+    stems, taken = {}, set()
+    for path in files:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        candidate, n = stem, 1
+        while candidate.lower() in taken:
+            n += 1
+            candidate = f"{stem} ({n})"
+        taken.add(candidate.lower())
+        stems[path] = candidate
+    return stems
+
+
+def plan_groups(files, group_size=GROUP_SIZE):
+    """
+    Split *files* into groups of at most *group_size* that share an extension
+    (one ODA filter) and never repeat a file name (one staging folder).
+    """
+    groups = []
+    for path in files:
+        name = os.path.basename(path).lower()
+        ext = os.path.splitext(name)[1]
+        target = next((g for g in groups if g["ext"] == ext and len(g["files"]) < group_size
+                       and name not in g["files"]), None)
+        if target is None:
+            target = {"ext": ext, "files": {}}
+            groups.append(target)
+        target["files"][name] = path
+    return [list(g["files"].values()) for g in groups]
+
+
+def convert_group(files, output_folder, fmt, version=DEFAULT_VERSION, log=None, stems=None):
+    """
+    Convert several files with a single ODA run over a staging folder of
+    hardlinks, instead of one process start per file. The run writes to its
+    own folder; each result is then moved to ``<output_folder>/<stem><ext>``,
+    with *stems* (see ``output_stems``) naming them when groups of one batch
+    share the output folder. Files that cannot be linked, or that the group
+    run did not produce, fall back to ``convert_file`` (with its audit
+    retry). Returns {input: output path or exception}.
+    """
+    stems = stems or output_stems(files)
+    results = {}
+    stage = app_data_dir() / "convert" / uuid.uuid4().hex
+    stage.mkdir(parents=True)
+    private = None
+    try:
+        staged = {}
+        for path in files:
+            try:
+                os.link(path, stage / os.path.basename(path))
+                staged[path] = os.path.basename(path)
+            except OSError:
+                pass
+
+        if len(staged) > 1:
+            os.makedirs(output_folder, exist_ok=True)
+            private = _private_output(output_folder)
+            size = sum(os.path.getsize(p) for p in staged)
+            timeout = min(BASE_TIMEOUT + SECONDS_PER_MB * size / (1024 * 1024), MAX_TIMEOUT * 2)
+            start = time.time()
+            try:
+                code = run_oda(stage, private, fmt, "*" + os.path.splitext(next(iter(staged.values())))[1],
+                               version, False, timeout)
+                outcome = "ok" if code == 0 else f"exit {code}"
+            except subprocess.TimeoutExpired:
+                outcome = f"timeout {timeout:.0f}s"
+            except OSError as err:
+                outcome = f"error {err}"
+            record_conversion({"file": f"{len(staged)} files from {os.path.dirname(files[0])}", "bytes": size,
+                               "format": fmt, "audit": False, "seconds": round(time.time() - start, 2),
+                               "outcome": outcome})
+            for path, name in staged.items():
+                output = _find_output(private, os.path.splitext(name)[0], fmt)
+                if output is not None:
+                    try:
+                        results[path] = _deliver(output, output_folder, stems[path])
+                    except OSError:
+                        pass
+    finally:
+        shutil.rmtree(stage, ignore_errors=True)
+        if private:
+            shutil.rmtree(private, ignore_errors=True)
+
+    for path in files:
+        if path not in results:
+            try:
+                results[path] = convert_file(path, output_folder, fmt, version, log, stems[path])
+            except Exception as err:
+                results[path] = err
+    return results
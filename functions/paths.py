@@ -2,8 +2,15 @@
 from __future__ import annotations
 
 import sys, os
+import threading
+import time
 from pathlib import Path
 
+# How long a resolved glossary directory / share probe result stays valid
+GLOSSARY_DIR_TTL = 60.0
+# First-time callers wait at most this long for the share probe
+SHARE_PROBE_WAIT = 2.0
+
 # ──────────────────────────────────────────────────────────────
 # helpers
 # ──────────────────────────────────────────────────────────────
@@ -54,23 +61,71 @@ def glossary_paths() -> tuple[Path, Path]:
     return _local_glossary_dir(), _network_glossary_dir()
 
 
-def get_glossary_dir() -> Path:
+# ──────────────────────────────────────────────────────────────
+# network share health (probed off the calling thread)
+# ──────────────────────────────────────────────────────────────
+_share_lock = threading.Lock()
+_share_state = {"ok": None, "checked": 0.0}
+_share_probe: threading.Thread | None = None
+
+
+def _probe_share() -> None:
+    ok = _safe_mkdir(_network_glossary_dir())   # may block for the SMB timeout
+    with _share_lock:
+        _share_state.update(ok=ok, checked=time.monotonic())
+
+
+def share_available(wait: float = 0.0) -> bool | None:
     """
-    Return the first directory (local → network) that exists **and** is writable.
-    Falls back to the local folder if the share is offline / read-only.
+    Last known health of the network glossary share (None = not probed yet).
+    A stale result triggers a background probe; when there is no result at
+    all yet, *wait* bounds how long the caller is willing to block for it.
     """
-    primary, fallback = glossary_paths()
+    global _share_probe
+    with _share_lock:
+        stale = time.monotonic() - _share_state["checked"] > GLOSSARY_DIR_TTL
+        if stale and (_share_probe is None or not _share_probe.is_alive()):
+            _share_probe = threading.Thread(target=_probe_share, name="share-probe", daemon=True)
+            _share_probe.start()
+        probe, known = _share_probe, _share_state["ok"] is not None
+    if wait and not known and probe is not None and probe.is_alive():
+        probe.join(wait)
+    with _share_lock:
+        return _share_state["ok"]
+
 
-    if _safe_mkdir(primary):
-        return primary      # ✅ local path is fine
+_resolved_lock = threading.Lock()
+_resolved: tuple[Path | None, float] = (None, 0.0)
 
-    if _safe_mkdir(fallback):
-        return fallback     # ✅ remote share is alive / writable
 
-    # Last-ditch effort – use a sub-folder in the user’s HOME to avoid crashing
-    home_fallback = Path.home() / "AMS-Translator-Glossaries"
-    _safe_mkdir(home_fallback)
-    return home_fallback
+def get_glossary_dir(refresh: bool = False) -> Path:
+    """
+    Return the first directory (local → network) that exists **and** is writable.
+    Falls back to the local folder if the share is offline / read-only.
+
+    The answer is cached for GLOSSARY_DIR_TTL seconds, and the share is only
+    ever touched by the background probe, so an unreachable server costs at
+    most SHARE_PROBE_WAIT here instead of the full SMB timeout.
+    """
+    global _resolved
+    with _resolved_lock:
+        cached, at = _resolved
+        if cached is not None and not refresh and time.monotonic() - at < GLOSSARY_DIR_TTL:
+            return cached
+
+        primary, fallback = glossary_paths()
+
+        if _safe_mkdir(primary):
+            result = primary        # ✅ local path is fine
+        elif share_available(wait=SHARE_PROBE_WAIT):
+            result = fallback       # ✅ remote share is alive / writable
+        else:
+            # Last-ditch effort – use a sub-folder in the user’s HOME to avoid crashing
+            result = Path.home() / "AMS-Translator-Glossaries"
+            _safe_mkdir(result)
+
+        _resolved = (result, time.monotonic())
+        return result
 
 def resource_path(relative_path: str) -> str:
     """Get absolute path to resource inside PyInstaller bundle or locally."""
@@ -83,6 +138,17 @@ def resource_path(relative_path: str) -> str:
 
     return str(base_path / relative_path)
 
+def app_data_dir() -> Path:
+    """
+    Per-user folder for caches and state that must survive updates:
+    • %LOCALAPPDATA%\AMS-Translator  (Windows)
+    • ~/.ams-translator              (elsewhere)
+    """
+    base = os.environ.get("LOCALAPPDATA")
+    path = Path(base) / "AMS-Translator" if base else Path.home() / ".ams-translator"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 def _desktop_folder() -> Path:
     """Return the user’s Desktop (cross-locale, cross-Windows-version)."""
     # Works on Windows 7-11; falls back to HOME if Desktop cannot be resolved
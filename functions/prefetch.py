@@ -0,0 +1,146 @@
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from functions.paths import app_data_dir
+from functions.convert_dwg_to_dxf import convert_dwg_to_dxf
+from functions.extract_text_from_dxf import extract_text_entities
+from functions.dxf_format import is_binary_dxf
+from functions.settings import load_settings
+
+# Parsed ezdxf documents take several times the DXF size in memory
+# (binary DXF is roughly half the size of ASCII for the same drawing)
+_MEMORY_PER_DXF_BYTE = 4
+_MEMORY_PER_BINARY_DXF_BYTE = 8
+PREFETCH_MAX_ITEMS = 8
+PREFETCH_MAX_BYTES = 1536 * 1024 * 1024
+
+
+def drawing_key(dwg_path):
+    """(path, size, mtime) – a prepared drawing is only valid for the exact file it came from."""
+    path = os.path.abspath(str(dwg_path))
+    st = os.stat(path)
+    return path, st.st_size, st.st_mtime_ns
+
+
+@dataclass
+class PreparedDrawing:
+    """A DWG already converted to DXF, parsed and with its text extracted."""
+    key: tuple
+    work_dir: str
+    dxf_path: str
+    doc: object
+    text_items: list = field(default_factory=list)
+    est_bytes: int = 0
+
+    def discard(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+def prepare_drawing(dwg_path, log=print):
+    """Convert + parse *dwg_path* into a private work folder (language independent)."""
+    key = drawing_key(dwg_path)
+    work_dir = app_data_dir() / "prefetch" / hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:16]
+    shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir.mkdir(parents=True)
+    try:
+        convert_dwg_to_dxf(key[0], str(work_dir), binary=load_settings()["binary_dxf"])
+        dxf_path = work_dir / f"{os.path.splitext(os.path.basename(key[0]))[0]}.dxf"
+        if not dxf_path.exists():
+            raise FileNotFoundError("DXF conversion failed.")
+        doc, _, _, _, text_items = extract_text_entities(str(dxf_path))
+    except Exception:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    factor = _MEMORY_PER_BINARY_DXF_BYTE if is_binary_dxf(dxf_path) else _MEMORY_PER_DXF_BYTE
+    est = os.path.getsize(dxf_path) * factor
+    log(f"🔹 Prefetched {os.path.basename(key[0])}: {len(text_items)} texts")
+    return PreparedDrawing(key, str(work_dir), str(dxf_path), doc, text_items, est)
+
+
+class PrefetchCache:
+    """
+    Bounded LRU of PreparedDrawings, limited by count and estimated memory.
+
+    A translation ``take()``s its drawing out of the cache (the document is
+    modified by the writeback, so it is never handed out twice). Evicted or
+    stale entries delete their work folder.
+    """
+
+    def __init__(self, max_items=PREFETCH_MAX_ITEMS, max_bytes=PREFETCH_MAX_BYTES):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[str, PreparedDrawing] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, dwg_path):
+        try:
+            key = drawing_key(dwg_path)
+        except OSError:
+            return False
+        with self._lock:
+            item = self._items.get(key[0])
+            if item is None or item.key != key:
+                return False
+            self._items.move_to_end(key[0])     # still wanted – evict others first
+            return True
+
+    def used_bytes(self):
+        with self._lock:
+            return sum(item.est_bytes for item in self._items.values())
+
+    def put(self, prepared: PreparedDrawing):
+        evicted = []
+        with self._lock:
+            old = self._items.pop(prepared.key[0], None)
+            if old:
+                evicted.append(old)
+            self._items[prepared.key[0]] = prepared
+            while len(self._items) > self.max_items or (
+                    len(self._items) > 1 and sum(i.est_bytes for i in self._items.values()) > self.max_bytes):
+                evicted.append(self._items.popitem(last=False)[1])
+        for item in evicted:
+            item.discard()
+
+    def take(self, dwg_path):
+        """Remove and return the prepared drawing for *dwg_path*, if it is still current."""
+        path = os.path.abspath(str(dwg_path))
+        with self._lock:
+            item = self._items.pop(path, None)
+        if item is None:
+            return None
+        try:
+            current = drawing_key(path)
+        except OSError:
+            current = None
+        if item.key != current:
+            item.discard()
+            return None
+        return item
+
+    def retain(self, dwg_paths):
+        """Drop everything not in *dwg_paths* (the queue changed)."""
+        keep = {os.path.abspath(str(p)) for p in dwg_paths}
+        with self._lock:
+            dropped = [self._items.pop(p) for p in list(self._items) if p not in keep]
+        for item in dropped:
+            item.discard()
+
+    def clear(self):
+        self.retain([])
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_prefetch_cache():
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            shutil.rmtree(app_data_dir() / "prefetch", ignore_errors=True)   # leftovers of the last session
+            _default_cache = PrefetchCache()
+        return _default_cache
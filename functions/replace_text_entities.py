@@ -1,7 +1,41 @@
+def _write_mtext(ent, new_text):
+    # Replace Python line breaks with AutoCAD-compatible paragraph breaks
+    safe_text = new_text.replace("\n", "\\P")
+    ent.text = safe_text
+    return safe_text
+
+def _write_dxf_text(ent, new_text):
+    ent.dxf.text = new_text
+    return new_text
+
+def _write_multileader(ent, new_text):
+    mtext = ent.context.mtext
+    if mtext is None:
+        raise ValueError("MULTILEADER has block content, not MTEXT")
+    mtext.default_content = new_text.replace("\n", "\\P")
+    return mtext.default_content
+
+# Entity types we know how to write back. Anything else is filtered out before
+# translation so we never pay DeepL for text that cannot reach the drawing.
+WRITERS = {
+    "MTEXT": _write_mtext,
+    "TEXT": _write_dxf_text,
+    "ATTRIB": _write_dxf_text,
+    "ATTDEF": _write_dxf_text,
+    "DIMENSION": _write_dxf_text,      # text override, "<>" keeps the measurement
+    "MULTILEADER": _write_multileader,
+}
+
+def can_write_back(entity):
+    """True if *entity* has a registered writer (table cells have none)."""
+    dxftype = getattr(entity, "dxftype", None)
+    return callable(dxftype) and dxftype() in WRITERS
+
 def replace_translated_texts(text_entities, translated_texts, log=None):
     """
     Replaces original text content in DXF entities with translated versions,
-    preserving entity types (TEXT, MTEXT, ATTRIB, ATTDEF).
+    using the writer registered in WRITERS for each entity type.
+    MTEXT-like strings are expected as raw MTEXT content (see MTextContent.rebuild).
 
     Args:
         text_entities (list): List of DXF text-like entities
@@ -10,15 +44,11 @@ def replace_translated_texts(text_entities, translated_texts, log=None):
     """
     for ent, new_text in zip(text_entities, translated_texts):
         try:
-            if ent.dxftype() == "MTEXT":
-                # Replace Python line breaks with AutoCAD-compatible paragraph breaks
-                safe_text = new_text.replace("\n", "\\P").replace("\\L", "\\P")
-                ent.text = safe_text
-                if log: log(f"↪️ MTEXT updated: {safe_text}")
-            elif ent.dxftype() in {"TEXT", "ATTRIB", "ATTDEF"}:
-                ent.dxf.text = new_text
-                if log: log(f"↪️ {ent.dxftype()} updated: {new_text}")
+            writer = WRITERS.get(ent.dxftype())
+            if writer:
+                written = writer(ent, new_text)
+                if log: log(f"↪️ {ent.dxftype()} updated: {written}")
             else:
                 if log: log(f"⚠️ Skipped unknown entity type: {ent.dxftype()}")
         except Exception as e:
-            if log: log(f"❌ Error updating entity: {e}")
\ No newline at end of file
+            if log: log(f"❌ Error updating entity: {e}")
@@ -0,0 +1,128 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+from functions.job_journal import pending_files
+from functions.settings import load_settings
+
+# Intermediate files of one job (DXF, saved DXF, ODA temp files) relative to the DWG size
+SPACE_FACTOR = 12
+# Scratch folders older than this are leftovers of a crashed session
+STALE_AFTER = 12 * 3600
+SCRATCH_PREFIX = "ams-scratch-"
+
+_cleaned = set()
+_clean_lock = threading.Lock()
+
+
+class ScratchSpaceError(OSError):
+    pass
+
+
+def _memory_root(settings):
+    """A RAM-backed folder: the configured RAM disk, else /dev/shm where it exists."""
+    configured = settings["scratch_memory_dir"]
+    if configured:
+        return Path(configured)
+    shm = Path("/dev/shm")
+    return shm if shm.is_dir() else None
+
+
+def scratch_roots(settings=None):
+    """Candidate roots for *settings*' backend, preferred first."""
+    settings = settings or load_settings()
+    backend = settings["scratch_backend"]
+    temp = Path(settings["scratch_dir"] or tempfile.gettempdir())
+    if backend == "desktop":        # legacy location, synced by OneDrive on redirected desktops
+        return [Path.home() / "Desktop" / "translated_dxfs_delete", temp]
+    if backend == "memory":
+        memory = _memory_root(settings)
+        return [memory, temp] if memory else [temp]
+    return [temp]
+
+
+def _free_bytes(root):
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        return shutil.disk_usage(root).free
+    except OSError:
+        return -1
+
+
+def clean_stale(root):
+    """
+    Remove job folders a crashed session left behind in *root* (once per
+    root), except those holding files an unfinished job journal resumes from.
+    """
+    with _clean_lock:
+        if root in _cleaned:
+            return
+        _cleaned.add(root)
+    cutoff = time.time() - STALE_AFTER
+    try:
+        leftovers = [p for p in root.iterdir() if p.name.startswith(SCRATCH_PREFIX)]
+    except OSError:
+        return
+    if not leftovers:
+        return
+    resumable = {os.path.normcase(os.path.dirname(f)) for f in pending_files()}
+    for path in leftovers:
+        if os.path.normcase(str(path)) in resumable:
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            continue
+
+
+def allocate(input_path, log=print):
+    """
+    Create a private scratch folder for a job on *input_path*.
+
+    The memory backend is only used for inputs under ``scratch_memory_max_mb``
+    and when the RAM disk has room for them; otherwise the next root is
+    tried. Raises ScratchSpaceError when no root has enough free space.
+    """
+    settings = load_settings()
+    size = os.path.getsize(input_path)
+    needed = size * SPACE_FACTOR
+    roots = scratch_roots(settings)
+    memory = _memory_root(settings) if settings["scratch_backend"] == "memory" else None
+
+    for root in roots:
+        if root == memory and size > settings["scratch_memory_max_mb"] * 1024 * 1024:
+            continue
+        free = _free_bytes(root)
+        if free < needed:
+            if free >= 0:
+                log(f"⚠️ Scratch {root}: {free // 2**20} MB free, {needed // 2**20} MB needed")
+            continue
+        clean_stale(root)
+        path = root / f"{SCRATCH_PREFIX}{uuid.uuid4().hex[:12]}"
+        path.mkdir()
+        return path
+
+    raise ScratchSpaceError(
+        f"Not enough free space for intermediate files ({needed // 2**20} MB needed) in: "
+        + ", ".join(str(r) for r in roots)
+    )
+
+
+def release(path):
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@contextmanager
+def job_scratch(input_path, log=print):
+    """``with job_scratch(dwg) as folder:`` – a scratch folder removed when the job ends."""
+    path = allocate(input_path, log)
+    try:
+        yield path
+    finally:
+        release(path)
@@ -0,0 +1,48 @@
+import copy
+import json
+import os
+import threading
+
+from functions.paths import app_data_dir
+
+SETTINGS_NAME = "settings.json"
+
+DEFAULTS = {
+    # [{"input": "C:/Export", "output": "C:/Export/out", "pairs": [["IT", "EN"], ["IT", "DE"]]}]
+    "hot_folders": [],
+    "hot_folder_debounce": 5.0,       # seconds a file must stay unchanged before it is picked up
+    "hot_folder_batch_window": 15.0,  # seconds of quiet that close a batch
+    "hot_folder_batch_max": 50,       # files per batch at most
+    "binary_dxf": True,               # binary DXF for the intermediate files of a translation
+    "scratch_backend": "temp",        # intermediate files: "temp", "memory" (RAM disk) or "desktop" (legacy)
+    "scratch_dir": "",                # temp backend root ("" = system temp folder)
+    "scratch_memory_dir": "",         # RAM disk root ("" = /dev/shm where available)
+    "scratch_memory_max_mb": 256,     # larger drawings fall back to the temp backend
+    "memory_budget_mb": 0,            # estimated memory concurrent translations may use (0 = half the RAM)
+}
+
+_lock = threading.Lock()
+
+
+def settings_path():
+    return app_data_dir() / SETTINGS_NAME
+
+
+def load_settings() -> dict:
+    """User settings merged over DEFAULTS (a missing or broken file gives the defaults)."""
+    settings = copy.deepcopy(DEFAULTS)
+    try:
+        with open(settings_path(), encoding="utf-8") as fh:
+            settings.update(json.load(fh))
+    except (OSError, ValueError):
+        pass
+    return settings
+
+
+def save_settings(settings: dict) -> None:
+    with _lock:
+        path = settings_path()
+        tmp = path.with_name(SETTINGS_NAME + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(settings, fh, indent=2)
+        os.replace(tmp, path)
@@ -0,0 +1,82 @@
+import re
+
+# Any whitespace-delimited token containing a digit: 20, 12,5, M6x20, Ø10, UNI-5739, 1/2"
+_TOKEN = re.compile(r"\S*\d\S*")
+_PLACEHOLDER = re.compile(r'<x i="(\d+)"\s*/>')
+# MTEXT inline codes of a markup unit (see mtext_format.MTextContent.units)
+_MARKUP_TAG = re.compile(r'(<m i="\d+"\s*/>)')
+_ANY_TAG = re.compile(r'<[xm] i="\d+"\s*/>')
+_XML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"))
+
+
+def _escape(text):
+    for char, entity in _XML_ESCAPES:
+        text = text.replace(char, entity)
+    return text
+
+
+def _unescape(text):
+    for char, entity in reversed(_XML_ESCAPES):
+        text = text.replace(entity, char)
+    return text
+
+
+def make_template(text, markup=False):
+    """
+    Replace numbers, dimensions and codes in *text* with numbered XML
+    placeholders, so "Vite TCEI M6x20" and "Vite TCEI M8x25" share the
+    template 'Vite TCEI <x i="0"/>'.
+
+    Returns ``(template, values)``. Texts without such tokens come back
+    unchanged with an empty value list and need no tag handling. A *markup*
+    text is already XML: its MTEXT code tags are kept and nothing is escaped.
+    """
+    if markup:
+        template, values = "", []
+        for i, part in enumerate(_MARKUP_TAG.split(text)):
+            if i % 2:
+                template += part
+                continue
+            pieces = _TOKEN.split(part)
+            template += pieces[0]
+            for value, piece in zip(_TOKEN.findall(part), pieces[1:]):
+                template += f'<x i="{len(values)}"/>' + piece
+                values.append(value)
+        return template, values
+
+    values = _TOKEN.findall(text)
+    if not values:
+        return text, []
+
+    parts = _TOKEN.split(text)
+    template = _escape(parts[0])
+    for i, part in enumerate(parts[1:]):
+        template += f'<x i="{i}"/>' + _escape(part)
+    return template, values
+
+
+def is_template(template):
+    """True if *template* needs DeepL's XML tag handling."""
+    return bool(_ANY_TAG.search(template))
+
+
+def has_words(template):
+    """True if anything translatable is left once placeholders are removed."""
+    return any(c.isalpha() for c in _ANY_TAG.sub("", template))
+
+
+def fill_template(translated, values, markup=False):
+    """
+    Put *values* back into a translated template. Returns None if DeepL
+    dropped or duplicated a placeholder, so the caller can fall back. A
+    *markup* result stays XML (see make_template).
+    """
+    if not values:
+        return translated
+
+    found = [int(i) for i in _PLACEHOLDER.findall(translated)]
+    if sorted(found) != list(range(len(values))):
+        return None
+    if markup:      # values were taken from the escaped text
+        return _PLACEHOLDER.sub(lambda m: values[int(m.group(1))], translated)
+    return _PLACEHOLDER.sub(lambda m: values[int(m.group(1))], _unescape(translated))
@@ -5,35 +5,69 @@ os.environ["DEEPL_API_KEY"] = "9c701752-ed68-4d01-b1cb-8e389d3fcf16"
 
 DEEPL_API_KEY = os.environ["DEEPL_API_KEY"]
 
-def translate_text_list(text_list, source_lang=None, target_lang="EN", glossary_id=None, context=None, log=None):
-    translated = []
-    for text in text_list:
+# DeepL accepts up to 50 texts and 128 KiB per request
+MAX_TEXTS_PER_REQUEST = 50
+MAX_BYTES_PER_REQUEST = 120 * 1024
+
+
+def _batches(texts):
+    batch, size = [], 0
+    for text in texts:
+        text_size = len(text.encode("utf-8"))
+        if batch and (len(batch) >= MAX_TEXTS_PER_REQUEST or size + text_size > MAX_BYTES_PER_REQUEST):
+            yield batch
+            batch, size = [], 0
+        batch.append(text)
+        size += text_size
+    if batch:
+        yield batch
+
+
+def translate_text_list(text_list, source_lang=None, target_lang="EN", glossary_id=None, context=None, log=None,
+                        on_translated=None, tag_handling=None):
+    """
+    Translate *text_list* in batches and return the results in order.
+
+    Texts DeepL fails on are returned unchanged; *on_translated(sources,
+    targets)* is called only for batches that came back successfully.
+    """
+    translated = list(text_list)
+    to_send = []
+    for i, text in enumerate(text_list):
         if len(text.strip()) <= 1 or not any(c.isalpha() for c in text):
-            translated.append(text)
             print(f"🔹 Skipped: {text}")
             continue
+        to_send.append(i)
 
-        data = {
-            "auth_key": DEEPL_API_KEY,
-            "text": text,
-            "target_lang": target_lang,
-        }
+    offset = 0
+    for batch in _batches([text_list[i] for i in to_send]):
+        data = [
+            ("auth_key", DEEPL_API_KEY),
+            ("target_lang", target_lang),
+        ]
+        data += [("text", text) for text in batch]
 
         if source_lang:
-            data["source_lang"] = source_lang
+            data.append(("source_lang", source_lang))
         if glossary_id:
-            data["glossary_id"] = glossary_id
+            data.append(("glossary_id", glossary_id))
         if context:
-            data["context"] = context
+            data.append(("context", context))
+        if tag_handling:
+            data.append(("tag_handling", tag_handling))
 
         response = requests.post("https://api.deepl.com/v2/translate", data=data)
 
         if response.ok:
-            translated_text = response.json()["translations"][0]["text"]
-            translated.append(translated_text)
-            print(f"✅ {text} ➜ {translated_text}")
+            results = [t["text"] for t in response.json()["translations"]]
+            for j, (text, result) in enumerate(zip(batch, results)):
+                translated[to_send[offset + j]] = result
+                print(f"✅ {text} ➜ {result}")
+            if on_translated:
+                on_translated(batch, results)
         else:
-            print(f"❌ Error translating '{text}': {response.text}")
-            translated.append(text)
+            print(f"❌ Error translating {len(batch)} texts: {response.text}")
+
+        offset += len(batch)
 
-    return translated
\ No newline at end of file
+    return translated
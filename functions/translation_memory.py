@@ -0,0 +1,126 @@
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from functions.paths import app_data_dir
+
+# Texts shorter than this are looked up as a single segment
+SEGMENT_MIN_LENGTH = 60
+
+# Sentence end followed by whitespace and a capital letter
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?;:])(\s+)(?=[A-ZÀ-ÖØ-Ý])")
+
+
+def split_segments(text):
+    """
+    Split *text* into sentence / line segments.
+
+    Returns a list of ``(kind, value)`` pieces where ``kind`` is ``"seg"`` for
+    a translatable segment and ``"sep"`` for whitespace that is kept as is, so
+    ``"".join(value for _, value in pieces) == text``.
+    """
+    if len(text) < SEGMENT_MIN_LENGTH:
+        return [p for p in _pad(text) if p[1]]
+
+    pieces = []
+    for i, line in enumerate(text.split("\n")):
+        if i:
+            pieces.append(("sep", "\n"))
+        parts = _SENTENCE_BREAK.split(line)
+        for j, part in enumerate(parts):
+            pieces.extend(_pad(part) if j % 2 == 0 else [("sep", part)])
+    return [p for p in pieces if p[1]]
+
+
+def _pad(text):
+    """Split surrounding whitespace off a segment."""
+    core = text.strip()
+    if not core:
+        return [("sep", text)]
+    start = text.index(core)
+    return [("sep", text[:start]), ("seg", core), ("sep", text[start + len(core):])]
+
+
+def join_segments(pieces, translations):
+    """Reassemble *pieces*, replacing each segment through *translations*."""
+    return "".join(translations.get(value, value) if kind == "seg" else value
+                   for kind, value in pieces)
+
+
+def memory_variant(glossary_id=None, context=None):
+    """
+    What else shaped a DeepL result besides the text: the glossary (its id
+    changes with its content, see deepl_glossary.py) and the context.
+    """
+    return f"{glossary_id or ''}|{context or ''}"
+
+
+class TranslationMemory:
+    """
+    Segment-level translation memory stored in SQLite under the app data dir.
+    Entries are keyed by language pair, memory_variant() and source text, so
+    a glossary edit never serves the old terminology. Safe to share between
+    TranslationWorker threads.
+    """
+
+    def __init__(self, path=None):
+        self.path = str(path or app_data_dir() / "translation_memory.db")
+        self._lock = threading.Lock()
+        with self._connect() as con:
+            # the first schema had no variant: its glossary/context is unknown, so drop it
+            con.execute("DROP TABLE IF EXISTS segments")
+            con.execute("""
+                CREATE TABLE IF NOT EXISTS segments_v2 (
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    variant     TEXT NOT NULL,
+                    source      TEXT NOT NULL,
+                    target      TEXT NOT NULL,
+                    PRIMARY KEY (source_lang, target_lang, variant, source)
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        con = sqlite3.connect(self.path, timeout=30)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def lookup(self, source_lang, target_lang, segments, variant=""):
+        """Return {segment: translation} for the *segments* already known."""
+        found = {}
+        segments = list(set(segments))
+        with self._lock, self._connect() as con:
+            # stay well below SQLite's bound-parameter limit
+            for i in range(0, len(segments), 500):
+                chunk = segments[i:i + 500]
+                rows = con.execute(
+                    f"SELECT source, target FROM segments_v2 WHERE source_lang = ? AND target_lang = ? "
+                    f"AND variant = ? AND source IN ({','.join('?' * len(chunk))})",
+                    [source_lang or "", target_lang, variant, *chunk],
+                )
+                found.update(rows)
+        return found
+
+    def store(self, source_lang, target_lang, sources, targets, variant=""):
+        with self._lock, self._connect() as con:
+            con.executemany(
+                "INSERT OR REPLACE INTO segments_v2 VALUES (?, ?, ?, ?, ?)",
+                [(source_lang or "", target_lang, variant, s, t) for s, t in zip(sources, targets)],
+            )
+
+
+_default_memory = None
+_default_lock = threading.Lock()
+
+
+def default_memory():
+    global _default_memory
+    with _default_lock:
+        if _default_memory is None:
+            _default_memory = TranslationMemory()
+        return _default_memory
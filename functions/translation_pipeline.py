@@ -1,11 +1,20 @@
-import os, shutil
+import os
 import re
 from pathlib import Path
 from functions.convert_dwg_to_dxf import convert_dwg_to_dxf
 from functions.convert_dxf_to_dwg import convert_dxf_to_dwg
+from functions.dxf_format import save_dxf
+from functions.oda_runner import ODAConversionError, ODATimeoutError
+from functions.settings import load_settings
+from functions.scratch import job_scratch, release
+from functions.file_utils import claim_unique_path, release_path
 from functions.extract_text_from_dxf import extract_text_entities
-from functions.replace_text_entities import replace_translated_texts
+from functions.replace_text_entities import replace_translated_texts, can_write_back
 from functions.translate_text import translate_text_list
+from functions.translation_memory import default_memory, split_segments, join_segments, memory_variant
+from functions.text_templates import make_template, fill_template, is_template, has_words
+from functions.glossary_matcher import matcher_for, FUZZY_THRESHOLD, STEM_CONFIDENCE, CONTEXT_THRESHOLD
+from functions.mtext_format import strip_markup
 
 SKIP_PHRASES = {
     "industry automation",
@@ -42,6 +51,175 @@ SKIP_PHRASES = {
 SKIP_PHRASES = set(' '.join(p.lower().split()) for p in SKIP_PHRASES)
 
 
+def translate_with_memory(texts, source_lang, target_lang, glossary_id=None, context=None, log=print, memory=None,
+                          markup=False):
+    """
+    Translate *texts* segment by segment through the translation memory.
+
+    Long texts are split into sentences / lines, and numbers, dimensions and
+    codes inside each segment are replaced by placeholders. Each distinct
+    template is looked up in memory and only the missing ones are sent to
+    DeepL, so boilerplate notes and BOM-style variants ("Vite TCEI M6x20",
+    "Vite TCEI M8x25") are paid for once. *markup* texts are MTEXT
+    paragraphs with their inline codes as XML tags (see mtext_format.py).
+    """
+    memory = memory or default_memory()
+    pieces = [split_segments(text) for text in texts]
+    segments = {value for p in pieces for kind, value in p if kind == "seg"}
+    templates = {seg: make_template(seg, markup) for seg in segments}
+    variant = memory_variant(glossary_id, context)
+
+    # segments whose placeholders DeepL lost before are stored verbatim
+    results = memory.lookup(source_lang, target_lang, [s for s, (_, v) in templates.items() if v], variant)
+    templates = {seg: t for seg, t in templates.items() if seg not in results}
+    keys = {template for template, _ in templates.values()}
+
+    known = memory.lookup(source_lang, target_lang, keys, variant)
+    missing = sorted(k for k in keys - known.keys() if has_words(k))
+    if known:
+        log(f"🧠 Translation memory: {len(known)} of {len(keys)} segments reused")
+    if len(keys) < len(segments):
+        log(f"🧩 Templates: {len(segments)} segments → {len(keys)} distinct")
+
+    def remember(sources, targets):
+        memory.store(source_lang, target_lang, sources, targets, variant)
+
+    for tagged in (False, True):
+        batch = [k for k in missing if is_template(k) == tagged]
+        if batch:
+            translated = translate_text_list(
+                batch, source_lang, target_lang, glossary_id=glossary_id, log=log, context=context,
+                on_translated=remember, tag_handling="xml" if tagged else None,
+            )
+            known.update(zip(batch, translated))
+
+    broken = []
+    for seg, (template, values) in templates.items():
+        filled = fill_template(known.get(template, template), values, markup)
+        if filled is None:
+            broken.append(seg)
+        else:
+            results[seg] = filled
+
+    # DeepL lost a placeholder – translate those few segments verbatim
+    if broken:
+        log(f"⚠️ Placeholders lost in {len(broken)} segments, translating them verbatim")
+        translated = translate_text_list(broken, source_lang, target_lang, glossary_id=glossary_id,
+                                         log=log, context=context, on_translated=remember,
+                                         tag_handling="xml" if markup else None)
+        results.update(zip(broken, translated))
+
+    return [join_segments(p, results) for p in pieces]
+
+
+def resolve_translations(original_texts, source_lang, target_lang, glossary_map, glossary_id=None, log=print,
+                         memory=None, markup=False):
+    """
+    Return one final string per entry of *original_texts*.
+
+    Skip phrases and glossary hits that differ only in case, accents or
+    punctuation are resolved locally; everything else is deduplicated and
+    sent to DeepL in batches. Inflected or plural forms of a glossary term
+    (see GlossaryMatcher) cannot be replaced by its base form: they go to
+    DeepL with the entry, enforced server-side by a *glossary_id* or passed
+    as "term = translation" context without one. Other strings containing a
+    glossary term are batched per term and the term is passed as context.
+    *markup* texts (MTEXT paragraphs with inline codes as XML tags) are
+    matched on their plain text but always translated, so the codes survive;
+    a glossary hit becomes their context.
+    """
+    final_texts = list(original_texts)
+    pending = {}  # context -> {text: [indices]}
+    matcher = matcher_for(glossary_map) if glossary_map else None
+
+    for i, original in enumerate(original_texts):
+        text = (strip_markup(original) if markup else original).strip()
+        norm = ' '.join(text.lower().split())
+
+        if norm in SKIP_PHRASES:
+            log(f"⏭️ Skipped: '{original}'")
+            continue
+
+        if markup and norm in glossary_map:
+            log(f"📙 Glossary term as context for formatted text: '{norm}'")
+            pending.setdefault(norm, {}).setdefault(original, []).append(i)
+            continue
+
+        if norm in glossary_map:
+            repl = glossary_map[norm]
+            log(f"📕 Glossary: '{original}' → '{repl}'")
+            final_texts[i] = repl
+            continue
+
+        match = matcher.match(norm) if matcher else None
+        if match and match[2] >= FUZZY_THRESHOLD and not markup:
+            term, repl, confidence = match
+            log(f"📕 Glossary (normalized, '{term}'): '{original}' → '{repl}'")
+            final_texts[i] = repl
+            continue
+
+        # other inflections go through the DeepL glossary; near misses get the term as context
+        context = None
+        if match and match[2] >= STEM_CONFIDENCE:
+            term, repl, confidence = match
+            context = term if glossary_id else f"{term} = {repl}"
+            log(f"📙 Inflected glossary term '{term}' → '{repl}': '{original}' goes to DeepL with it")
+        elif match and match[2] >= CONTEXT_THRESHOLD:
+            context = match[0]
+            log(f"📙 Similar glossary term ({match[2]:.2f}): '{context}' for '{original}'")
+        elif not glossary_id and matcher:
+            context = matcher.find_partial(norm)
+            if context:
+                log(f"📙 Partial glossary match: '{context}' for '{original}'")
+
+        pending.setdefault(context, {}).setdefault(original, []).append(i)
+
+    for context, by_text in pending.items():
+        texts = list(by_text)
+        translated = translate_with_memory(
+            texts, source_lang, target_lang, glossary_id=glossary_id, context=context, log=log, memory=memory,
+            markup=markup,
+        )
+        for text, result in zip(texts, translated):
+            for i in by_text[text]:
+                final_texts[i] = result
+
+    return final_texts
+
+
+def translate_items(text_items, source_lang, target_lang, glossary_map, glossary_id=None, log=print, memory=None):
+    """
+    Return the final string to write back for each extracted text item.
+
+    MTEXT items are translated a paragraph at a time: a paragraph with inline
+    codes goes to DeepL as XML with the codes as tags, so a bold word or a
+    hard space does not cut the sentence, and the codes are put back where
+    the translation has their tags.
+    """
+    plain, markup = [], []
+    for item in text_items:
+        content = item.get("mtext")
+        for text, is_markup in (content.units() if content else [(item["text"], False)]):
+            (markup if is_markup else plain).append(text)
+
+    plain = iter(resolve_translations(
+        plain, source_lang, target_lang, glossary_map, glossary_id, log, memory
+    ))
+    markup = iter(resolve_translations(
+        markup, source_lang, target_lang, glossary_map, glossary_id, log, memory, markup=True
+    ))
+
+    final_texts = []
+    for item in text_items:
+        content = item.get("mtext")
+        if content:
+            units = [next(markup if is_markup else plain) for _, is_markup in content.units()]
+            final_texts.append(content.rebuild(units))
+        else:
+            final_texts.append(next(plain))
+    return final_texts
+
+
 def process_file(
     dwg_path,
     source_lang,
@@ -49,79 +227,110 @@ def process_file(
     glossary_map,
     output_folder,  # ignored
     log=print,
+    glossary_id=None,
+    prepared=None,
+    journal=None,
 ):
+    """
+    DWG → DXF → translate → DWG. A *prepared* drawing (see prefetch.py)
+    skips the conversion and extraction that were already done while idle.
+    The intermediate DXF is binary unless the ``binary_dxf`` setting is off,
+    and lives in a per-job scratch folder (see scratch.py) removed afterwards.
+
+    With a *journal* (see job_journal.py) each stage and every translated
+    batch is recorded; a reopened journal resumes from its last stage whose
+    intermediate DXF survived, and journaled translations are not paid again.
+
+    The result is ``<name>_<LANG>.dwg`` on the Desktop, or ``<name>_<LANG>
+    (2).dwg``… when that exists or another job is writing it; the real path
+    is returned and journaled.
+    """
+    final_dwg_path = None
     try:
+        binary = load_settings()["binary_dxf"]
         original_name = Path(dwg_path).stem
-        desktop = Path.home() / "Desktop"
-        dxf_folder = desktop / "translated_dxfs_delete"
-        translated_folder = desktop / "AMS-Applicazione-Tradotto"
-
-        dxf_folder.mkdir(exist_ok=True)
+        translated_folder = Path.home() / "Desktop" / "AMS-Applicazione-Tradotto"
         translated_folder.mkdir(exist_ok=True)
+        final_dwg_path = claim_unique_path(translated_folder / f"{original_name}_{target_lang}.dwg")
+        if final_dwg_path.stem != f"{original_name}_{target_lang}":
+            log(f"⚠️ {original_name}_{target_lang}.dwg already exists, saving as {final_dwg_path.name}")
+
+        memory = journal.memory() if journal else None
 
-        dxf_path = dxf_folder / f"{original_name}_{target_lang}.dxf"
-
-        log("🔹 Converting DWG to DXF...")
-        convert_dwg_to_dxf(dwg_path, str(dxf_folder))
-
-        converted_dxf = dxf_folder / f"{original_name}.dxf"
-        if not converted_dxf.exists():
-            raise FileNotFoundError("DXF conversion failed.")
-        converted_dxf.rename(dxf_path)
-
-        log("🔹 Extracting text...")
-        doc, msp, text_entities, original_texts, _ = extract_text_entities(str(dxf_path))
-
-        final_texts = []
-        for original in original_texts:
-            text = original.strip()
-            norm = ' '.join(text.lower().split())
-
-            if norm in SKIP_PHRASES:
-                log(f"⏭️ Skipped: '{original}'")
-                final_texts.append(original)
-                continue
-
-            if norm in glossary_map:
-                repl = glossary_map[norm]
-                log(f"📕 Glossary: '{original}' → '{repl}'")
-                final_texts.append(repl)
-                continue
-
-            partial = None
-            for phrase in glossary_map:
-                if phrase in norm and (not partial or len(phrase) > len(partial)):
-                    partial = phrase
-
-            if partial:
-                repl = glossary_map[partial]
-                log(f"📙 Partial glossary match: '{partial}' for '{original}'")
-                translated = translate_text_list([original], source_lang, target_lang, glossary_id=None, log=log, context=partial)
-                final_texts.append(translated[0])
+        with job_scratch(dwg_path, log) as dxf_folder:
+            # after allocating: that may have cleaned up a stale scratch folder of the journal
+            resume = journal.resume_point() if journal else None
+            if resume and prepared is not None:
+                prepared.discard()
+            doc = None
+            if resume and resume[0] == "dxf_saved":
+                log("♻️ Resuming: translated DXF already saved, converting to DWG")
+                dxf_path = resume[1]
             else:
-                translated = translate_text_list([original], source_lang, target_lang, log=log)
-                final_texts.append(translated[0])
+                dxf_path = dxf_folder / f"{original_name}_{target_lang}.dxf"
+
+                if resume:
+                    log("♻️ Resuming: DWG already converted, extracting text")
+                    doc, msp, text_entities, original_texts, text_items = extract_text_entities(str(resume[1]))
+                elif prepared is not None:
+                    log("🔹 Using prefetched DXF and extracted text")
+                    doc, text_items = prepared.doc, prepared.text_items
+                    text_entities = [item["entity"] for item in text_items]
+                    prepared.discard()
+                else:
+                    log("🔹 Converting DWG to DXF...")
+                    convert_dwg_to_dxf(dwg_path, str(dxf_folder), log=log, binary=binary)
+
+                    converted_dxf = dxf_folder / f"{original_name}.dxf"
+                    if not converted_dxf.exists():
+                        raise FileNotFoundError("DXF conversion failed.")
+                    if journal:
+                        journal.stage("converted", converted_dxf)
+
+                    log("🔹 Extracting text...")
+                    doc, msp, text_entities, original_texts, text_items = extract_text_entities(str(converted_dxf))
+
+                # Never pay for text that has no writer (e.g. TABLE cells)
+                unsupported = [item for item in text_items if not can_write_back(item["entity"])]
+                if unsupported:
+                    sources = sorted({item["source"].split(":")[0] for item in unsupported})
+                    log(f"⏭️ Not translated, no writeback for {', '.join(sources)}: {len(unsupported)} texts")
+                    text_items = [item for item in text_items if can_write_back(item["entity"])]
+                    text_entities = [item["entity"] for item in text_items]
 
-        replace_translated_texts(text_entities, final_texts, log)
-        doc.saveas(str(dxf_path))
-        log(f"✅ DXF saved: {dxf_path}")
+                final_texts = translate_items(
+                    text_items, source_lang, target_lang, glossary_map, glossary_id, log, memory
+                )
 
-        final_dwg_path = translated_folder / f"{original_name}_{target_lang}.dwg"
-        convert_dxf_to_dwg(str(dxf_path), str(translated_folder))  # <- directly into final location
+                replace_translated_texts(text_entities, final_texts, log)
+                save_dxf(doc, dxf_path, binary, log)
+                if journal:
+                    journal.stage("dxf_saved", dxf_path)
+                log(f"✅ DXF saved: {dxf_path}")
 
-        # Handle cases where it still nests in a subfolder
-        inner_folder = translated_folder / Path(dwg_path).stem
-        nested_dwg = inner_folder / f"{original_name}_{target_lang}.dwg"
-        if nested_dwg.exists():
-            nested_dwg.rename(final_dwg_path)
-            shutil.rmtree(inner_folder)
+            try:
+                # directly into the final location, under the claimed name
+                convert_dxf_to_dwg(str(dxf_path), str(translated_folder), log=log, output_stem=final_dwg_path.stem)
+            except ODAConversionError as err:
+                if not binary or doc is None or isinstance(err, ODATimeoutError):
+                    raise
+                log("⚠️ ODA rejected the binary DXF, retrying with ASCII...")
+                save_dxf(doc, dxf_path, False, log)
+                convert_dxf_to_dwg(str(dxf_path), str(translated_folder), log=log, output_stem=final_dwg_path.stem)
 
-        if dxf_folder.exists():
-            shutil.rmtree(dxf_folder)
+        if journal:
+            journal.stage("done", output=str(final_dwg_path))
+        if resume:
+            release(resume[1].parent)       # scratch folder of the interrupted run
 
         log(f"✅ Final DWG saved: {final_dwg_path}")
         return str(final_dwg_path)
 
     except Exception as e:
+        if journal:
+            journal.fail(e)
         log(f"❌ Error: {str(e)}")
         raise
+    finally:
+        if final_dwg_path is not None:
+            release_path(final_dwg_path)
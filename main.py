@@ -11,6 +11,10 @@ from pages.home import HomePage
 from pages.glossary import GlossaryManagerPage
 
 from functions.paths import resource_path
+from functions.settings import load_settings
+import logging
+
+logger = logging.getLogger(__name__)
 
 class MainWindow(QMainWindow):
     files_dropped = Signal(list)  # ✅ signal to send dropped files
@@ -71,6 +75,18 @@ class MainWindow(QMainWindow):
 
         self.files_dropped.connect(self.home_widget.add_files_to_queue)  # ✅ connect signal to HomePage
 
+        # Hot folders (settings.json) keep translating in the background while the app is open
+        self.hot_folder = None
+        if load_settings()["hot_folders"]:
+            from functions.hot_folder import HotFolderService
+            self.hot_folder = HotFolderService(log=logger.info)
+            self.hot_folder.start()
+
+    def closeEvent(self, event):
+        if self.hot_folder:
+            self.hot_folder.stop()
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.overlay.resize(self.size())  # keep overlay full-screen
@@ -150,7 +166,7 @@ if __name__ == "__main__":
             color: white;
         }
                       
-        QTableWidget {
+        QTableView {
             background-color: white;
             border-radius: 4px;
             border: 1px solid white;
@@ -1,15 +1,20 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
-    QGroupBox, QHBoxLayout, QAbstractItemView,
-    QFileDialog, QCheckBox, QMessageBox, QDialog, QHeaderView, QSizePolicy
+    QGroupBox, QHBoxLayout, QAbstractItemView, QTableView,
+    QFileDialog, QMessageBox, QDialog, QHeaderView, QSizePolicy, QProgressBar, QLineEdit
 )
-from PySide6.QtCore import Qt
-import csv
+from PySide6.QtCore import Qt, QTimer
 import os
-import shutil
 from datetime import datetime
 from ui.language_selector import LanguageSelectorDialog
-from functions.paths import glossary_paths, get_glossary_dir
+from functions.paths import glossary_paths
+from functions.glossary_mirror import (
+    working_glossary_dir, active_mirror, publish_glossary, glossary_base, GlossaryConflictError
+)
+from functions.glossary_table import GlossaryTable
+from functions.glossary_versions import GlossaryVersionStore
+from ui.glossary_model import GlossaryTableModel, GlossaryFilterProxy
+from workers.gl_worker import GlossaryLoadWorker, GlossaryTaskWorker
 from pathlib import Path
 
 class GlossaryManagerPage(QWidget):
@@ -17,7 +22,15 @@ class GlossaryManagerPage(QWidget):
         super().__init__()
         self.current_languages = []
         self.language_options = ["PT", "NL", "PL", "SV", "NO", "DA", "FI", "ZH"]
-        self.selected_checkboxes = []
+        self.glossary_model = GlossaryTableModel()
+        self.glossary_model.selection_changed.connect(self.toggle_delete_button_visibility)
+        self.glossary_proxy = GlossaryFilterProxy(self)
+        self.glossary_proxy.setSourceModel(self.glossary_model)
+        self._load_worker = None
+        self._workers = set()           # keep running QThreads alive
+        self._busy_owner = None         # worker whose progress the bar shows
+        self._table_complete = False    # False while a load is partial: saving is refused
+        self._glossary_base = None      # share checksum of the glossary as loaded (conflict check)
 
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignTop)
@@ -75,6 +88,22 @@ class GlossaryManagerPage(QWidget):
         self.previous_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         layout.addWidget(self.previous_table)
 
+        # === Background I/O progress ===
+        progress_row = QHBoxLayout()
+        self.io_status = QLabel("")
+        self.io_progress = QProgressBar()
+        self.io_progress.setMaximumHeight(14)
+        self.io_progress.setTextVisible(False)
+        self.io_cancel_btn = QPushButton("Annulla")
+        self.io_cancel_btn.clicked.connect(self.cancel_glossary_load)
+        progress_row.addWidget(self.io_status)
+        progress_row.addWidget(self.io_progress, 1)
+        progress_row.addWidget(self.io_cancel_btn)
+        self.progress_widget = QWidget()
+        self.progress_widget.setLayout(progress_row)
+        self.progress_widget.hide()
+        layout.addWidget(self.progress_widget)
+
         # === Back + Table + Toolbar ===
         self.back_button = QPushButton("🔙 Torna al Gestore del Glossario")
         self.back_button.clicked.connect(self.hide_glossary_table)
@@ -99,8 +128,16 @@ class GlossaryManagerPage(QWidget):
         self.save_btn = QPushButton("💾 Salva Glossario")
         self.save_btn.clicked.connect(self.save_glossary)
 
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔎 Cerca termine…")
+        self.search_input.setClearButtonEnabled(True)
+        # filter once typing pauses, not on every keystroke
+        self.search_timer = QTimer(self, singleShot=True, interval=200)
+        self.search_timer.timeout.connect(lambda: self.glossary_proxy.set_query(self.search_input.text()))
+        self.search_input.textChanged.connect(self.search_timer.start)
+
         for w in [
-            self.add_row_btn, self.add_column_btn,
+            self.search_input, self.add_row_btn, self.add_column_btn,
             self.delete_selected_btn, self.export_btn, self.save_btn
         ]:
             self.toolbar.addWidget(w)
@@ -111,7 +148,12 @@ class GlossaryManagerPage(QWidget):
         self.toolbar_widget = toolbar_wrapper
         layout.addWidget(toolbar_wrapper)
 
-        self.glossary_table = QTableWidget()
+        # Model/view: only the visible rows are ever asked for data
+        self.glossary_table = QTableView()
+        self.glossary_table.setModel(self.glossary_proxy)
+        self.glossary_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.glossary_table.verticalHeader().setDefaultSectionSize(24)
+        self.glossary_table.setColumnWidth(0, 40)
         self.glossary_table.hide()
         layout.addWidget(self.glossary_table)
 
@@ -138,90 +180,195 @@ class GlossaryManagerPage(QWidget):
         """)
 
 
-    def load_current_glossary(self) -> None:
+    # ──────────────────────────────────────────────────────────
+    # background I/O helpers
+    # ──────────────────────────────────────────────────────────
+    def _show_busy(self, text, determinate=False, cancellable=False, owner=None):
+        self._busy_owner = owner
+        self.io_status.setText(text)
+        self.io_progress.setRange(0, 100 if determinate else 0)
+        self.io_progress.setValue(0)
+        self.io_cancel_btn.setVisible(cancellable)
+        self.progress_widget.show()
+
+    def _hide_busy(self, owner=None):
+        """Hide the bar – unless it now belongs to another worker; a running load gets it back."""
+        if owner is not None and owner is not self._busy_owner:
+            return
+        if self._load_worker is not None and owner is not self._load_worker:
+            self._show_busy("Caricamento glossario…", determinate=True, cancellable=True, owner=self._load_worker)
+            return
+        self._busy_owner = None
+        self.progress_widget.hide()
+
+    def _track(self, worker):
+        self._workers.add(worker)
+        worker.finished.connect(lambda w=worker: self._workers.discard(w))
+        worker.start()
+
+    def run_in_background(self, task, on_done, busy_text=None, on_failed=None):
+        """Run *task* on a GlossaryTaskWorker and deliver its result to *on_done* on the UI thread."""
+        worker = GlossaryTaskWorker(task, self)
+        if busy_text:
+            self._show_busy(busy_text, owner=worker)
+            worker.finished.connect(lambda w=worker: self._hide_busy(w))
+        worker.done.connect(on_done)
+        if on_failed:
+            worker.failed.connect(on_failed)
+        self._track(worker)
+
+    def start_glossary_load(self, path_fn, on_loaded=None, indexed=False):
         """
-        Load *glossario_tecnico.csv* from the glossary directory.
-        If not found, show fallback state.
+        Stream the CSV returned by *path_fn* into the model chunk by chunk.
+        A load already running is cancelled first. If this load is cancelled
+        or fails, the table shown before it comes back.
         """
-        try:
-            glossary_dir = get_glossary_dir()
-            glossary_path = glossary_dir / "glossario_tecnico.csv"
-            print("📁 Glossary path we're checking:", glossary_path)
-            print("📄 File exists?", glossary_path.exists())
-
-            if not glossary_path.exists():
-                self.current_languages = []
-                self.glossary_table.setRowCount(0)
-                self.glossary_table.setColumnCount(0)
+        self.cancel_glossary_load()
+        worker = GlossaryLoadWorker(path_fn, self, indexed=indexed)
+        self._load_worker = worker
+        worker.previous = (self.glossary_model.table, self._table_complete)
+        worker.load_failed = False
+        self._table_complete = False
+
+        def current():
+            return self._load_worker is worker
+
+        def on_headers(path, headers):
+            if current():
+                self.set_glossary_table(GlossaryTable(headers))
+
+        def on_chunk(rows):
+            if current():
+                self.glossary_model.append_rows(rows)
+
+        def on_missing():
+            if current():
+                self.set_glossary_table(GlossaryTable())
                 self.current_glossary_label.setText("Nessun glossario caricato")
-                return
-
-            with open(glossary_path, newline="", encoding="utf-8") as fh:
-                reader = csv.DictReader(fh, delimiter=";")
-                headers = reader.fieldnames or []
-                if not headers:
-                    raise ValueError("Missing headers in glossary CSV")
 
-                self.current_languages = headers
-                self.selected_checkboxes.clear()
-                self.glossary_table.setColumnCount(len(headers) + 1)
-                self.glossary_table.setHorizontalHeaderLabels(["✔"] + headers)
-                self.glossary_table.setRowCount(0)
+        def on_failed(err):
+            if current():
+                worker.load_failed = True
+                QMessageBox.critical(
+                    self,
+                    "Glossary Load Error",
+                    f"Could not read glossary file:\n{err}"
+                )
 
-                for row in reader:
-                    self.add_row_to_table([row.get(h, "") for h in headers])
+        def on_finished():
+            if current():
+                self._load_worker = None
+                self._hide_busy(worker)
+                if worker.load_failed:
+                    self._restore_previous(worker)
+                    return
+                self._table_complete = True
+                if on_loaded and self.current_languages:
+                    on_loaded()
+
+        worker.headers_ready.connect(on_headers)
+        worker.chunk_ready.connect(on_chunk)
+        worker.progress.connect(lambda v: current() and self.io_progress.setValue(v))
+        worker.missing.connect(on_missing)
+        worker.failed.connect(on_failed)
+        worker.finished.connect(on_finished)
+
+        self._show_busy("Caricamento glossario…", determinate=True, cancellable=True, owner=worker)
+        self._track(worker)
+
+    def cancel_glossary_load(self):
+        worker = self._load_worker
+        if worker is not None:
+            worker.requestInterruption()
+            self._load_worker = None
+            self._hide_busy(worker)
+            self._restore_previous(worker)
+
+    def _restore_previous(self, worker):
+        """Drop a partly loaded table: show the one from before the load again."""
+        table, complete = worker.previous
+        if self.glossary_model.table is not table:
+            self.set_glossary_table(table)
+        self._table_complete = complete
+
+    # ──────────────────────────────────────────────────────────
+    # current glossary / versions
+    # ──────────────────────────────────────────────────────────
+    def load_current_glossary(self) -> None:
+        """
+        Load *glossario_tecnico.csv* from the glossary directory in the background.
+        If not found, show fallback state.
+        """
+        base = {}
 
-                self.current_glossary_label.setText(
-                    f"Current Glossary ({', '.join(self.current_languages)})"
-                )
+        def path():
+            base["sha256"] = glossary_base()        # what the share had when this copy was read
+            return working_glossary_dir() / "glossario_tecnico.csv"
 
-        except Exception as err:
-            QMessageBox.critical(
-                self,
-                "Glossary Load Error",
-                f"Could not read glossary file:\n{err}"
+        def loaded():
+            self._glossary_base = base.get("sha256")
+            self.current_glossary_label.setText(
+                f"Current Glossary ({', '.join(self.current_languages)})"
             )
 
+        self.start_glossary_load(path, loaded, indexed=True)
+
+
+    def version_store(self) -> GlossaryVersionStore:
+        return GlossaryVersionStore(working_glossary_dir() / "versions")
 
     def load_previous_versions(self):
+        # one small index read instead of listing the versions folder
+        self.run_in_background(lambda: self.version_store().list_versions(),
+                               self.populate_previous_versions)
+
+    def populate_previous_versions(self, versions):
         self.previous_table.setRowCount(0)
-        versions_dir = os.path.join("glossaries", "versions")
-        os.makedirs(versions_dir, exist_ok=True)
-
-        for filename in sorted(os.listdir(versions_dir), reverse=True):
-            if filename.lower().endswith(".csv"):
-                file_path = os.path.join(versions_dir, filename)
-                row = self.previous_table.rowCount()
-                self.previous_table.insertRow(row)
-
-                # Filename
-                file_item = QTableWidgetItem(filename)
-                file_item.setData(Qt.UserRole, file_path)
-                self.previous_table.setItem(row, 0, file_item)
-
-                # Timestamp
-                timestamp = os.path.getmtime(file_path)
-                formatted = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
-                self.previous_table.setItem(row, 1, QTableWidgetItem(formatted))
-
-                # Actions
-                action_widget = QWidget()
-                layout = QHBoxLayout(action_widget)
-                layout.setContentsMargins(0, 0, 0, 0)
-                view_btn = QPushButton("Visualizza")
-                reinstate_btn = QPushButton("Ripristina")
-                view_btn.clicked.connect(lambda _, f=file_path: self.load_from_csv(f))
-                reinstate_btn.clicked.connect(lambda _, f=file_path: self.reinstate_glossary(f))
-                layout.addWidget(view_btn)
-                layout.addWidget(reinstate_btn)
-                self.previous_table.setCellWidget(row, 2, action_widget)
-
-    def reinstate_glossary(self, file_path):
-        glossary_dir = "glossaries"
-        current_path = os.path.join(glossary_dir, "glossario_tecnico.csv")
-        shutil.copy2(file_path, current_path)
-        self.load_current_glossary()
-        QMessageBox.information(self, "Ripristinato", f"{os.path.basename(file_path)} ripristinato come glossario corrente.")
+
+        for version in versions:
+            row = self.previous_table.rowCount()
+            self.previous_table.insertRow(row)
+
+            # Filename
+            file_item = QTableWidgetItem(version["label"])
+            file_item.setData(Qt.UserRole, version["id"])
+            self.previous_table.setItem(row, 0, file_item)
+
+            # Timestamp
+            formatted = datetime.fromisoformat(version["timestamp"]).strftime("%Y-%m-%d %H:%M")
+            self.previous_table.setItem(row, 1, QTableWidgetItem(formatted))
+
+            # Actions
+            action_widget = QWidget()
+            layout = QHBoxLayout(action_widget)
+            layout.setContentsMargins(0, 0, 0, 0)
+            view_btn = QPushButton("Visualizza")
+            reinstate_btn = QPushButton("Ripristina")
+            view_btn.clicked.connect(lambda _, v=version: self.view_version(v))
+            reinstate_btn.clicked.connect(lambda _, v=version: self.reinstate_glossary(v))
+            layout.addWidget(view_btn)
+            layout.addWidget(reinstate_btn)
+            self.previous_table.setCellWidget(row, 2, action_widget)
+
+    def view_version(self, version):
+        self.start_glossary_load(lambda: self.version_store().materialize(version["id"]))
+
+    def reinstate_glossary(self, version):
+        def reinstate():
+            glossary_dir = working_glossary_dir()
+            GlossaryVersionStore(glossary_dir / "versions").restore(
+                version["id"], glossary_dir / "glossario_tecnico.csv"
+            )
+            publish_glossary()
+
+        def reinstated(_):
+            self.load_current_glossary()
+            QMessageBox.information(self, "Ripristinato", f"{version['label']} ripristinato come glossario corrente.")
+
+        self.run_in_background(
+            reinstate, reinstated, "Ripristino glossario…",
+            lambda err: QMessageBox.critical(self, "Ripristino Fallito", f"Impossibile ripristinare il glossario:\n{err}")
+        )
 
 
     def create_previous_version_widget(self, filename):
@@ -252,54 +399,30 @@ class GlossaryManagerPage(QWidget):
         self.prev_label.show()
         self.previous_table.show()
 
-    def add_row_to_table(self, row_data=None):
-        row = self.glossary_table.rowCount()
-        self.glossary_table.insertRow(row)
-
-        checkbox = QCheckBox()
-        checkbox.stateChanged.connect(self.toggle_delete_button_visibility)
-
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.addWidget(checkbox)
-        layout.setAlignment(Qt.AlignCenter)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.glossary_table.setCellWidget(row, 0, container)
-
-        self.selected_checkboxes.append(checkbox)
-
-        for col, text in enumerate(row_data or [""] * len(self.current_languages)):
-            item = QTableWidgetItem(text)
-            self.glossary_table.setItem(row, col + 1, item)
-
-        self.glossary_table.scrollToItem(self.glossary_table.item(row, 1), QAbstractItemView.PositionAtCenter)
-
+    def set_glossary_table(self, table: GlossaryTable):
+        self.glossary_model.set_table(table)
+        self.current_languages = table.headers
+        self.glossary_table.setColumnWidth(0, 40)
 
     def add_row(self):
-        self.add_row_to_table()
+        self.search_input.clear()               # the new empty row would not match a search
+        self.search_timer.stop()
+        self.glossary_proxy.set_query("")
+        row = self.glossary_model.append_rows([[""] * len(self.current_languages)])
+        index = self.glossary_proxy.mapFromSource(self.glossary_model.index(row, 1))
+        self.glossary_table.scrollTo(index, QAbstractItemView.PositionAtCenter)
+        self.glossary_table.setCurrentIndex(index)
 
     def delete_selected_rows(self):
-        for i in reversed(range(self.glossary_table.rowCount())):
-            container = self.glossary_table.cellWidget(i, 0)
-            if container:
-                checkbox = container.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    self.glossary_table.removeRow(i)
-                    self.selected_checkboxes.pop(i)
-        self.toggle_delete_button_visibility()
-
+        self.glossary_model.remove_checked_rows()
 
-    def toggle_delete_button_visibility(self):
-        any_selected = any(cb.isChecked() for cb in self.selected_checkboxes)
-        self.delete_selected_btn.setVisible(any_selected)
+    def toggle_delete_button_visibility(self, checked_count=None):
+        if checked_count is None:
+            checked_count = len(self.glossary_model.checked)
+        self.delete_selected_btn.setVisible(checked_count > 0)
 
     def toggle_all_rows(self, state):
-        check = state == Qt.Checked
-        for cb in self.selected_checkboxes:
-            cb.blockSignals(True)
-            cb.setChecked(check)
-            cb.blockSignals(False)
-        self.toggle_delete_button_visibility()
+        self.glossary_model.set_all_checked(state == Qt.Checked, self.glossary_proxy.source_rows())
 
     def prompt_add_column(self):
         remaining = {
@@ -315,53 +438,92 @@ class GlossaryManagerPage(QWidget):
         dialog = LanguageSelectorDialog(available, self)
         if dialog.exec() == QDialog.Accepted:
             selected_code = dialog.selected_code()
-            self.current_languages.append(selected_code)
-            self.refresh_table_headers()
-
-    def refresh_table_headers(self):
-        col_count = len(self.current_languages) + 1
-        self.glossary_table.setColumnCount(col_count)
-        self.glossary_table.setHorizontalHeaderLabels(["✔"] + self.current_languages)
+            self.glossary_model.add_column(selected_code)
 
     def save_glossary(self) -> None:
-        primary_dir, fallback_dir = glossary_paths()    # ✅ a tuple
-        glossary_dir   = get_glossary_dir()             # ✅ the writable one
-        current_path   = glossary_dir / "glossario_tecnico.csv"
-        versions_dir   = glossary_dir / "versions"
-        versions_dir.mkdir(parents=True, exist_ok=True)
-
-        # Backup current version
-        if current_path.exists():
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            backup_path = versions_dir / f"glossario_tecnico_{timestamp}.csv"
-            shutil.copy2(current_path, backup_path)
-
-        # Save logic with fallback
-        def try_save(path: Path):
-            with open(path, "w", newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, delimiter=';')
-                writer.writerow(self.current_languages)
-                for row in range(self.glossary_table.rowCount()):
-                    row_data = []
-                    for col in range(1, self.glossary_table.columnCount()):
-                        item = self.glossary_table.item(row, col)
-                        row_data.append(item.text() if item else "")
-                    writer.writerow(row_data)
-
-        try:
-            try_save(current_path)
-            QMessageBox.information(self, "Saved", f"Glossary saved to:\n{current_path}")
-        except Exception as e:
+        if not self._table_complete:
+            QMessageBox.warning(self, "Glossario Incompleto",
+                "Il glossario non è stato caricato completamente: impossibile salvarlo.\n"
+                "Attendi la fine del caricamento o ricarica il glossario.")
+            return
+
+        # Snapshot on the UI thread so edits made while saving are not half-written
+        table = self.glossary_model.table.copy()
+        loaded_base = self._glossary_base
+
+        def save():
+            primary_dir, fallback_dir = glossary_paths()    # ✅ a tuple
+            mirror         = active_mirror()
+            if mirror and not mirror.has_copy():
+                mirror.sync()                               # first use: fill the mirror (worker thread)
+            glossary_dir   = mirror.local if mirror else working_glossary_dir()
+            current_path   = glossary_dir / "glossario_tecnico.csv"
+            data           = table.to_csv_bytes()
+
+            # Backup current version (deduplicated – unchanged chunks are not stored again)
+            if current_path.exists():
+                current = current_path.read_bytes()
+                if current == data:
+                    return "unchanged", current_path, None
+                GlossaryVersionStore(glossary_dir / "versions").add(current)
+
+            # Save logic with fallback
             try:
-                fallback_path = fallback_dir / "glossario_tecnico.csv"
-                try_save(fallback_path)
+                if mirror:
+                    mirror.mark_dirty("glossario_tecnico.csv", loaded_base)    # no sync may replace it now
+                with open(current_path, "wb") as fh:
+                    fh.write(data)
+            except Exception as e:
+                if mirror:      # never write the share directly: it would skip the conflict check
+                    return "failed", None, str(e)
+                try:
+                    fallback_path = fallback_dir / "glossario_tecnico.csv"
+                    with open(fallback_path, "wb") as fh:
+                        fh.write(data)
+                    return "fallback", fallback_path, str(e)
+                except Exception as fallback_error:
+                    return "failed", None, f"{str(e)}\n{str(fallback_error)}"
+
+            if mirror:
+                # compare against the share as it was when the glossary was loaded, not as of now
+                try:
+                    mirror.push_changes({"glossario_tecnico.csv": loaded_base})
+                except GlossaryConflictError as e:
+                    return "conflict", e.saved_copy, str(e)
+                except OSError as e:
+                    return "local", current_path, str(e)
+                current_path = mirror.remote / "glossario_tecnico.csv"
+            return "saved", current_path, None
+
+        def saved(result):
+            status, path, error = result
+            if status == "unchanged":
+                QMessageBox.information(self, "Nessuna Modifica", "Il glossario non è cambiato, nessun salvataggio necessario.")
+                return
+            if status == "saved":
+                self._glossary_base = glossary_base()     # our push is the new base
+                QMessageBox.information(self, "Saved", f"Glossary saved to:\n{path}")
+            elif status == "conflict":
+                QMessageBox.warning(self, "Conflitto di Salvataggio",
+                    f"⚠️ Il glossario è stato modificato da un altro utente nel frattempo.\n"
+                    f"Le modifiche sono rimaste solo in locale:\n{path}\n\nRicarica il glossario e riapplica le modifiche.\n\n{error}")
+            elif status == "local":
+                QMessageBox.warning(self, "Condivisione Non Raggiungibile",
+                    f"⚠️ Il glossario è stato salvato solo in locale:\n{path}\n\n"
+                    f"Non è stato possibile aggiornare la cartella di rete: le modifiche verranno inviate\n"
+                    f"automaticamente appena sarà di nuovo raggiungibile.\n\n{error}")
+            elif status == "fallback":
                 QMessageBox.warning(self, "Salvataggio Alternativo",
-                    f"⚠️ Impossibile salvare nella directory locale.\nSalvato invece nel percorso di rete:\n{fallback_path}\n\nErrore:\n{str(e)}")
-            except Exception as fallback_error:
+                    f"⚠️ Impossibile salvare nella directory locale.\nSalvato invece nel percorso di rete:\n{path}\n\nErrore:\n{error}")
+            else:
                 QMessageBox.critical(self, "Salvataggio Fallito",
-                    f"❌ Impossibile salvare il glossario in entrambe le posizioni locale e di rete.\n\nErrori:\n{str(e)}\n{str(fallback_error)}")
+                    f"❌ Impossibile salvare il glossario in entrambe le posizioni locale e di rete.\n\nErrori:\n{error}")
+            self.load_previous_versions()
 
-        self.load_previous_versions()
+        self.run_in_background(
+            save, saved, "Salvataggio glossario…",
+            lambda err: QMessageBox.critical(self, "Salvataggio Fallito", f"❌ {err}")
+        )
 
 
     def import_csv(self):
@@ -386,38 +548,15 @@ class GlossaryManagerPage(QWidget):
         if not file_path.lower().endswith(".csv"):
             file_path += ".csv"
 
-        try:
-            with open(file_path, "w", newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, delimiter=';')
-                writer.writerow(self.current_languages)
-                for row in range(self.glossary_table.rowCount()):
-                    row_data = []
-                    for col in range(1, self.glossary_table.columnCount()):
-                        item = self.glossary_table.item(row, col)
-                        row_data.append(item.text() if item else "")
-                    writer.writerow(row_data)
-
-            QMessageBox.information(self, "Export Complete", f"Glossary exported to:\n{file_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Failed", f"Could not export glossary:\n{str(e)}")
+        table = self.glossary_model.table.copy()
+        self.run_in_background(
+            lambda: table.write_csv(file_path),
+            lambda _: QMessageBox.information(self, "Export Complete", f"Glossary exported to:\n{file_path}"),
+            "Esportazione glossario…",
+            lambda err: QMessageBox.critical(self, "Export Failed", f"Could not export glossary:\n{err}")
+        )
 
 
     def load_from_csv(self, file_path):
-        with open(file_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile, delimiter=';')
-            headers = reader.fieldnames
-            if not headers:
-                QMessageBox.warning(self, "Error", "No headers found.")
-                return
-
-            self.current_languages = headers
-            self.selected_checkboxes.clear()
-            self.glossary_table.setColumnCount(len(headers) + 1)
-            self.glossary_table.setHorizontalHeaderLabels(["✔"] + headers)
-            self.glossary_table.setRowCount(0)
-
-            for row in reader:
-                row_data = [row.get(h, "") for h in headers]
-                self.add_row_to_table(row_data)
-
+        self.start_glossary_load(lambda: file_path)
         self.load_previous_versions()
\ No newline at end of file
@@ -1,30 +1,42 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
-    QCheckBox, QHBoxLayout, QHeaderView, QMenu, QFileDialog,
+    QWidget, QVBoxLayout, QLabel, QTableView, QAbstractItemView,
+    QHBoxLayout, QHeaderView, QMenu, QFileDialog,
     QPushButton, QSizePolicy, QGridLayout, QDialog, QMessageBox, QLabel as QLabelWidget
 )
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QFileSystemWatcher, QTimer, QThread, Signal
 import os
-import shutil
 from workers.tr_worker import TranslationWorker
+from workers.qu_worker import QueueCopyWorker, FingerprintWorker
+from workers.pf_worker import PrefetchWorker
+from workers.co_worker import ConversionWorker
+from functions.prefetch import default_prefetch_cache
 from ui.translate_details import TranslateDetailsDialog
-from functions.file_utils import ensure_translated_folder
+from ui.convert_details import ConvertDetailsDialog
+from functions.file_utils import ensure_translated_folder, DirectoryIndex
 from functions.glossary_utils import parse_glossary_to_map
 from ui.translation_log_dialog import TranslationLogDialog
+from ui.file_table_model import QueueTableModel, RecentFilesModel, CenteredCellDelegate
+from ui.icons import cached_pixmap
 from datetime import datetime
 from functools import partial
-from functions.paths import resource_path, get_glossary_dir, queue_dir, translated_dir
+from functions.paths import resource_path, translated_dir
+from functions.file_queue import FileQueue, fan_out_result
+from functions.glossary_mirror import working_glossary_dir
+from functions.job_journal import interrupted_jobs
+from functions.admission import default_admission, estimate_job_bytes
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
 def default_glossary_path() -> Path | None:
-    gpath = get_glossary_dir() / "glossario_tecnico.csv"
+    gpath = working_glossary_dir() / "glossario_tecnico.csv"
     return gpath if gpath.exists() else None
 
 class HomePage(QWidget):
+    start_admitted = Signal(object)     # → translation worker admitted, possibly from another thread
+
     def __init__(self, parent=None):
         super().__init__(parent)
         outer_layout = QVBoxLayout(self)
@@ -36,7 +48,7 @@ class HomePage(QWidget):
 
         # File queue label
         icon_label = QLabel()
-        icon_label.setPixmap(QIcon(resource_path("assets/icons/IconoirMultiplePages.svg")).pixmap(20, 20))
+        icon_label.setPixmap(cached_pixmap("IconoirMultiplePages.svg"))
         icon_label.setAlignment(Qt.AlignVCenter)
 
         text_label = QLabel("Coda file")
@@ -81,33 +93,22 @@ class HomePage(QWidget):
         # Add to your main inner_layout
         inner_layout.addWidget(top_row)
 
-        # Table setup
-        self.table = QTableWidget(0, 3)
+        # Table setup – model/view, the ✔ column and menu icon are painted by the delegate
+        self.queue_model = QueueTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.queue_model)
+        self.table.setItemDelegate(CenteredCellDelegate(self.table))
         self.table.setMaximumHeight(300)
-        
-        # Column 0 (checkbox): no label, right aligned
-        header_checkbox = QTableWidgetItem("")
-        header_checkbox.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        self.table.setHorizontalHeaderItem(0, header_checkbox)
-
-        # Column 1: Filename (right aligned)
-        header_filename = QTableWidgetItem("Nome file")
-        header_filename.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.table.setHorizontalHeaderItem(1, header_filename)
-
-        # Column 2: Actions (right aligned)
-        header_actions = QTableWidgetItem("Azioni")
-        header_actions.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        self.table.setHorizontalHeaderItem(2, header_actions)
+        self.table.verticalHeader().setDefaultSectionSize(28)
 
         self.table.setColumnWidth(0, 40)
         self.table.setColumnWidth(2, 60)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.table.cellClicked.connect(self.handle_table_click)
-        self.table.itemSelectionChanged.connect(self.update_remove_all_visibility)
+        self.table.clicked.connect(self.handle_table_click)
+        self.queue_model.selection_changed.connect(self.update_remove_all_visibility)
         inner_layout.addWidget(self.table)
 
         # Bottom action buttons row
@@ -154,29 +155,19 @@ class HomePage(QWidget):
             label.setStyleSheet("font-weight: bold; font-size: 14px; color: white;")
             layout.addWidget(label)
 
-            table = QTableWidget(0, 3)
-            table.setHorizontalHeaderLabels(["Nome file", "Timestamp", "Azioni"])
-
-
-            # Align both headers to left
-            filename_header = QTableWidgetItem("Nome file")
-            filename_header.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            table.setHorizontalHeaderItem(0, filename_header)
-
-            timestamp_header = QTableWidgetItem("Timestamp")
-            timestamp_header.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            table.setHorizontalHeaderItem(1, timestamp_header)
-
-            actions_header = QTableWidgetItem("Azioni")
-            actions_header.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            table.setHorizontalHeaderItem(2, actions_header)
+            model = RecentFilesModel(self)
+            table = QTableView()
+            table.setModel(model)
+            table.setItemDelegate(CenteredCellDelegate(table))
+            table.setColumnWidth(1, 120)   # fixed-format timestamp; ResizeToContents would measure every row
             table.setColumnWidth(2, 60)
 
             table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-            table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+            table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Fixed)
             table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Fixed)
-            table.setEditTriggers(QTableWidget.NoEditTriggers)
-            table.setSelectionBehavior(QTableWidget.SelectRows)
+            table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            table.setSelectionBehavior(QAbstractItemView.SelectRows)
+            table.verticalHeader().setDefaultSectionSize(28)
             table.setMaximumHeight(120)
             table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             layout.addWidget(table)
@@ -187,6 +178,9 @@ class HomePage(QWidget):
         translated_widget, self.translated_table = create_log_table("Recentemente Tradotto")
         checked_widget, self.checked_table = create_log_table("Recentemente Controllato")
         converted_widget, self.converted_table = create_log_table("Recentemente Convertito")
+        self.translated_model = self.translated_table.model()
+        self.converted_model = self.converted_table.model()
+        self.translated_table.clicked.connect(self.handle_translated_click)
 
         recent_layout.addWidget(translated_widget, 0, 0)
         recent_layout.addWidget(checked_widget, 0, 1)
@@ -197,82 +191,146 @@ class HomePage(QWidget):
         # Add inner layout to main layout
         outer_layout.addWidget(inner_container)
 
+        # translated folder: full listing once, then only what changes
+        self.translated_index = DirectoryIndex(translated_dir())
+        self.translated_watcher = QFileSystemWatcher([str(translated_dir())], self)
+        self.translated_refresh = QTimer(self, singleShot=True, interval=300)   # ODA writes in bursts
+        self.translated_refresh.timeout.connect(self.refresh_translated_files)
+        self.translated_watcher.directoryChanged.connect(lambda _: self.translated_refresh.start())
+
+        self.file_queue = FileQueue()
+        self.queue_workers = []
+        self.conversion_workers = []
+
+        # translations start only while their estimated memory fits the budget
+        self.admission = default_admission()                    # shared with the hot folder
+        self.start_admitted.connect(lambda worker: worker.start())
+        self.admission_timer = QTimer(self, interval=2000)     # live RSS changes without events
+        self.admission_timer.timeout.connect(self.pump_admission)
+
+        # speculative convert + extract of queued files once the queue settles
+        self.prefetch_worker = None
+        self.prefetch_timer = QTimer(self, singleShot=True, interval=1500)
+        self.prefetch_timer.timeout.connect(self.start_prefetch)
+
         self.load_existing_files()
         self.load_recently_translated_files()
+        QTimer.singleShot(0, self.offer_resume)    # once the window is up
 
 
     def add_files_to_queue(self, files):
-        for file in files:
-            self.add_file_to_queue(file)
+        """
+        Register dropped files instantly: the queue keeps a hardlink or a
+        reference (path + size/mtime), never a synchronous copy. Network
+        files are copied locally in the background.
+        """
+        added = []
+        for filepath in files:
+            try:
+                entry, is_new = self.file_queue.add(filepath)
+            except OSError as err:
+                logger.error(f"queue failed: {err}")
+                continue
+            if is_new:
+                added.append(entry)
+
+        self.queue_model.add_entries(dict(e) for e in added)
+        self.start_queue_copies([e for e in added if e["mode"] == "copying"])
+        self.start_fingerprinting(added)
+        self.schedule_prefetch()
 
     def add_file_to_queue(self, filepath: str):
-        qdir = queue_dir()                             # ➋
-        filename   = os.path.basename(filepath)
-        queue_path = qdir / filename                   # pathlib.Path
+        self.add_files_to_queue([filepath])
 
-        if not queue_path.exists():                    # copy only once
-            try:
-                shutil.copy2(filepath, queue_path)
-            except OSError as err:
-                logger.error(f"copy failed: {err}")
-                return
-
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        # store the ABSOLUTE path in the table (so we never rebuild it later)
-        fn_item = QTableWidgetItem(filename)
-        fn_item.setData(Qt.UserRole, str(queue_path))  # ➌
-        self.table.setItem(row, 1, fn_item)
-
-        # Column 0: Checkbox
-        checkbox = QCheckBox()
-        checkbox_widget = QWidget()
-        checkbox_layout = QHBoxLayout(checkbox_widget)
-        checkbox_layout.addWidget(checkbox)
-        checkbox_layout.setAlignment(Qt.AlignCenter)
-        checkbox_layout.setContentsMargins(0, 0, 0, 0)
-        self.table.setCellWidget(row, 0, checkbox_widget)
-        checkbox.stateChanged.connect(self.update_remove_all_visibility)
-
-        # Column 1: Filename (shown) + full path (stored as data)
-        filename_item = QTableWidgetItem(filename)
-        filename_item.setData(Qt.UserRole, queue_path)  # <-- Save full path here
-        self.table.setItem(row, 1, filename_item)
-
-        # Column 2: Menu Icon
-        icon_label = QLabel()
-        icon_label.setPixmap(QIcon(resource_path("assets/icons/IconoirMenu.svg")).pixmap(20, 20))
-        icon_label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        self.table.setCellWidget(row, 2, icon_label)
+    def start_queue_copies(self, entries):
+        if not entries:
+            return
+        worker = QueueCopyWorker(self.file_queue, entries, self)
+        worker.progress.connect(lambda entry_id, pct: self.queue_model.update_entry(entry_id, progress=pct))
+        worker.copied.connect(lambda entry_id, path: self.queue_model.update_entry(
+            entry_id, path=path, mode="copy", progress=None))
+        worker.copied.connect(self.schedule_prefetch)
+        worker.failed.connect(self.on_queue_copy_failed)
+        self.start_queue_worker(worker)
+
+    def start_fingerprinting(self, entries):
+        """Hash new entries off the UI thread; identical drawings get merged into one job."""
+        entries = [e for e in entries if not e.get("fingerprint") or self.file_queue.is_stale(e)]
+        if not entries:
+            return
+        worker = FingerprintWorker(self.file_queue, entries, self)
+        worker.fingerprinted.connect(
+            lambda entry_id, dup_of: self.queue_model.update_entry(entry_id, duplicate_of=dup_of or None))
+        worker.failed.connect(lambda entry_id, err: logger.warning(f"fingerprint failed: {err}"))
+        self.start_queue_worker(worker)
+
+    def start_queue_worker(self, worker):
+        worker.finished.connect(lambda: self.queue_workers.remove(worker))
+        self.queue_workers.append(worker)
+        worker.start()
+
+    # ─────────────────────────────────────────────────────────────
+    # prefetch
+    # ─────────────────────────────────────────────────────────────
+    def schedule_prefetch(self, *_):
+        """The queue changed: stop the current prefetch and restart it once things are quiet."""
+        self.cancel_prefetch()
+        self.prefetch_timer.start()
+
+    def cancel_prefetch(self):
+        self.prefetch_timer.stop()
+        if self.prefetch_worker is not None and self.prefetch_worker.isRunning():
+            self.prefetch_worker.requestInterruption()
+
+    def start_prefetch(self):
+        if any(w.isRunning() for w in getattr(self, "active_workers", [])):
+            return      # never compete with a running translation
+        if self.prefetch_worker is not None and self.prefetch_worker.isRunning():
+            self.prefetch_timer.start()     # wait for the cancelled one to stop
+            return
+
+        cache = default_prefetch_cache()
+        cache.retain(self.queue_model.paths())
+        paths = [e["path"] for e in self.queue_model.entries if not e.get("duplicate_of")]
+        if not paths:
+            return
+        self.prefetch_worker = PrefetchWorker(paths[:cache.max_items], self)
+        self.prefetch_worker.failed.connect(lambda p, err: logger.info(f"prefetch skipped {p}: {err}"))
+        self.prefetch_worker.start(QThread.LowestPriority)
+
+    def sync_duplicates(self):
+        for entry in self.file_queue.entries:
+            self.queue_model.update_entry(entry["id"], duplicate_of=entry.get("duplicate_of"))
+
+    def on_queue_copy_failed(self, entry_id, error):
+        # the entry keeps pointing at its source, so it can still be processed
+        logger.warning(f"background copy failed: {error}")
+        self.queue_model.update_entry(entry_id, progress=None)
 
 
     # LOAD existing queue
     def load_existing_files(self):
-        for fp in queue_dir().glob("*.dwg"):
-            self.add_file_to_queue(str(fp))
+        entries = self.file_queue.load()
+        self.queue_model.add_entries(dict(e) for e in entries)
+        self.start_queue_copies([e for e in entries if e["mode"] == "copying"])
+        self.start_fingerprinting(entries)
+        self.schedule_prefetch()
 
 
     # REMOVE ALL
     def remove_all_files(self):
-        for row in reversed(range(self.table.rowCount())):
-            path = Path(self.table.item(row, 1).data(Qt.UserRole))
-            try:
-                path.unlink()
-            except OSError as err:
-                logger.warning(f"delete failed: {err}")
-            self.table.removeRow(row)
-
-
-    def update_remove_all_visibility(self):
-        for row in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    self.remove_all_btn.setVisible(True)
-                    return
-        self.remove_all_btn.setVisible(False)
+        for worker in self.queue_workers:
+            worker.requestInterruption()
+        self.cancel_prefetch()
+        default_prefetch_cache().clear()
+        self.file_queue.clear()       # deletes only the files the queue owns
+        self.queue_model.clear()
+
+
+    def update_remove_all_visibility(self, checked_count=None):
+        if checked_count is None:
+            checked_count = len(self.queue_model.checked)
+        self.remove_all_btn.setVisible(checked_count > 0)
 
     def open_file_dialog(self):
         filepaths, _ = QFileDialog.getOpenFileNames(
@@ -285,10 +343,10 @@ class HomePage(QWidget):
             self.add_files_to_queue(filepaths)
 
 
-    def handle_table_click(self, row, column):
-        if column == 2:
-            self.table.setCurrentCell(row, column)
-            self.show_file_menu(row)
+    def handle_table_click(self, index):
+        if index.column() == 2:
+            self.table.setCurrentIndex(index)
+            self.show_file_menu(index.row())
 
     def show_file_menu(self, row):
         menu = QMenu()
@@ -322,55 +380,80 @@ class HomePage(QWidget):
             }
         """)
 
-        cell_widget = self.table.cellWidget(row, 2)
-        if cell_widget:
-            menu.exec_(cell_widget.mapToGlobal(cell_widget.rect().bottomLeft()))
+        cell = self.table.visualRect(self.queue_model.index(row, 2))
+        menu.exec_(self.table.viewport().mapToGlobal(cell.bottomLeft()))
 
     def get_filepath_from_row(self, row):
-        item = self.table.item(row, 1)
-        return item.data(Qt.UserRole) if item else None
+        return self.queue_model.path(row)
 
     # ───────────────────────────── delete_file_and_row ─────────────────────────
     def delete_file_and_row(self, row: int):
-        path = self.table.item(row, 1).data(Qt.UserRole)
-        try:
-            os.remove(path)
-        except OSError as err:
-            logger.warning(f"delete failed: {err}")
-        self.table.removeRow(row)
+        entry = self.queue_model.remove_row(row)
+        self.file_queue.remove(entry["id"])      # the user's own file is never deleted
+        self.sync_duplicates()                   # a duplicate may now be the processed copy
+        self.schedule_prefetch()
 
 
     def handle_action(self, action_type, file_path):
         if action_type == "translate":
             self.selected_files = [file_path]
             self.start_translation()
+        elif action_type == "convert":
+            self.convert_files([file_path])
 
 
     def translate_all(self):
-        for row in range(self.table.rowCount()):
-            path = self.get_filepath_from_row(row)
+        for path in self.queue_model.paths():
             if path:
                 self.handle_action("translate", path)
 
     def check_all(self):
-        for row in range(self.table.rowCount()):
-            path = self.get_filepath_from_row(row)
+        for path in self.queue_model.paths():
             if path:
                 self.handle_action("check_linguistic_integrity", path)
 
     def convert_all(self):
-        for row in range(self.table.rowCount()):
-            path = self.get_filepath_from_row(row)
-            if path:
-                self.handle_action("convert", path)
+        self.convert_files([path for path in self.queue_model.paths() if path])
+
+    def convert_files(self, paths):
+        """One dialog for the whole set; ConversionWorker batches and parallelises the ODA runs."""
+        if not paths:
+            QMessageBox.warning(self, "Nessun file", "Nessun file da convertire.")
+            return
+
+        dialog = ConvertDetailsDialog(self, file_count=len(paths))
+        if dialog.exec() != QDialog.Accepted:
+            return
+        details = dialog.get_details()
+
+        self.log_dialog = TranslationLogDialog(self)
+        self.log_dialog.setWindowTitle("Log Conversione")
+        self.log_dialog.show()
+
+        def log_message(msg):
+            self.log_dialog.append_log(msg)
+            logger.info(msg)
+
+        worker = ConversionWorker(paths, details["output_folder"], details["format"], details["version"])
+        worker.log_signal.connect(log_message)
+        worker.progress.connect(lambda done, total: self.log_dialog.setWindowTitle(f"Log Conversione ({done}/{total})"))
+        worker.file_done.connect(self.on_conversion_finished)
+        worker.file_done.connect(lambda src, out: log_message(f"✅ {Path(src).name} → {out}"))
+        worker.failed.connect(lambda p, e: log_message(f"❌ Failed: {p} - {e}"))
+        worker.finished.connect(lambda: self.conversion_workers.remove(worker))
+        self.conversion_workers.append(worker)
+        worker.start()
+
+    def on_conversion_finished(self, source_path, output_path):
+        try:
+            mtime = os.path.getmtime(output_path)
+        except OSError:
+            return
+        self.converted_model.add_or_update(os.path.abspath(output_path), mtime)
+
     # ───────────────────────────── get_selected_files ──────────────────────────
     def get_selected_files(self) -> list[str]:
-        selected: list[str] = []
-        for row in range(self.table.rowCount()):
-            box = self.table.cellWidget(row, 0).findChild(QCheckBox)
-            if box.isChecked():
-                selected.append(self.table.item(row, 1).data(Qt.UserRole))   # ➎
-        return selected
+        return self.queue_model.checked_paths()   # ➎
 
             
     # ─────────────────────────────────────────────────────────────
@@ -381,60 +464,54 @@ class HomePage(QWidget):
         Rebuilds the “Recentemente Tradotto” table from the Desktop folder.
         """
 
-        self.translated_table.setRowCount(0)
-        root = translated_dir()
-        if not root.exists():
-            return
+        self.translated_index.files.clear()
+        added, _ = self.translated_index.refresh()
+        self.translated_model.set_files(added.items())   # newest first
 
-        # newest first
-        for dwg in sorted(root.glob("*.dwg"),
-                        key=lambda p: p.stat().st_mtime,
-                        reverse=True):
-            row = self.translated_table.rowCount()
-            self.translated_table.insertRow(row)
-
-            # col 0 – nome file
-            item = QTableWidgetItem(dwg.name)
-            item.setData(Qt.UserRole, str(dwg))
-            self.translated_table.setItem(row, 0, item)
-
-            # col 1 – timestamp
-            ts = datetime.fromtimestamp(dwg.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
-            self.translated_table.setItem(row, 1, QTableWidgetItem(ts))
-
-            # col 2 – menu icona
-            icon_label = QLabel()
-            icon_label.setPixmap(QIcon(resource_path("assets/icons/IconoirMenu.svg")).pixmap(20, 20))
-            icon_label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            self.translated_table.setCellWidget(row, 2, icon_label)
-
-            # contextual menu
-            icon_label.mousePressEvent = (
-                lambda ev, r=row, p=str(dwg): self.show_translated_file_menu(ev, r, p)
-            )
+    def refresh_translated_files(self) -> None:
+        """Apply external changes to the translated folder (watcher callback)."""
+        added, removed = self.translated_index.refresh()
+        for path in removed:
+            self.translated_model.remove_path(path)
+        for path, mtime in added.items():
+            self.translated_model.add_or_update(path, mtime)
+
+    def handle_translated_click(self, index):
+        if index.column() == 2:
+            cell = self.translated_table.visualRect(index)
+            pos = self.translated_table.viewport().mapToGlobal(cell.bottomLeft())
+            self.show_translated_file_menu(pos, self.translated_model.path(index.row()))
 
 
 
     def on_translation_finished(self, file_path: str) -> None:
         """
         • Assumes DWG is already saved in AMS-Applicazione-Tradotto
-        • Refreshes the “Recentemente Tradotto” table
+        • Adds just that file to the “Recentemente Tradotto” table
         """
 
         logger.info(f"✅ Traduzione completata: {file_path}")
         self.log_dialog.append_log(f"✅ Traduzione completata: {file_path}")
 
-        self.load_recently_translated_files()  # ← that's all you need now
+        mtime = self.translated_index.update(file_path)
+        if mtime is not None:
+            self.translated_model.add_or_update(os.path.abspath(file_path), mtime)
+
 
 
+    def fan_out_translation(self, source_name, duplicates, result_path):
+        """Same drawing queued under several names: reuse one translation for all of them."""
+        names = [Path(d["path"]).name for d in duplicates]
+        for created in fan_out_result(result_path, source_name, names):
+            self.on_translation_finished(created)
 
-    def show_translated_file_menu(self, event, row, file_path):
+    def show_translated_file_menu(self, pos, file_path):
         menu = QMenu()
         menu.addAction("Apri", lambda: os.startfile(file_path))
         menu.addAction("Controlla Integrità Linguistica", lambda: self.check_linguistic_integrity(file_path))
         menu.addAction("Mostra nella Cartella", lambda: os.startfile(os.path.dirname(file_path)))
         menu.addSeparator()
-        menu.addAction("Elimina", lambda: self.delete_translated_file(row, file_path))
+        menu.addAction("Elimina", lambda: self.delete_translated_file(file_path))
 
         menu.setStyleSheet("""
             QMenu {
@@ -460,15 +537,88 @@ class HomePage(QWidget):
             }
         """)
 
-        menu.exec_(event.globalPosition().toPoint())
+        menu.exec_(pos)
 
-    def delete_translated_file(self, row, file_path):
+    def delete_translated_file(self, file_path):
         try:
             os.remove(file_path)
-            self.translated_table.removeRow(row)
+            row = self.translated_model.row_of(file_path)
+            if row >= 0:
+                self.translated_model.remove_row(row)
         except Exception as e:
             QMessageBox.critical(self, "Errore", f"Impossibile eliminare il file:\n{e}")
 
+    def admit_translation(self, worker, path, log_message):
+        """Start *worker* now if its memory estimate fits the budget, else when it does."""
+        estimate = estimate_job_bytes(path)
+        worker.finished.connect(self.on_translation_ended)
+        worker.failed.connect(self.on_translation_ended)
+        # a hot folder job ending may admit it from its thread: start it on ours
+        if not self.admission.submit(worker, estimate, partial(self.start_admitted.emit, worker)):
+            log_message(f"⏳ {Path(path).name} waits for memory (~{estimate // 2**20} MB)")
+            self.admission_timer.start()
+
+    def on_translation_ended(self, *_):
+        self.admission.release(self.sender())
+
+    def pump_admission(self):
+        self.admission.pump()
+        if not self.admission.waiting():
+            self.admission_timer.stop()
+
+    def offer_resume(self):
+        """Translations the app was running when it crashed or closed: resume or drop them."""
+        jobs = []
+        for job in interrupted_jobs():
+            if job.header.get("origin") != "app":
+                continue                    # the hot folder resumes its own
+            if job.is_current():
+                jobs.append(job)
+            else:
+                job.abandon()
+        if not jobs:
+            return
+
+        names = "\n".join(f"• {Path(j.input_path).name} ({j.source_lang} → {j.target_lang})" for j in jobs[:10])
+        more = f"\n… e altre {len(jobs) - 10}" if len(jobs) > 10 else ""
+        answer = QMessageBox.question(
+            self, "Traduzioni interrotte",
+            f"{len(jobs)} traduzioni non sono state completate:\n{names}{more}\n\nRiprenderle?",
+        )
+        if answer != QMessageBox.Yes:
+            for job in jobs:
+                job.abandon()
+            return
+
+        self.log_dialog = TranslationLogDialog(self)
+        self.log_dialog.show()
+
+        def log_message(msg):
+            self.log_dialog.append_log(msg)
+            logger.info(msg)
+
+        self.active_workers = []
+        for job in jobs:
+            glossary_path = job.header.get("glossary_path") or None
+            glossary_map = {}
+            if glossary_path and os.path.exists(glossary_path):
+                try:
+                    glossary_map = parse_glossary_to_map(glossary_path, job.source_lang, job.target_lang)
+                except Exception as e:
+                    logger.error(f"Failed to load glossary: {e}")
+
+            # the worker reopens the journal of the same file and language pair
+            worker = TranslationWorker(
+                job.input_path, job.source_lang, job.target_lang, glossary_map,
+                job.header.get("output_folder"), glossary_path=glossary_path,
+            )
+            worker.log_signal.connect(log_message)
+            worker.finished.connect(self.on_translation_finished)
+            worker.failed.connect(lambda p, e: log_message(f"❌ Failed: {p} - {e}"))
+            self.active_workers.append(worker)
+            log_message(f"♻️ Resuming translation for: {Path(job.input_path).name}")
+            self.admit_translation(worker, job.input_path, log_message)
+
     def start_translation(self):
         self.selected_files = self.get_selected_files()
         if not self.selected_files:
@@ -504,10 +654,13 @@ class HomePage(QWidget):
             self.log_dialog.append_log(msg)
             logger.info(msg)
 
-        # Start workers
+        # Prefetched drawings are picked up by the workers; stop preparing more meanwhile
+        self.cancel_prefetch()
+
+        # Start workers – one per distinct drawing, duplicates get the result fanned out
         self.active_workers = []
-        for file_path in self.selected_files:
-            abs_path = Path(file_path).resolve()  # ← ensures absolute full path
+        for entry, duplicates in self.file_queue.jobs(self.queue_model.checked_ids()):
+            abs_path = Path(entry["path"]).resolve()  # ← ensures absolute full path
 
             worker = TranslationWorker(
                 abs_path,
@@ -515,12 +668,16 @@ class HomePage(QWidget):
                 details["target_lang"],
                 glossary_map,
                 details["output_folder"],
+                glossary_path=details["glossary_path"],
             )
 
             worker.log_signal.connect(log_message)
             worker.finished.connect(self.on_translation_finished)
+            if duplicates:
+                worker.finished.connect(partial(self.fan_out_translation, abs_path.name, duplicates))
+                log_message(f"📎 {abs_path.name} also stands for: {', '.join(d['name'] for d in duplicates)}")
             worker.failed.connect(lambda p, e: log_message(f"❌ Failed: {p} - {e}"))
 
             self.active_workers.append(worker)
-            worker.start()
-            log_message(f"🚀 Started translation for: {abs_path.name}\n📁 Full path: {abs_path}")
\ No newline at end of file
+            log_message(f"🚀 Started translation for: {abs_path.name}\n📁 Full path: {abs_path}")
+            self.admit_translation(worker, abs_path, log_message)
\ No newline at end of file
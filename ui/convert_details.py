@@ -0,0 +1,116 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QComboBox, QFileDialog, QLineEdit
+)
+from pathlib import Path
+
+# ODAFileConverter output versions, newest first
+OUTPUT_VERSIONS = ["ACAD2018", "ACAD2013", "ACAD2010", "ACAD2007", "ACAD2004", "ACAD2000", "ACAD14"]
+
+
+class ConvertDetailsDialog(QDialog):
+    def __init__(self, parent=None, file_count=1):
+        super().__init__(parent)
+        self.setWindowTitle("Dettagli Conversione")
+        self.setMinimumWidth(400)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"File da convertire: {file_count}"))
+
+        # Output format
+        format_layout = QHBoxLayout()
+        format_layout.addWidget(QLabel("Formato di Destinazione:"))
+        self.format_combo = QComboBox()
+        self.format_combo.addItems(["DXF", "DXB", "DWG"])   # DXB = DXF binario
+        format_layout.addWidget(self.format_combo)
+        layout.addLayout(format_layout)
+
+        # Output version
+        version_layout = QHBoxLayout()
+        version_layout.addWidget(QLabel("Versione:"))
+        self.version_combo = QComboBox()
+        self.version_combo.addItems(OUTPUT_VERSIONS)
+        version_layout.addWidget(self.version_combo)
+        layout.addLayout(version_layout)
+
+        # Output Directory
+        output_layout = QHBoxLayout()
+        output_layout.addWidget(QLabel("Cartella di Output:"))
+        self.output_input = QLineEdit()
+        output_btn = QPushButton("Sfoglia")
+        output_btn.clicked.connect(self.select_output_folder)
+        output_layout.addWidget(self.output_input)
+        output_layout.addWidget(output_btn)
+        layout.addLayout(output_layout)
+
+        self.output_input.setText(str(Path.home() / "Desktop"))
+
+        # OK / Cancel
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        ok_btn = QPushButton("Avvia")
+        cancel_btn = QPushButton("Cancella")
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(ok_btn)
+        btn_layout.addWidget(cancel_btn)
+        layout.addLayout(btn_layout)
+
+        self.setStyleSheet("""
+            QLabel {
+                color: white;
+                font-size: 14px;
+            }
+
+            QDialog {
+                background-color: #293E6b;
+                border-radius: 6px;
+            }
+
+            QLineEdit {
+                background-color: white;
+                color: #293E6b;
+                padding: 6px;
+                border: 1px solid white;
+                border-radius: 4px;
+            }
+
+            QPushButton {
+                background-color: white;
+                color: #293E6b;
+                font-weight: bold;
+                padding: 6px 12px;
+                border-radius: 4px;
+            }
+
+            QPushButton:hover {
+                background-color: #f0f0f0;
+            }
+
+            QComboBox {
+                background-color: white;
+                color: #293E6b;
+                padding: 6px;
+                border: 1px solid white;
+                border-radius: 4px;
+            }
+
+            QComboBox QAbstractItemView {
+                background-color: white;
+                color: #293E6b;
+                selection-background-color: #f0f0f0;
+            }
+        """)
+
+
+    def select_output_folder(self):
+        folder_path = QFileDialog.getExistingDirectory(self, "Seleziona Cartella di Output")
+        if folder_path:
+            self.output_input.setText(folder_path)
+
+    def get_details(self):
+        return {
+            "format": self.format_combo.currentText(),
+            "version": self.version_combo.currentText(),
+            "output_folder": self.output_input.text()
+        }
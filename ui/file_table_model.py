@@ -0,0 +1,277 @@
+# ui/file_table_model.py
+from datetime import datetime
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QRect, Signal
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionButton, QApplication
+
+from ui.icons import cached_pixmap
+
+MENU_ICON = "IconoirMenu.svg"
+
+
+class QueueTableModel(QAbstractTableModel):
+    """
+    Rows of the "Coda file" table: ✔ | Nome file | Azioni.
+
+    Each row is a FileQueue entry (``id``, ``name``, ``path``, …); the ✔
+    column is model state (``self.checked``, keyed by entry id) instead of
+    one QCheckBox widget per row, and the menu icon is a shared cached pixmap.
+    An entry with a ``progress`` value shows it next to its name, and a
+    ``duplicate_of`` entry names the drawing whose job it shares.
+    """
+
+    HEADERS = ["", "Nome file", "Azioni"]
+    selection_changed = Signal(int)   # → number of checked rows
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries: list[dict] = []
+        self.by_id: dict[str, dict] = {}
+        self.checked: set[str] = set()
+
+    # ──────────────────────────────────────────────────────────
+    # QAbstractTableModel
+    # ──────────────────────────────────────────────────────────
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignLeft | Qt.AlignVCenter if section == 1 else Qt.AlignCenter
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry, col = self.entries[index.row()], index.column()
+        if col == 0 and role == Qt.CheckStateRole:
+            return Qt.Checked if entry["id"] in self.checked else Qt.Unchecked
+        if col == 1:
+            if role == Qt.DisplayRole:
+                text = entry["name"]
+                primary = self.by_id.get(entry.get("duplicate_of"))
+                if primary:
+                    text += f"  (= {primary['name']})"
+                if entry.get("progress") is not None:
+                    text += f"  (copia {entry['progress']}%)"
+                return text
+            if role == Qt.ToolTipRole:
+                return entry.get("source", entry["path"])
+            if role == Qt.UserRole:
+                return entry["path"]
+        if col == 2 and role == Qt.DecorationRole:
+            return cached_pixmap(MENU_ICON)
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if index.isValid() and index.column() == 0 and role == Qt.CheckStateRole:
+            entry_id = self.entries[index.row()]["id"]
+            if Qt.CheckState(value) == Qt.Checked:
+                self.checked.add(entry_id)
+            else:
+                self.checked.discard(entry_id)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.selection_changed.emit(len(self.checked))
+            return True
+        return False
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # ──────────────────────────────────────────────────────────
+    # queue operations
+    # ──────────────────────────────────────────────────────────
+    def add_entries(self, entries):
+        entries = list(entries)
+        if not entries:
+            return
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self.entries.extend(entries)
+        self.by_id.update((e["id"], e) for e in entries)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        entry = self.entries.pop(row)
+        del self.by_id[entry["id"]]
+        self.endRemoveRows()
+        if entry["id"] in self.checked:
+            self.checked.discard(entry["id"])
+            self.selection_changed.emit(len(self.checked))
+        return entry
+
+    def row_of(self, entry_id):
+        entry = self.by_id.get(entry_id)
+        return self.entries.index(entry) if entry is not None else -1
+
+    def update_entry(self, entry_id, **changes):
+        row = self.row_of(entry_id)
+        if row < 0:
+            return
+        self.entries[row].update(changes)
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 1), [Qt.DisplayRole, Qt.ToolTipRole])
+
+    def clear(self):
+        self.beginResetModel()
+        self.entries.clear()
+        self.by_id.clear()
+        self.checked.clear()
+        self.endResetModel()
+        self.selection_changed.emit(0)
+
+    def entry(self, row):
+        return self.entries[row] if 0 <= row < len(self.entries) else None
+
+    def path(self, row):
+        return self.entries[row]["path"] if 0 <= row < len(self.entries) else None
+
+    def paths(self):
+        return [entry["path"] for entry in self.entries]
+
+    def checked_paths(self):
+        return [entry["path"] for entry in self.entries if entry["id"] in self.checked]
+
+    def checked_ids(self):
+        return [entry["id"] for entry in self.entries if entry["id"] in self.checked]
+
+
+class RecentFilesModel(QAbstractTableModel):
+    """
+    Rows of a "Recentemente …" table: Nome file | Timestamp | Azioni,
+    newest first. Each row is a ``(path, mtime)`` pair.
+    """
+
+    HEADERS = ["Nome file", "Timestamp", "Azioni"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.files: list[tuple[str, float]] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.files)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter if section == 2 else Qt.AlignLeft | Qt.AlignVCenter
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path, mtime = self.files[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return Path(path).name
+            if col == 1:
+                return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
+        if role == Qt.UserRole:
+            return path
+        if col == 0 and role == Qt.ToolTipRole:
+            return path
+        if col == 2 and role == Qt.DecorationRole:
+            return cached_pixmap(MENU_ICON)
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable if index.isValid() else Qt.NoItemFlags
+
+    def set_files(self, files):
+        """Replace all rows with *files* (``(path, mtime)`` pairs)."""
+        self.beginResetModel()
+        self.files = sorted(files, key=lambda f: f[1], reverse=True)
+        self.endResetModel()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.files[row]
+        self.endRemoveRows()
+
+    def remove_path(self, path):
+        row = self.row_of(path)
+        if row >= 0:
+            self.remove_row(row)
+
+    def add_or_update(self, path, mtime):
+        """Insert (or move) one file at its newest-first position."""
+        self.remove_path(path)
+        row = 0
+        while row < len(self.files) and self.files[row][1] > mtime:
+            row += 1
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.files.insert(row, (path, mtime))
+        self.endInsertRows()
+
+    def row_of(self, path):
+        for row, (p, _) in enumerate(self.files):
+            if p == path:
+                return row
+        return -1
+
+    def path(self, row):
+        return self.files[row][0] if 0 <= row < len(self.files) else None
+
+
+class CenteredCellDelegate(QStyledItemDelegate):
+    """
+    Paints check boxes and decoration pixmaps centred in their cell, and
+    toggles the check state on click – no per-row widgets needed.
+    """
+
+    def paint(self, painter, option, index):
+        check = index.data(Qt.CheckStateRole)
+        pixmap = index.data(Qt.DecorationRole)
+        if check is None and pixmap is None:
+            return super().paint(painter, option, index)
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        if check is not None:
+            box = QStyleOptionButton()
+            box.rect = self._check_rect(option)
+            box.state = QStyle.State_Enabled | (
+                QStyle.State_On if Qt.CheckState(check) == Qt.Checked else QStyle.State_Off
+            )
+            style.drawPrimitive(QStyle.PE_IndicatorItemViewItemCheck, box, painter, option.widget)
+        elif pixmap is not None:
+            size = pixmap.deviceIndependentSize().toSize()
+            rect = QRect(0, 0, size.width(), size.height())
+            rect.moveCenter(option.rect.center())
+            painter.drawPixmap(rect, pixmap)
+
+    @staticmethod
+    def _check_rect(option):
+        style = option.widget.style() if option.widget else QApplication.style()
+        size = style.pixelMetric(QStyle.PM_IndicatorWidth, option, option.widget)
+        rect = QRect(0, 0, size, size)
+        rect.moveCenter(option.rect.center())
+        return rect
+
+    def editorEvent(self, event, model, option, index):
+        if not (index.flags() & Qt.ItemIsUserCheckable):
+            return False
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            current = Qt.CheckState(index.data(Qt.CheckStateRole))
+            new = Qt.Unchecked if current == Qt.Checked else Qt.Checked
+            return model.setData(index, new, Qt.CheckStateRole)
+        return event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick)
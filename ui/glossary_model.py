@@ -0,0 +1,237 @@
+# ui/glossary_model.py
+from PySide6.QtCore import Qt, QAbstractTableModel, QAbstractProxyModel, QModelIndex, Signal
+
+from functions.glossary_table import GlossaryTable
+from functions.glossary_search import GlossarySearchIndex
+
+
+class GlossaryTableModel(QAbstractTableModel):
+    """
+    Qt model over a GlossaryTable.
+
+    Column 0 is the "✔" selection column; the row selection lives in
+    ``self.checked`` (a set of row indices) instead of one QCheckBox per row.
+    Columns 1.. are the glossary languages, read straight from the store.
+    ``search_index`` is kept in step with every edit.
+    """
+
+    selection_changed = Signal(int)   # → number of checked rows
+
+    def __init__(self, table: GlossaryTable | None = None, parent=None):
+        super().__init__(parent)
+        self.table = table or GlossaryTable()
+        self.checked: set[int] = set()
+        self.search_index = GlossarySearchIndex()
+        self.search_index.build(self.table)
+
+    # ──────────────────────────────────────────────────────────
+    # QAbstractTableModel
+    # ──────────────────────────────────────────────────────────
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.table.row_count()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.table.headers) + 1
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return "✔" if section == 0 else self.table.headers[section - 1]
+        return section + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row in self.checked else Qt.Unchecked
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self.table.cell(row, col - 1)
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        if col == 0 and role == Qt.CheckStateRole:
+            if Qt.CheckState(value) == Qt.Checked:
+                self.checked.add(row)
+            else:
+                self.checked.discard(row)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.selection_changed.emit(len(self.checked))
+            return True
+        if col > 0 and role == Qt.EditRole:
+            self.table.set_cell(row, col - 1, str(value))
+            self.search_index.update_row(self.table.ids[row], self.table.row(row))
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            return True
+        return False
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    # ──────────────────────────────────────────────────────────
+    # bulk operations
+    # ──────────────────────────────────────────────────────────
+    def set_table(self, table: GlossaryTable):
+        self.beginResetModel()
+        self.table = table
+        self.checked.clear()
+        self.search_index.build(table)
+        self.endResetModel()
+        self.selection_changed.emit(0)
+
+    def append_rows(self, rows):
+        """Append *rows* in one insert notification; returns the first new row."""
+        rows = list(rows)
+        first = self.table.row_count()
+        if rows and self.table.headers:      # no columns yet: nothing to hold the values
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            ids = self.table.insert_rows(first, rows)
+            self.search_index.add_rows(ids, (self.table.row(first + i) for i in range(len(ids))))
+            self.endInsertRows()
+        return first
+
+    def remove_checked_rows(self):
+        if not self.checked:
+            return
+        self.beginResetModel()
+        self.search_index.remove_rows([self.table.ids[row] for row in self.checked])
+        self.table.delete_rows(self.checked)
+        self.checked.clear()
+        self.endResetModel()
+        self.selection_changed.emit(0)
+
+    def set_all_checked(self, check: bool, rows=None):
+        """Check *rows* (default: all) – pass the visible rows so filtered-out ones are never hit."""
+        if rows is None:
+            rows = range(self.table.row_count())
+        self.checked = set(rows) if check else set()
+        if self.table.row_count():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.table.row_count() - 1, 0),
+                                  [Qt.CheckStateRole])
+        self.selection_changed.emit(len(self.checked))
+
+    def add_column(self, header):
+        col = self.columnCount()
+        self.beginInsertColumns(QModelIndex(), col, col)
+        self.table.add_column(header)
+        self.endInsertColumns()
+
+
+class GlossaryFilterProxy(QAbstractProxyModel):
+    """
+    Shows the subset of GlossaryTableModel rows matching the search box.
+
+    The matching rows come from the model's search index as a sorted list of
+    source rows, so filtering never walks the whole table the way
+    QSortFilterProxyModel.filterAcceptsRow would.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = None           # None → no filter, identity mapping
+        self._proxy_of = {}
+        self._query = ""
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelReset.connect(self.refilter)
+        model.rowsAboutToBeInserted.connect(self._on_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.columnsInserted.connect(self.refilter)
+        model.dataChanged.connect(self._on_data_changed)
+        self.refilter()
+
+    # ──────────────────────────────────────────────────────────
+    # filtering
+    # ──────────────────────────────────────────────────────────
+    def set_query(self, query):
+        if query != self._query:
+            self._query = query
+            self.refilter(force=False)
+
+    def refilter(self, *_, force=True):
+        """Recompute the visible rows; without *force* the view is only reset if they changed."""
+        model = self.sourceModel()
+        ids = model.search_index.search(self._query) if model else None
+        rows = None if ids is None else sorted(model.table.position_of(row_id) for row_id in ids)
+        if not force and rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self._proxy_of = {} if rows is None else {src: i for i, src in enumerate(rows)}
+        self.endResetModel()
+
+    def source_rows(self):
+        """Source rows currently shown."""
+        model = self.sourceModel()
+        if self._rows is not None:
+            return list(self._rows)
+        return range(model.rowCount()) if model else []
+
+    # while filtering, new rows stay hidden until the query changes
+    def _on_rows_about_to_be_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _on_rows_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.endInsertRows()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        top, bottom = self.mapFromSource(top_left), self.mapFromSource(bottom_right)
+        if top.isValid() and bottom.isValid():
+            self.dataChanged.emit(top, bottom, roles)
+        elif self._rows is not None and self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1), roles)
+
+    # ──────────────────────────────────────────────────────────
+    # QAbstractProxyModel
+    # ──────────────────────────────────────────────────────────
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().rowCount() if self._rows is None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < self.rowCount() and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        row = proxy_index.row() if self._rows is None else self._rows[proxy_index.row()]
+        return self.sourceModel().index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row() if self._rows is None else self._proxy_of.get(source_index.row())
+        if row is None:
+            return QModelIndex()
+        return self.index(row, source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if self.sourceModel() is None:
+            return None
+        if orientation == Qt.Vertical and self._rows is not None and role == Qt.DisplayRole:
+            return self._rows[section] + 1 if section < len(self._rows) else None
+        return self.sourceModel().headerData(section, orientation, role)
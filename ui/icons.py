@@ -0,0 +1,18 @@
+# ui/icons.py
+from functools import lru_cache
+
+from PySide6.QtGui import QIcon, QPixmap
+
+from functions.paths import resource_path
+
+
+@lru_cache(maxsize=None)
+def cached_icon(name: str) -> QIcon:
+    """QIcon for ``assets/icons/<name>``, loaded from disk once per process."""
+    return QIcon(resource_path(f"assets/icons/{name}"))
+
+
+@lru_cache(maxsize=None)
+def cached_pixmap(name: str, size: int = 20) -> QPixmap:
+    """Rendered pixmap shared by every row / widget that shows the icon."""
+    return cached_icon(name).pixmap(size, size)
@@ -110,8 +110,8 @@ class TranslateDetailsDialog(QDialog):
             self.output_input.setText(folder_path)
 
     def get_details(self):
-        from functions.paths import get_glossary_dir
-        glossary_dir = get_glossary_dir()
+        from functions.glossary_mirror import working_glossary_dir
+        glossary_dir = working_glossary_dir()
         glossary_path = glossary_dir / "glossario_tecnico.csv"
         
         return {
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PySide6.QtCore import QThread, Signal
+from functions.oda_runner import convert_group, plan_groups, output_stems, conversion_pool_size
+
+
+class ConversionWorker(QThread):
+    """
+    Plain DWG/DXF format conversion of many files. Files are grouped so one
+    ODAFileConverter run handles several of them, and the groups run on a
+    pool of concurrent converter processes sized to cores and free memory.
+    """
+    # --------------------------------------------------------------
+    # Signals
+    # --------------------------------------------------------------
+    log_signal = Signal(str)          # → live log lines
+    progress   = Signal(int, int)     # → (files done, total)
+    file_done  = Signal(str, str)     # → (input path, output path)
+    failed     = Signal(str, str)     # → (input path, error msg)
+
+    # --------------------------------------------------------------
+    # Init
+    # --------------------------------------------------------------
+    def __init__(self, files, output_folder, fmt="DXF", version="ACAD2018", parent=None):
+        super().__init__(parent)
+        self.files         = [str(f) for f in files]
+        self.output_folder = str(output_folder)
+        self.fmt           = fmt
+        self.version       = version
+
+    # --------------------------------------------------------------
+    # Worker entry-point
+    # --------------------------------------------------------------
+    def run(self) -> None:
+        groups = plan_groups(self.files)
+        stems = output_stems(self.files)       # groups share the output folder
+        workers = min(conversion_pool_size(), len(groups)) or 1
+        total, done = len(self.files), 0
+        self.log_signal.emit(f"🔹 Converting {total} file(s) to {self.fmt} {self.version} "
+                             f"in {len(groups)} group(s), {workers} at a time")
+        self.progress.emit(0, total)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(convert_group, group, self.output_folder, self.fmt, self.version, self.log_signal.emit,
+                            {path: stems[path] for path in group})
+                for group in groups
+            ]
+            for future in as_completed(futures):
+                if self.isInterruptionRequested():
+                    for f in futures:
+                        f.cancel()      # queued groups only; running ones finish
+                    break
+                try:
+                    results = future.result()
+                except Exception as err:       # the whole group blew up
+                    self.log_signal.emit(f"❌ Conversion group failed: {err}")
+                    continue
+                for src, result in results.items():
+                    done += 1
+                    if isinstance(result, Exception):
+                        self.failed.emit(src, str(result))
+                    else:
+                        self.file_done.emit(src, str(result))
+                    self.progress.emit(done, total)
@@ -0,0 +1,108 @@
+import csv
+import os
+from PySide6.QtCore import QThread, Signal
+from functions.glossary_db import glossary_index
+
+
+class GlossaryLoadWorker(QThread):
+    """
+    Read a semicolon glossary CSV off the UI thread and hand it over in
+    chunks, so the view fills progressively and the app never freezes on a
+    slow share. Stop it with ``requestInterruption()``.
+    """
+    # --------------------------------------------------------------
+    # Signals
+    # --------------------------------------------------------------
+    headers_ready = Signal(object, list)   # → (path, headers)
+    chunk_ready   = Signal(list)           # → list of rows
+    progress      = Signal(int)            # → 0-100
+    missing       = Signal()               # → no glossary file
+    failed        = Signal(str)            # → error msg
+
+    CHUNK_ROWS = 2000
+
+    # --------------------------------------------------------------
+    # Init
+    # --------------------------------------------------------------
+    def __init__(self, path_fn, parent=None, indexed=False):
+        super().__init__(parent)
+        self.path_fn = path_fn          # resolved here – may touch the share
+        self.indexed = indexed          # stream from the glossary index instead of parsing the CSV
+
+    # --------------------------------------------------------------
+    # Worker entry-point
+    # --------------------------------------------------------------
+    def run(self) -> None:
+        try:
+            path = self.path_fn()
+            if path is None or not os.path.exists(path):
+                self.missing.emit()
+                return
+
+            if self.indexed:
+                self.run_indexed(path)
+                return
+
+            total = max(os.path.getsize(path), 1)
+            read = 0
+
+            with open(path, newline="", encoding="utf-8") as fh:
+                def lines():
+                    nonlocal read
+                    for line in fh:
+                        read += len(line)
+                        yield line
+
+                reader = csv.reader(lines(), delimiter=";")
+                headers = [h.strip().lstrip('\ufeff') for h in next(reader, [])]
+                if not headers:
+                    raise ValueError("Missing headers in glossary CSV")
+                self.headers_ready.emit(path, headers)
+
+                chunk = []
+                for row in reader:
+                    if not row:
+                        continue
+                    chunk.append(row)
+                    if len(chunk) >= self.CHUNK_ROWS:
+                        if self.isInterruptionRequested():
+                            return
+                        self.chunk_ready.emit(chunk)
+                        self.progress.emit(min(99, read * 100 // total))
+                        chunk = []
+                if chunk and not self.isInterruptionRequested():
+                    self.chunk_ready.emit(chunk)
+
+            self.progress.emit(100)
+
+        except Exception as err:
+            self.failed.emit(str(err))
+
+    def run_indexed(self, path) -> None:
+        db = glossary_index(path)       # re-imports only if the CSV changed
+        self.headers_ready.emit(path, db.languages())
+        total = max(db.row_count(), 1)
+        done = 0
+        for chunk in db.iter_rows(self.CHUNK_ROWS):
+            if self.isInterruptionRequested():
+                return
+            self.chunk_ready.emit(chunk)
+            done += len(chunk)
+            self.progress.emit(min(99, done * 100 // total))
+        self.progress.emit(100)
+
+
+class GlossaryTaskWorker(QThread):
+    """Run one blocking glossary file operation (save, export, listing…) in the background."""
+    done   = Signal(object)     # → return value of the task
+    failed = Signal(str)        # → error msg
+
+    def __init__(self, task, parent=None):
+        super().__init__(parent)
+        self.task = task
+
+    def run(self) -> None:
+        try:
+            self.done.emit(self.task())
+        except Exception as err:
+            self.failed.emit(str(err))
@@ -0,0 +1,43 @@
+from PySide6.QtCore import QThread, Signal
+from functions.prefetch import prepare_drawing, default_prefetch_cache
+
+
+class PrefetchWorker(QThread):
+    """
+    Convert and extract queued drawings while the app is idle, so a later
+    translation only has to translate and write back. Files already in the
+    cache are skipped; ``requestInterruption()`` stops it between files.
+    """
+    # --------------------------------------------------------------
+    # Signals
+    # --------------------------------------------------------------
+    prepared = Signal(str)            # → dwg path now in the cache
+    failed   = Signal(str, str)       # → (dwg path, error msg)
+
+    # --------------------------------------------------------------
+    # Init
+    # --------------------------------------------------------------
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self.paths = list(paths)
+        self.cache = default_prefetch_cache()
+
+    # --------------------------------------------------------------
+    # Worker entry-point
+    # --------------------------------------------------------------
+    def run(self) -> None:
+        for path in self.paths:
+            if self.isInterruptionRequested():
+                return
+            if path in self.cache:
+                continue
+            try:
+                drawing = prepare_drawing(path, log=lambda msg: None)
+            except Exception as err:
+                self.failed.emit(path, str(err))
+                continue
+            if self.isInterruptionRequested():
+                drawing.discard()
+                return
+            self.cache.put(drawing)
+            self.prepared.emit(path)
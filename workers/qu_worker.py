@@ -0,0 +1,64 @@
+from PySide6.QtCore import QThread, Signal
+
+
+class QueueCopyWorker(QThread):
+    """
+    Copy network-hosted queue entries in the background, one at a time.
+    Entries stay usable (from their source) while they wait.
+    """
+    # --------------------------------------------------------------
+    # Signals
+    # --------------------------------------------------------------
+    progress = Signal(str, int)       # → (entry id, 0-100)
+    copied   = Signal(str, str)       # → (entry id, local path)
+    failed   = Signal(str, str)       # → (entry id, error msg)
+
+    # --------------------------------------------------------------
+    # Init
+    # --------------------------------------------------------------
+    def __init__(self, file_queue, entries, parent=None):
+        super().__init__(parent)
+        self.file_queue = file_queue
+        self.entries    = list(entries)
+
+    # --------------------------------------------------------------
+    # Worker entry-point
+    # --------------------------------------------------------------
+    def run(self) -> None:
+        for entry in self.entries:
+            if self.isInterruptionRequested():
+                return
+            try:
+                def report(done, total, entry_id=entry["id"]):
+                    self.progress.emit(entry_id, done * 100 // total)
+
+                if self.file_queue.copy_entry(entry, report, self.isInterruptionRequested):
+                    self.copied.emit(entry["id"], entry["path"])
+            except Exception as err:
+                self.failed.emit(entry["id"], str(err))
+
+
+class FingerprintWorker(QThread):
+    """
+    Fingerprint queue entries in the background and report which ones are
+    content duplicates of an entry already queued.
+    """
+    # --------------------------------------------------------------
+    # Signals
+    # --------------------------------------------------------------
+    fingerprinted = Signal(str, str)    # → (entry id, id it duplicates or "")
+    failed        = Signal(str, str)    # → (entry id, error msg)
+
+    def __init__(self, file_queue, entries, parent=None):
+        super().__init__(parent)
+        self.file_queue = file_queue
+        self.entries    = list(entries)
+
+    def run(self) -> None:
+        for entry in self.entries:
+            if self.isInterruptionRequested():
+                return
+            try:
+                self.fingerprinted.emit(entry["id"], self.file_queue.fingerprint(entry) or "")
+            except Exception as err:
+                self.failed.emit(entry["id"], str(err))
@@ -1,5 +1,8 @@
 from PySide6.QtCore import QThread, Signal
 from functions.translation_pipeline import process_file
+from functions.deepl_glossary import ensure_deepl_glossary, release_deepl_glossary
+from functions.prefetch import default_prefetch_cache
+from functions.job_journal import JobJournal
 from pathlib import Path
 
 
@@ -15,23 +18,40 @@ class TranslationWorker(QThread):
     # Init
     # --------------------------------------------------------------
     def __init__(self, file_path, source_lang, target_lang,
-                 glossary_map, output_folder):
+                 glossary_map, output_folder, glossary_path=None):
         super().__init__()
         self.input_path   = Path(file_path).resolve()   # original file
         self.source_lang  = source_lang
         self.target_lang  = target_lang
         self.glossary_map = glossary_map
         self.output_folder = output_folder             # may be None / ""
+        self.glossary_path = glossary_path             # CSV synced to DeepL
                                                      
     # --------------------------------------------------------------
     # Worker entry-point
     # --------------------------------------------------------------
     def run(self) -> None:
+        journal = glossary_id = None
         try:
             # pass log lines to GUI
             def logger(msg: str) -> None:
                 self.log_signal.emit(msg)
 
+            # upload the glossary pair once per content hash
+            if self.glossary_path and self.glossary_map:
+                glossary_id = ensure_deepl_glossary(
+                    self.glossary_path, self.source_lang, self.target_lang, log=logger
+                )
+
+            # converted + extracted while the queue was idle?
+            prepared = default_prefetch_cache().take(self.input_path)
+
+            # crash-safe record of the job; picks up an interrupted run of the same file
+            journal = JobJournal.begin(
+                self.input_path, self.source_lang, self.target_lang, origin="app",
+                glossary_path=str(self.glossary_path or ""), output_folder=self.output_folder or "",
+            )
+
             # heavy lifting – must **return** output path
             translated_path = process_file(
                 dwg_path      = self.input_path,
@@ -39,7 +59,10 @@ class TranslationWorker(QThread):
                 target_lang   = self.target_lang,
                 glossary_map  = self.glossary_map,
                 output_folder = self.output_folder,
-                log           = logger
+                log           = logger,
+                glossary_id   = glossary_id,
+                prepared      = prepared,
+                journal       = journal
             )
 
             # success → emit final path for on_translation_finished()
@@ -48,5 +71,9 @@ class TranslationWorker(QThread):
         except Exception as err:
             # failure → emit original file & error
             self.failed.emit(str(self.input_path), str(err))
+        finally:
+            release_deepl_glossary(glossary_id)
+            if journal:
+                journal.close()
 
 